@@ -4,10 +4,220 @@ Agent 1: Extraction Agent
 Extracts structured tickets (Epics/Tasks, Bugs, or Stories) from unstructured text
 """
 
-import json
-from typing import Optional
-from models import TicketStructure, IssueType
-from agents.prompts import EXTRACTION_PROMPT, BUG_EXTRACTION_PROMPT, STORY_EXTRACTION_PROMPT
+import asyncio
+import functools
+import inspect
+import logging
+import random
+import re
+import time
+from typing import List, Optional, Sequence
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+from config import config
+from models import (
+    TicketStructure, IssueType, Epic, Task, Bug, UserStory,
+    Environment, TechnicalDetails,
+    EpicsResponse, BugsResponse, StoriesResponse
+)
+from agents.prompts import render_extraction, render_bug, render_story
+from agents.semantic_cache import SemanticCache
+from agents.llm_client import llm_slot
+
+logger = logging.getLogger(__name__)
+
+# Sampling temperature for every extraction request
+EXTRACTION_TEMPERATURE = 0.3
+
+# List validators built once and shared by every parse
+_EPIC_LIST = TypeAdapter(List[Epic])
+_BUG_LIST = TypeAdapter(List[Bug])
+_STORY_LIST = TypeAdapter(List[UserStory])
+
+# Per-issue-type dispatch tables ('task' and 'epic-only' use the defaults)
+_RENDERERS = {'bug': render_bug, 'story': render_story}
+_RESULT_KEYS = {'bug': 'bugs', 'story': 'stories'}
+_LIST_ADAPTERS = {'bug': _BUG_LIST, 'story': _STORY_LIST}
+_RESPONSE_MODELS = {'bug': BugsResponse, 'story': StoriesResponse}
+
+# Keywords OpenAI strict mode rejects, or that only matter to client-side validation
+_SCHEMA_DROP_KEYS = frozenset({'default', 'title', 'minLength', 'maxLength', 'minItems', 'maxItems', 'pattern'})
+# Keywords whose value maps field/definition names to sub-schemas
+_SCHEMA_NAME_MAPS = frozenset({'properties', '$defs'})
+
+
+def _strict_schema(node):
+    """
+    Rewrite a Pydantic JSON schema into the strict subset providers enforce
+
+    Every object gets all of its properties required and additionalProperties
+    disabled; length and count constraints are dropped. Validated output is
+    still checked by Pydantic; trusted output, built with model_construct,
+    is re-checked by _checked().
+    """
+    if isinstance(node, list):
+        return [_strict_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    strict = {}
+    for key, value in node.items():
+        if key in _SCHEMA_DROP_KEYS:
+            continue
+        if key in _SCHEMA_NAME_MAPS:
+            strict[key] = {name: _strict_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = _strict_schema(value)
+
+    if 'properties' in strict:
+        strict['required'] = list(strict['properties'])
+        strict['additionalProperties'] = False
+    return strict
+
+
+# Response schemas built once at import and sent with every structured-output request
+_SCHEMAS = {
+    model: _strict_schema(model.model_json_schema())
+    for model in (EpicsResponse, BugsResponse, StoriesResponse)
+}
+_TOOL_NAME = 'emit_tickets'
+
+
+def _length_limits(model) -> dict:
+    """Map each length- or count-constrained field of model to its (min, max)"""
+    limits = {}
+    for name, field in model.model_fields.items():
+        low = next((m.min_length for m in field.metadata if hasattr(m, 'min_length')), None)
+        high = next((m.max_length for m in field.metadata if hasattr(m, 'max_length')), None)
+        if low is not None or high is not None:
+            limits[name] = (low, high)
+    return limits
+
+
+# Constraints the strict schema cannot carry, re-checked on constructed models
+_LENGTH_LIMITS = {model: _length_limits(model) for model in (Epic, Task, Bug, UserStory)}
+
+
+def _checked(instance):
+    """
+    Enforce the length and count limits model_construct skipped
+
+    Raises:
+        ValueError: If a constrained field is missing or out of range
+    """
+    for name, (low, high) in _LENGTH_LIMITS[type(instance)].items():
+        value = getattr(instance, name, None)
+        if value is None:
+            raise ValueError(f"{type(instance).__name__}.{name} is missing")
+        if (low is not None and len(value) < low) or (high is not None and len(value) > high):
+            bounds = f"at least {low}" if high is None else f"{low or 0} to {high}"
+            raise ValueError(f"{type(instance).__name__}.{name} has length {len(value)}, expected {bounds}")
+    return instance
+
+
+# Unvalidated builders for output whose structure the provider already enforced;
+# only the limits the strict schema dropped are checked
+def _construct_epics(items: list) -> List[Epic]:
+    return [
+        _checked(Epic.model_construct(**{
+            **epic,
+            'tasks': [_checked(Task.model_construct(**task)) for task in epic.get('tasks', [])]
+        }))
+        for epic in items
+    ]
+
+
+def _construct_bugs(items: list) -> List[Bug]:
+    bugs = []
+    for bug in items:
+        fields = dict(bug)
+        fields['environment'] = Environment.model_construct(**(bug.get('environment') or {}))
+        if bug.get('technical_details') is not None:
+            fields['technical_details'] = TechnicalDetails.model_construct(**bug['technical_details'])
+        bugs.append(_checked(Bug.model_construct(**fields)))
+    return bugs
+
+
+def _construct_stories(items: list) -> List[UserStory]:
+    return [_checked(UserStory.model_construct(**story)) for story in items]
+
+
+_CONSTRUCTORS = {'bug': _construct_bugs, 'story': _construct_stories}
+
+# Fallback extraction only looks at a bounded prefix of the first line
+_NON_SPACE = re.compile(r'\S')
+_FIRST_LINE_LIMIT = 1024
+_FALLBACK_ACCEPTANCE_CRITERIA = (
+    "Feature works as described",
+    "Tests pass",
+    "Documentation updated"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _sdk_client_classes():
+    """
+    Import the SDK client classes once, skipping SDKs that are not installed
+
+    Returns:
+        Tuple of (OpenAI classes, Anthropic classes, async classes)
+    """
+    openai_classes, anthropic_classes, async_classes = (), (), ()
+    try:
+        from openai import OpenAI, AsyncOpenAI
+        openai_classes = (OpenAI, AsyncOpenAI)
+        async_classes += (AsyncOpenAI,)
+    except ImportError:
+        pass
+    try:
+        from anthropic import Anthropic, AsyncAnthropic
+        anthropic_classes = (Anthropic, AsyncAnthropic)
+        async_classes += (AsyncAnthropic,)
+    except ImportError:
+        pass
+    return openai_classes, anthropic_classes, async_classes
+
+
+@functools.lru_cache(maxsize=None)
+def _retryable_errors() -> tuple:
+    """
+    Collect the SDK exceptions worth retrying: rate limits, timeouts,
+    dropped connections and 5xx/overloaded responses
+
+    Returns:
+        Tuple of exception classes (empty if neither SDK is installed)
+    """
+    errors = ()
+    try:
+        import openai
+        errors += (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+    except ImportError:
+        pass
+    try:
+        import anthropic
+        errors += (
+            anthropic.RateLimitError,
+            anthropic.APIConnectionError,
+            anthropic.InternalServerError,
+            getattr(anthropic, 'OverloadedError', anthropic.InternalServerError)
+        )
+    except ImportError:
+        pass
+    return errors
+
+
+# Retry policy for transient LLM failures: exponential backoff with jitter
+_MAX_ATTEMPTS = 3
+_BACKOFF_INITIAL = 1.0
+_BACKOFF_MAX = 10.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt (1-based)"""
+    return min(_BACKOFF_MAX, _BACKOFF_INITIAL * 2 ** (attempt - 1)) + random.uniform(0, _BACKOFF_INITIAL)
+
+
+EXTRACTION_SYSTEM_PROMPT = "You are a technical product manager extracting Jira tickets from text. Return valid JSON only."
 
 
 class ExtractionAgent:
@@ -22,14 +232,53 @@ class ExtractionAgent:
     - Add implicit requirements (security, performance, testing)
     """
 
-    def __init__(self, llm_client: Optional[object] = None, issue_type: IssueType = 'task'):
+    def __init__(
+        self,
+        llm_client: Optional[object] = None,
+        issue_type: IssueType = 'task',
+        cache: Optional[SemanticCache] = None,
+        fallback: bool = True
+    ):
         """
         Args:
             llm_client: OpenAI/Anthropic client (optional)
             issue_type: Type of Jira issues to generate (task, bug, story, epic-only)
+            cache: Semantic response cache consulted before calling the LLM (optional)
+            fallback: Fall back to simple extraction when the LLM call or its
+                parse fails; if False, the error is raised instead
         """
         self.llm_client = llm_client
         self.issue_type = issue_type
+        self.cache = cache
+        self.fallback = fallback
+
+        # Resolve everything that depends only on issue type and client once
+        self._render = _RENDERERS.get(issue_type, render_extraction)
+        self._result_key = _RESULT_KEYS.get(issue_type, 'epics')
+        self._response_model = _RESPONSE_MODELS.get(issue_type, EpicsResponse)
+        self._schema = _SCHEMAS[self._response_model]
+
+        self._provider = self._detect_provider()
+        if self._provider == 'openai':  # OpenAI or Ollama
+            self._invoke = self._invoke_openai
+            self._ainvoke = self._ainvoke_openai
+        elif self._provider == 'anthropic':
+            self._invoke = self._invoke_anthropic
+            self._ainvoke = self._ainvoke_anthropic
+        else:
+            self._invoke = self._invoke_unknown
+            self._ainvoke = self._ainvoke_unknown
+        self._is_async = self._is_async_client()
+        # Schema-enforced output (not available through Ollama) also allows lean prompts
+        self._use_schema = config.llm_structured_output and (
+            self._provider == 'anthropic'
+            or (self._provider == 'openai' and config.llm_provider != 'ollama')
+        )
+        # Only OpenAI strict mode constrains decoding to the schema, so only its
+        # output may skip Pydantic validation; tool-use input is still validated
+        self._trusted = self._use_schema and self._provider == 'openai'
+        self._construct = _CONSTRUCTORS.get(issue_type, _construct_epics)
+        self._request_base = self._build_request_base()
 
     def extract(self, text: str, project_key: str) -> TicketStructure:
         """
@@ -47,6 +296,246 @@ class ExtractionAgent:
         else:
             return self._extract_simple(text, project_key)
 
+    async def aextract(self, text: str, project_key: str) -> TicketStructure:
+        """
+        Async variant of extract() for AsyncOpenAI/AsyncAnthropic clients
+
+        Synchronous clients are run in a worker thread so the event loop
+        is never blocked on the LLM round trip.
+
+        Args:
+            text: Input text (meeting notes, bug description, etc.)
+            project_key: Jira project key (e.g., "PROJ")
+
+        Returns:
+            TicketStructure with extracted tickets
+        """
+        if not self.llm_client:
+            return self._extract_simple(text, project_key)
+        if not self._is_async:
+            return await asyncio.to_thread(self._extract_with_llm, text, project_key)
+        return await self._aextract_with_llm(text, project_key)
+
+    async def abatch_extract(
+        self,
+        texts: List[str],
+        project_key: str,
+        concurrency: int = 10
+    ) -> List[TicketStructure]:
+        """
+        Extract from many texts concurrently
+
+        Args:
+            texts: Input texts
+            project_key: Jira project key
+            concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            List of TicketStructure, in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        if self.cache is None or not self.llm_client:
+            async def _bounded(text: str) -> TicketStructure:
+                async with semaphore:
+                    return await self.aextract(text, project_key)
+
+            return await asyncio.gather(*(_bounded(text) for text in texts))
+
+        # Embed and look up every input at once; only misses go to the LLM
+        vectors = await asyncio.to_thread(
+            self.cache.encode_batch, [self._cache_key(text) for text in texts]
+        )
+        cached = self.cache.lookup_batch(vectors)
+
+        async def _bounded_miss(index: int) -> TicketStructure:
+            async with semaphore:
+                if self._is_async:
+                    return await self._aextract_uncached(texts[index], project_key, vectors[index])
+                return await asyncio.to_thread(
+                    self._extract_uncached, texts[index], project_key, vectors[index]
+                )
+
+        results = [
+            self._parse_llm_json(hit, project_key) if hit is not None else None
+            for hit in cached
+        ]
+        misses = [index for index, hit in enumerate(cached) if hit is None]
+        for index, structure in zip(misses, await asyncio.gather(*(_bounded_miss(i) for i in misses))):
+            results[index] = structure
+        return results
+
+    def _detect_provider(self) -> Optional[str]:
+        """Identify the client SDK, falling back to duck typing for wrapped clients"""
+        if self.llm_client is None:
+            return None
+        openai_classes, anthropic_classes, _ = _sdk_client_classes()
+        if isinstance(self.llm_client, openai_classes):
+            return 'openai'
+        if isinstance(self.llm_client, anthropic_classes):
+            return 'anthropic'
+        if hasattr(self.llm_client, 'chat'):
+            return 'openai'
+        if hasattr(self.llm_client, 'messages'):
+            return 'anthropic'
+        return None
+
+    def _is_async_client(self) -> bool:
+        """Check if the LLM client returns awaitables (AsyncOpenAI/AsyncAnthropic)"""
+        if self._provider is None:
+            return False
+        if isinstance(self.llm_client, _sdk_client_classes()[2]):
+            return True
+        if self._provider == 'openai':
+            return inspect.iscoroutinefunction(self.llm_client.chat.completions.create)
+        if self._provider == 'anthropic':
+            return inspect.iscoroutinefunction(self.llm_client.messages.create)
+        return False
+
+    def _cache_key(self, text: str) -> str:
+        """Text that is embedded as the cache key (responses differ per issue type)"""
+        return f"{self.issue_type}\n{text}"
+
+    def _cache_lookup(self, text: str):
+        """
+        Look up a cached LLM response for text
+
+        Returns:
+            Tuple of (embedding, cached payload or None); both None without a cache
+        """
+        if self.cache is None:
+            return None, None
+        vector = self.cache.embed(self._cache_key(text))
+        return vector, self.cache.lookup(vector)
+
+    def _build_request_base(self) -> dict:
+        """Build the provider-specific request arguments shared by every call"""
+        if self._provider == 'openai':
+            if config.llm_provider == 'ollama':
+                # Ollama may not support response_format, so we'll handle JSON parsing more carefully
+                return {"model": config.ollama_model, "temperature": EXTRACTION_TEMPERATURE, "stream": True}
+            if self._use_schema:
+                response_format = {
+                    "type": "json_schema",
+                    "json_schema": {"name": "tickets", "schema": self._schema, "strict": True}
+                }
+            else:
+                response_format = {"type": "json_object"}
+            return {
+                "model": config.llm_model,
+                "temperature": EXTRACTION_TEMPERATURE,
+                "response_format": response_format,
+                "stream": True
+            }
+        if self._provider == 'anthropic':
+            base = {"model": config.llm_model, "max_tokens": 4000, "temperature": EXTRACTION_TEMPERATURE}
+            if self._use_schema:
+                # Forced tool use makes Claude emit arguments matching the schema
+                base["tools"] = [{
+                    "name": _TOOL_NAME,
+                    "description": "Record the extracted Jira tickets",
+                    "input_schema": self._schema
+                }]
+                base["tool_choice"] = {"type": "tool", "name": _TOOL_NAME}
+            return base
+        return {}
+
+    def _read_anthropic(self, response):
+        """
+        Get the payload from an Anthropic response
+
+        Returns:
+            Tool input dict when tool use was requested, otherwise the response text
+        """
+        if self._use_schema:
+            for block in response.content:
+                if block.type == 'tool_use':
+                    return block.input
+            raise ValueError("Anthropic response contained no tool_use block")
+        return response.content[0].text
+
+    def _invoke_openai(self, prompt: str) -> str:
+        """Call an OpenAI/Ollama client and return the streamed response text"""
+        stream = self.llm_client.chat.completions.create(
+            messages=[
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            **self._request_base
+        )
+        # Collect deltas as they arrive instead of waiting for the whole body
+        parts = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return ''.join(parts)
+
+    def _invoke_anthropic(self, prompt: str):
+        """Call an Anthropic client and return the response text or tool input"""
+        response = self.llm_client.messages.create(
+            messages=[{"role": "user", "content": prompt}],
+            **self._request_base
+        )
+        return self._read_anthropic(response)
+
+    def _invoke_unknown(self, prompt: str) -> str:
+        """Fail on clients that are neither OpenAI- nor Anthropic-shaped"""
+        raise ValueError("Unknown LLM client type")
+
+    async def _ainvoke_openai(self, prompt: str) -> str:
+        """Await an AsyncOpenAI client and return the streamed response text"""
+        stream = await self.llm_client.chat.completions.create(
+            messages=[
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            **self._request_base
+        )
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return ''.join(parts)
+
+    async def _ainvoke_anthropic(self, prompt: str):
+        """Await an AsyncAnthropic client and return the response text or tool input"""
+        response = await self.llm_client.messages.create(
+            messages=[{"role": "user", "content": prompt}],
+            **self._request_base
+        )
+        return self._read_anthropic(response)
+
+    async def _ainvoke_unknown(self, prompt: str) -> str:
+        """Fail on clients that are neither OpenAI- nor Anthropic-shaped"""
+        raise ValueError("Unknown LLM client type")
+
+    def _invoke_with_retry(self, prompt: str):
+        """Call the LLM, retrying transient failures with backoff"""
+        retryable = _retryable_errors()
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return self._invoke(prompt)
+            except retryable as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning("LLM call failed (%s), retrying in %.1fs", e, delay)
+                time.sleep(delay)
+
+    async def _ainvoke_with_retry(self, prompt: str):
+        """Await the LLM, retrying transient failures with backoff"""
+        retryable = _retryable_errors()
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                async with llm_slot():
+                    return await self._ainvoke(prompt)
+            except retryable as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning("LLM call failed (%s), retrying in %.1fs", e, delay)
+                await asyncio.sleep(delay)
+
     def _extract_with_llm(self, text: str, project_key: str) -> TicketStructure:
         """
         Extract using LLM (OpenAI, Anthropic, or Ollama)
@@ -58,67 +547,63 @@ class ExtractionAgent:
         Returns:
             TicketStructure with extracted tickets
         """
-        from config import config
+        vector, cached = self._cache_lookup(text)
+        if cached is not None:
+            return self._parse_llm_json(cached, project_key)
+        return self._extract_uncached(text, project_key, vector)
 
-        # Select prompt based on issue type
-        if self.issue_type == 'bug':
-            prompt = BUG_EXTRACTION_PROMPT.format(text=text, project_key=project_key)
-        elif self.issue_type == 'story':
-            prompt = STORY_EXTRACTION_PROMPT.format(text=text, project_key=project_key)
-        else:  # task or epic-only
-            prompt = EXTRACTION_PROMPT.format(text=text, project_key=project_key)
+    def _extract_uncached(self, text: str, project_key: str, vector=None) -> TicketStructure:
+        """
+        Call the LLM for text, caching the response under vector if given
 
-        # Call LLM based on provider type
+        Falls back to simple extraction when the LLM call or parse fails,
+        unless the agent was built with fallback=False.
+        """
         try:
-            if hasattr(self.llm_client, 'chat'):  # OpenAI or Ollama
-                # Determine model to use
-                if config.llm_provider == 'ollama':
-                    model = config.ollama_model
-                    # Ollama may not support response_format, so we'll handle JSON parsing more carefully
-                    response = self.llm_client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": "You are a technical product manager extracting Jira tickets from text. Return valid JSON only."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.3
-                    )
-                else:
-                    model = config.llm_model
-                    response = self.llm_client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": "You are a technical product manager extracting Jira tickets from text. Return valid JSON only."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.3,
-                        response_format={"type": "json_object"}
-                    )
-                json_text = response.choices[0].message.content
-
-            elif hasattr(self.llm_client, 'messages'):  # Anthropic
-                response = self.llm_client.messages.create(
-                    model=config.llm_model,
-                    max_tokens=4000,
-                    temperature=0.3,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                json_text = response.content[0].text
+            payload = self._invoke_with_retry(self._render(text, project_key, use_schema=self._use_schema))
 
-            else:
-                raise ValueError("Unknown LLM client type")
+            # Parse and validate JSON response into Pydantic models in one pass
+            structure = self._parse_llm_json(payload, project_key)
+            if vector is not None:
+                self.cache.add(vector, payload)
+            return structure
 
-            # Parse JSON response
-            data = json.loads(json_text)
+        except Exception as e:
+            if not self.fallback:
+                raise
+            logger.warning("LLM extraction failed: %s. Falling back to simple extraction", e)
+            return self._extract_simple(text, project_key)
 
-            # Use helper method to parse JSON into Pydantic models
-            return self._parse_llm_response(data, project_key, self.issue_type)
+    async def _aextract_with_llm(self, text: str, project_key: str) -> TicketStructure:
+        """
+        Extract using an async LLM client (AsyncOpenAI or AsyncAnthropic)
+
+        Args:
+            text: Input text
+            project_key: Jira project key
+
+        Returns:
+            TicketStructure with extracted tickets
+        """
+        vector, cached = self._cache_lookup(text)
+        if cached is not None:
+            return self._parse_llm_json(cached, project_key)
+        return await self._aextract_uncached(text, project_key, vector)
+
+    async def _aextract_uncached(self, text: str, project_key: str, vector=None) -> TicketStructure:
+        """Async variant of _extract_uncached() for async LLM clients"""
+        try:
+            payload = await self._ainvoke_with_retry(self._render(text, project_key, use_schema=self._use_schema))
+
+            structure = self._parse_llm_json(payload, project_key)
+            if vector is not None:
+                self.cache.add(vector, payload)
+            return structure
 
         except Exception as e:
-            print(f"LLM extraction failed: {e}")
-            print("Falling back to simple extraction...")
+            if not self.fallback:
+                raise
+            logger.warning("LLM extraction failed: %s. Falling back to simple extraction", e)
             return self._extract_simple(text, project_key)
 
     def _extract_simple(self, text: str, project_key: str) -> TicketStructure:
@@ -127,31 +612,30 @@ class ExtractionAgent:
 
         Creates basic structure from text patterns
         """
-        from models import Epic, Task
-
         structure = TicketStructure(
             project_key=project_key,
             issue_type=self.issue_type
         )
 
-        # Simple pattern: create one epic from the text
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        # Simple pattern: create one epic from the first non-empty line.
+        # Only the line prefix is copied, so huge pastes are never split.
+        match = _NON_SPACE.search(text)
+
+        if match:
+            start = match.start()
+            end = text.find('\n', start, start + _FIRST_LINE_LIMIT)
+            first_line = text[start:end if end != -1 else start + _FIRST_LINE_LIMIT].rstrip()
 
-        if lines:
             epic = Epic(
-                title=lines[0][:200] if lines else "Extracted Feature",
+                title=first_line[:200],
                 description=text[:1000],
                 business_value="To be refined",
                 priority="Medium",
                 tasks=[
                     Task(
-                        title="Implement " + lines[0][:150] if lines else "Implementation task",
+                        title="Implement " + first_line[:150],
                         description=text[:500],
-                        acceptance_criteria=[
-                            "Feature works as described",
-                            "Tests pass",
-                            "Documentation updated"
-                        ],
+                        acceptance_criteria=_FALLBACK_ACCEPTANCE_CRITERIA,
                         priority="Medium"
                     )
                 ]
@@ -160,6 +644,36 @@ class ExtractionAgent:
 
         return structure
 
+    def _parse_llm_json(self, json_text, project_key: str) -> TicketStructure:
+        """
+        Parse and validate raw LLM JSON into Pydantic models in a single pass
+
+        Args:
+            json_text: JSON response from LLM (str or bytes), or the already
+                decoded dict from Anthropic tool use
+            project_key: Jira project key
+
+        Returns:
+            TicketStructure with properly typed models
+        """
+        structure = TicketStructure(
+            project_key=project_key,
+            issue_type=self.issue_type
+        )
+
+        if self._trusted and not isinstance(json_text, dict):
+            # Strict json_schema output: build models without re-running validators
+            data = from_json(json_text)
+            setattr(structure, self._result_key, self._construct(data.get(self._result_key, [])))
+            return structure
+
+        if isinstance(json_text, dict):
+            payload = self._response_model.model_validate(json_text)
+        else:
+            payload = self._response_model.model_validate_json(json_text)
+        setattr(structure, self._result_key, getattr(payload, self._result_key))
+        return structure
+
     def _parse_llm_response(self, data: dict, project_key: str, issue_type: str) -> TicketStructure:
         """
         Parse LLM JSON response into Pydantic models
@@ -172,19 +686,54 @@ class ExtractionAgent:
         Returns:
             TicketStructure with properly typed models
         """
-        from models import Epic, Bug, UserStory
-
         structure = TicketStructure(
             project_key=project_key,
             issue_type=issue_type
         )
 
-        # Populate based on issue type - parse dicts into Pydantic models
-        if issue_type == 'bug':
-            structure.bugs = [Bug(**bug_data) for bug_data in data.get('bugs', [])]
-        elif issue_type == 'story':
-            structure.stories = [UserStory(**story_data) for story_data in data.get('stories', [])]
-        else:  # task or epic-only
-            structure.epics = [Epic(**epic_data) for epic_data in data.get('epics', [])]
+        # Populate based on issue type - validate each list in one call
+        result_key = _RESULT_KEYS.get(issue_type, 'epics')
+        adapter = _LIST_ADAPTERS.get(issue_type, _EPIC_LIST)
+        setattr(structure, result_key, adapter.validate_python(data.get(result_key, [])))
 
         return structure
+
+
+async def extract_all_types(
+    llm_client: object,
+    text: str,
+    project_key: str,
+    types: Sequence[IssueType] = ('task', 'bug', 'story'),
+    concurrency: int = 3
+) -> TicketStructure:
+    """
+    Extract several issue types from the same text concurrently
+
+    One ExtractionAgent call is made per issue type, and the calls are
+    overlapped, so latency is the slowest extraction rather than the sum.
+
+    Args:
+        llm_client: OpenAI/Anthropic client (sync or async)
+        text: Input text
+        project_key: Jira project key
+        types: Issue types to extract
+        concurrency: Maximum number of in-flight LLM requests
+
+    Returns:
+        TicketStructure with epics, bugs and stories merged; issue_type is
+        the first requested type
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract(issue_type: IssueType) -> TicketStructure:
+        async with semaphore:
+            return await ExtractionAgent(llm_client, issue_type=issue_type).aextract(text, project_key)
+
+    results = await asyncio.gather(*(_extract(issue_type) for issue_type in types))
+
+    merged = TicketStructure(project_key=project_key, issue_type=types[0])
+    for structure in results:
+        merged.epics.extend(structure.epics)
+        merged.bugs.extend(structure.bugs)
+        merged.stories.extend(structure.stories)
+    return merged
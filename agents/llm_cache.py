@@ -0,0 +1,144 @@
+"""
+Exact-match LLM response cache
+
+Responses are keyed by a SHA-256 of the full request (model, messages,
+temperature, response format), so a byte-identical request skips the
+LLM round trip entirely. Only low-temperature requests are cached; at
+higher temperatures callers expect varied output.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Protocol
+
+DEFAULT_TTL = 7 * 24 * 60 * 60  # one week
+MAX_CACHEABLE_TEMPERATURE = 0.5
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache"""
+
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        ...
+
+
+class MemoryBackend:
+    """In-process backend with per-entry expiry and FIFO eviction"""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.time() + ttl, value)
+
+
+class FileBackend:
+    """On-disk backend: one JSON file per entry, shared across processes"""
+
+    def __init__(self, directory: Path):
+        """
+        Args:
+            directory: Directory to store cache entries in (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.directory / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if entry['expires'] < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry['value']
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(
+            json.dumps({'expires': time.time() + ttl, 'value': value}),
+            encoding='utf-8'
+        )
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+
+
+class LLMCache:
+    """Request-keyed cache for LLM response text"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: int = DEFAULT_TTL):
+        """
+        Args:
+            backend: Storage backend (defaults to MemoryBackend)
+            ttl: Seconds a cached response stays valid
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(request: dict) -> Optional[str]:
+        """
+        Compute the cache key for a create() request
+
+        Args:
+            request: Keyword arguments passed to the LLM client
+
+        Returns:
+            SHA-256 hex digest, or None if the request is not cacheable
+        """
+        if request.get('temperature', 1.0) > MAX_CACHEABLE_TEMPERATURE:
+            return None
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Get a cached response, or None on miss or uncacheable key"""
+        if key is None:
+            return None
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Optional[str], value: str) -> None:
+        """Store a response under key (ignored for uncacheable keys)"""
+        if key is not None and value:
+            self.backend.set(key, value, self.ttl)
+
+    def stats(self) -> dict:
+        """Hit and miss counts since startup"""
+        return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,150 @@
+"""
+Async LLM clients and request limits
+
+open_async_llm_client() builds an AsyncOpenAI/AsyncAnthropic client on a
+pooled httpx.AsyncClient for one request's event loop, so the concurrent
+extraction and review calls of that request share keep-alive connections.
+Flask runs every async view on a new loop and httpx connections are bound
+to the loop that opened them, so the client is closed when the request
+ends rather than kept for the next one.
+
+Every async LLM request should also run inside llm_slot(), which bounds
+in-flight requests and keeps the request rate under the provider limit
+across all requests in the process.
+"""
+
+import asyncio
+import contextlib
+import importlib.util
+import threading
+import time
+
+from config import config
+
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+REQUEST_TIMEOUT = 600.0
+CONNECT_TIMEOUT = 10.0
+
+
+def _build_http_client():
+    """Create the pooled httpx client, with HTTP/2 when the h2 package is available"""
+    import httpx
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+        ),
+        timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        http2=importlib.util.find_spec('h2') is not None
+    )
+
+
+@contextlib.asynccontextmanager
+async def open_async_llm_client():
+    """
+    Open an async LLM client for the configured provider, closing it on exit
+
+    The client and its connection pool belong to the running event loop,
+    so open one per request and share it between that request's calls.
+
+    Usage:
+        async with open_async_llm_client() as client:
+            structure = await ExtractionAgent(client).aextract(text, project_key)
+
+    Yields:
+        AsyncOpenAI or AsyncAnthropic client
+    """
+    async with config.get_async_llm_client(http_client=_build_http_client()) as client:
+        yield client
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing max_rate requests per period seconds
+
+    Tokens refill continuously, so bursts up to max_rate are allowed and the
+    long-run rate never exceeds max_rate / period. One instance is shared by
+    every thread and event loop in the process.
+    """
+
+    def __init__(self, max_rate: float, period: float = 60.0):
+        """
+        Args:
+            max_rate: Requests allowed per period
+            period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = float(max_rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing against the refill if the bucket is empty
+
+        Returns:
+            Seconds to wait before sending the request (0 if it may go now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_rate,
+                self._tokens + (now - self._last) * self.max_rate / self.period
+            )
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.period / self.max_rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+# Process-wide limits: Flask runs every async view on its own event loop
+# (and gunicorn threads run several at once), so asyncio primitives, which
+# are bound to one loop, would only limit a single request
+_slots = threading.BoundedSemaphore(config.llm_max_concurrency)
+_rate_limiter = RateLimiter(config.llm_requests_per_minute) if config.llm_requests_per_minute > 0 else None
+
+# How often a request waiting for a free slot checks again
+SLOT_POLL_INTERVAL = 0.05
+
+
+async def _acquire_slot() -> None:
+    """
+    Take one of the LLM_MAX_CONCURRENCY slots without blocking the event loop
+
+    Polls instead of waiting on the semaphore in a worker thread: a thread
+    still blocked when the request is cancelled would later take a slot that
+    nobody releases.
+    """
+    while not _slots.acquire(blocking=False):
+        await asyncio.sleep(SLOT_POLL_INTERVAL)
+
+
+@contextlib.asynccontextmanager
+async def llm_slot():
+    """
+    Hold one of the LLM_MAX_CONCURRENCY request slots, respecting LLM_REQUESTS_PER_MINUTE
+
+    Both limits are shared by every request in the process (not across
+    gunicorn workers, which are separate processes).
+
+    Usage:
+        async with llm_slot():
+            response = await client.chat.completions.create(...)
+    """
+    await _acquire_slot()
+    try:
+        if _rate_limiter is not None:
+            await _rate_limiter.acquire()
+        yield
+    finally:
+        _slots.release()
@@ -2,6 +2,8 @@
 LLM prompts for Extraction and Review agents
 """
 
+import functools
+
 EXTRACTION_PROMPT = """
 You are a technical product manager extracting FIRST-CLASS Jira tickets from text.
 
@@ -344,6 +346,19 @@ BE THOROUGH:
 Quality bar: Each ticket should be SO COMPLETE that a developer can implement it WITHOUT asking any questions.
 """
 
+# Appended to REVIEW_PROMPT when several structures are reviewed in one request
+BATCH_REVIEW_SUFFIX = """
+BATCH REVIEW:
+"Current Structure" above contains {count} separate structures, numbered
+"=== Structure 1 ===" to "=== Structure {count} ===". Review each one independently.
+
+Return as JSON:
+{{
+  "reviews": [ <one review object in the format above per structure, in the same order> ]
+}}
+The "reviews" array MUST contain exactly {count} objects.
+"""
+
 # ═══════════════════════════════════════════════════════
 # REFINEMENT PROMPT (Agent 2 - Apply Feedback)
 # ═══════════════════════════════════════════════════════
@@ -372,3 +387,62 @@ CRITICAL:
 - Maintain proper Jira issue type structure
 - Add specific, measurable acceptance criteria (not vague descriptions)
 """
+
+# ═══════════════════════════════════════════════════════
+# PRECOMPILED EXTRACTION TEMPLATES
+# ═══════════════════════════════════════════════════════
+
+def _split_template(template: str) -> tuple:
+    """Split a {text}/{project_key} template into static (head, mid, tail) parts"""
+    head, rest = template.split('{text}')
+    mid, tail = rest.split('{project_key}')
+    return tuple(
+        part.replace('{{', '{').replace('}}', '}')
+        for part in (head, mid, tail)
+    )
+
+
+def _strip_json_example(template: str) -> str:
+    """Remove the 'Return as JSON: {...}' example block from a template"""
+    start = template.index('Return as JSON:')
+    end = template.index('\n}}\n', start) + len('\n}}\n')
+    return template[:start] + template[end:].lstrip('\n')
+
+
+# Lean variants for schema-enforced requests: the response schema is sent to
+# the provider, so the inline JSON example only costs input tokens
+EXTRACTION_PROMPT_LEAN = _strip_json_example(EXTRACTION_PROMPT)
+BUG_EXTRACTION_PROMPT_LEAN = _strip_json_example(BUG_EXTRACTION_PROMPT)
+STORY_EXTRACTION_PROMPT_LEAN = _strip_json_example(STORY_EXTRACTION_PROMPT)
+
+_EXTRACTION_PARTS = _split_template(EXTRACTION_PROMPT)
+_BUG_EXTRACTION_PARTS = _split_template(BUG_EXTRACTION_PROMPT)
+_STORY_EXTRACTION_PARTS = _split_template(STORY_EXTRACTION_PROMPT)
+_EXTRACTION_LEAN_PARTS = _split_template(EXTRACTION_PROMPT_LEAN)
+_BUG_EXTRACTION_LEAN_PARTS = _split_template(BUG_EXTRACTION_PROMPT_LEAN)
+_STORY_EXTRACTION_LEAN_PARTS = _split_template(STORY_EXTRACTION_PROMPT_LEAN)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_suffix(parts: tuple, project_key: str) -> str:
+    """Everything after {text} for one template and project key (few distinct pairs per process)"""
+    _, mid, tail = parts
+    return f"{mid}{project_key}{tail}"
+
+
+def render_extraction(text: str, project_key: str, use_schema: bool = False) -> str:
+    """Equivalent to EXTRACTION_PROMPT(_LEAN).format(text=..., project_key=...)"""
+    parts = _EXTRACTION_LEAN_PARTS if use_schema else _EXTRACTION_PARTS
+    return parts[0] + text + _render_suffix(parts, project_key)
+
+
+def render_bug(text: str, project_key: str, use_schema: bool = False) -> str:
+    """Equivalent to BUG_EXTRACTION_PROMPT(_LEAN).format(text=..., project_key=...)"""
+    parts = _BUG_EXTRACTION_LEAN_PARTS if use_schema else _BUG_EXTRACTION_PARTS
+    return parts[0] + text + _render_suffix(parts, project_key)
+
+
+def render_story(text: str, project_key: str, use_schema: bool = False) -> str:
+    """Equivalent to STORY_EXTRACTION_PROMPT(_LEAN).format(text=..., project_key=...)"""
+    parts = _STORY_EXTRACTION_LEAN_PARTS if use_schema else _STORY_EXTRACTION_PARTS
+    return parts[0] + text + _render_suffix(parts, project_key)
@@ -5,9 +5,24 @@ Validates ticket structure for completeness, identifies gaps,
 and generates questions for user clarification.
 """
 
-from typing import Optional, Dict, List
+import asyncio
+import inspect
+import re
+from typing import Optional, Dict, List, Tuple
+from config import config
 from models import TicketStructure, Epic, Task, Bug, UserStory
-import json
+from agents.llm_cache import LLMCache
+from agents.llm_client import llm_slot
+import orjson
+
+REVIEW_SYSTEM_PROMPT = (
+    "You are a senior software architect reviewing requirements. "
+    "Find gaps, ambiguities, and missing details. Be thorough and critical."
+)
+REFINEMENT_SYSTEM_PROMPT = "You are a requirements analyst. Refine the ticket structure based on user feedback."
+
+VAGUE_WORDS = ('user-friendly', 'fast', 'robust', 'good', 'nice', 'clean')
+_VAGUE_RE = re.compile(r'\b(' + '|'.join(map(re.escape, VAGUE_WORDS)) + r')\b', re.IGNORECASE)
 
 
 class ReviewResult:
@@ -28,64 +43,61 @@ class ReviewResult:
         self.missing_tasks = missing_tasks
         self.ambiguities = ambiguities
         self.production_readiness_concerns = production_readiness_concerns or []
+        self._has_issues = bool(gaps or questions or missing_tasks or ambiguities)
+
+    @classmethod
+    def empty(cls) -> 'ReviewResult':
+        """New result with no findings"""
+        return cls([], [], [], [], [])
 
     @property
     def has_issues(self) -> bool:
         """Check if there are any issues found"""
-        return bool(
-            self.gaps or
-            self.questions or
-            self.missing_tasks or
-            self.ambiguities
-        )
+        return self._has_issues
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization"""
-        return {
+        """Convert to dictionary for JSON serialization (empty lists are omitted)"""
+        fields = {
             'gaps': self.gaps,
             'questions': self.questions,
             'suggestions': self.suggestions,
             'missing_tasks': self.missing_tasks,
             'ambiguities': self.ambiguities,
-            'production_readiness_concerns': self.production_readiness_concerns,
-            'has_issues': self.has_issues
+            'production_readiness_concerns': self.production_readiness_concerns
         }
+        result = {key: value for key, value in fields.items() if value}
+        result['has_issues'] = self._has_issues
+        return result
 
     def __str__(self) -> str:
         """Pretty print review results"""
-        lines = []
+        return "\n".join(self._iter_sections()) or "✅ No issues found"
 
+    def _iter_sections(self):
+        """Yield one formatted string per non-empty section"""
         if self.gaps:
-            lines.append("🔍 Gaps Found:")
-            for gap in self.gaps:
-                lines.append(f"  - {gap}")
+            yield "🔍 Gaps Found:\n" + "\n".join(f"  - {gap}" for gap in self.gaps)
 
         if self.ambiguities:
-            lines.append("\n⚠️  Ambiguities:")
-            for amb in self.ambiguities:
-                lines.append(f"  - {amb}")
+            yield "\n⚠️  Ambiguities:\n" + "\n".join(f"  - {amb}" for amb in self.ambiguities)
 
         if self.missing_tasks:
-            lines.append("\n💡 Suggested Missing Tasks:")
-            for task in self.missing_tasks:
-                lines.append(f"  - {task}")
+            yield "\n💡 Suggested Missing Tasks:\n" + "\n".join(f"  - {task}" for task in self.missing_tasks)
 
         if self.questions:
-            lines.append("\n❓ Questions for Clarification:")
-            for i, q in enumerate(self.questions, 1):
-                lines.append(f"  {i}. {q}")
+            yield (
+                "\n❓ Questions for Clarification:\n"
+                + "\n".join(f"  {i}. {q}" for i, q in enumerate(self.questions, 1))
+            )
 
         if self.suggestions:
-            lines.append("\n✨ Suggestions:")
-            for sug in self.suggestions:
-                lines.append(f"  - {sug}")
+            yield "\n✨ Suggestions:\n" + "\n".join(f"  - {sug}" for sug in self.suggestions)
 
         if self.production_readiness_concerns:
-            lines.append("\n⚠️  Production Readiness Concerns:")
-            for concern in self.production_readiness_concerns:
-                lines.append(f"  - {concern}")
-
-        return "\n".join(lines) if lines else "✅ No issues found"
+            yield (
+                "\n⚠️  Production Readiness Concerns:\n"
+                + "\n".join(f"  - {concern}" for concern in self.production_readiness_concerns)
+            )
 
 
 class ReviewAgent:
@@ -101,14 +113,22 @@ class ReviewAgent:
     - Refine structure based on user feedback
     """
 
-    def __init__(self, llm_client: Optional[object] = None):
+    def __init__(self, llm_client: Optional[object] = None, cache: Optional[LLMCache] = None):
         """
         Initialize review agent
 
         Args:
             llm_client: OpenAI/Anthropic client (optional)
+            cache: Exact-match response cache consulted before calling the LLM (optional)
         """
         self.llm_client = llm_client
+        self.cache = cache
+
+        # Resolve provider and model once instead of on every call
+        self._is_openai = hasattr(llm_client, 'chat')  # OpenAI or Ollama
+        self._is_ollama = self._is_openai and config.llm_provider == 'ollama'
+        self._model = config.ollama_model if self._is_ollama else config.llm_model
+        self._is_async = bool(llm_client) and self._is_async_client()
 
     def review(self, structure: TicketStructure) -> ReviewResult:
         """
@@ -125,69 +145,307 @@ class ReviewAgent:
         else:
             return self._review_simple(structure)
 
-    def _review_with_llm(self, structure: TicketStructure) -> ReviewResult:
-        """Use LLM to perform comprehensive review"""
-        from .prompts import REVIEW_PROMPT
+    def review_batch(self, structures: List[TicketStructure]) -> List[ReviewResult]:
+        """
+        Review several structures with a single LLM request
 
-        # Convert structure to text for review
-        structure_text = self._structure_to_text(structure)
+        The shared review instructions are sent once for the whole batch.
+        Structures the LLM does not return a review for get the rule-based review.
+
+        Args:
+            structures: Ticket structures to review
+
+        Returns:
+            List of ReviewResult, in the same order as structures
+        """
+        if not self.llm_client or len(structures) < 2:
+            return [self.review(structure) for structure in structures]
+        content = self._complete(REVIEW_SYSTEM_PROMPT, self._batch_review_prompt(structures), 0.5)
+        return self._parse_review_batch(content, structures)
+
+    async def areview_batch(self, structures: List[TicketStructure]) -> List[ReviewResult]:
+        """
+        Async variant of review_batch()
+
+        Args:
+            structures: Ticket structures to review
+
+        Returns:
+            List of ReviewResult, in the same order as structures
+        """
+        if not self.llm_client or len(structures) < 2:
+            return [await self.areview(structure) for structure in structures]
+        if not self._is_async:
+            return await asyncio.to_thread(self.review_batch, structures)
+        content = await self._acomplete(REVIEW_SYSTEM_PROMPT, self._batch_review_prompt(structures), 0.5)
+        return self._parse_review_batch(content, structures)
+
+    def submit_batch(self, structures: List[TicketStructure]) -> str:
+        """
+        Submit reviews to the provider's asynchronous Batch API
+
+        Batch requests are billed at a discount and do not count against
+        the synchronous rate limits; results arrive within 24 hours.
+
+        Args:
+            structures: Ticket structures to review
+
+        Returns:
+            Provider batch ID to pass to fetch_batch()
+        """
+        if self._is_ollama:
+            raise ValueError("Batch review is not supported for Ollama")
+
+        requests = []
+        for i, structure in enumerate(structures):
+            body = self._request_args(REVIEW_SYSTEM_PROMPT, self._review_prompt(structure), 0.5)
+            body.pop('stream', None)  # Batch requests cannot stream
+            requests.append((f"review-{i}", body))
+
+        if self._is_openai:
+            jsonl = b"\n".join(
+                orjson.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                })
+                for custom_id, body in requests
+            )
+            batch_file = self.llm_client.files.create(
+                file=("reviews.jsonl", jsonl),
+                purpose="batch"
+            )
+            batch = self.llm_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            return batch.id
 
-        from config import config
+        batch = self.llm_client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": body}
+            for custom_id, body in requests
+        ])
+        return batch.id
 
-        prompt = REVIEW_PROMPT.format(structure=structure_text)
+    def fetch_batch(self, batch_id: str) -> Tuple[str, Optional[List[Optional[ReviewResult]]]]:
+        """
+        Poll a batch submitted with submit_batch()
 
-        # Call LLM (OpenAI or Ollama)
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            Tuple of (provider status, results); results is None until the
+            batch has finished, then one ReviewResult per submitted structure
+            (None where that request failed)
+        """
+        if self._is_openai:
+            batch = self.llm_client.batches.retrieve(batch_id)
+            if batch.status != 'completed':
+                return batch.status, None
+
+            contents = {}
+            if batch.output_file_id:
+                output = self.llm_client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    entry = orjson.loads(line)
+                    response = entry.get('response') or {}
+                    if response.get('status_code') == 200:
+                        contents[entry['custom_id']] = response['body']['choices'][0]['message']['content']
+            total = batch.request_counts.total
+        else:
+            batch = self.llm_client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != 'ended':
+                return batch.processing_status, None
+
+            contents = {
+                entry.custom_id: entry.result.message.content[0].text
+                for entry in self.llm_client.messages.batches.results(batch_id)
+                if entry.result.type == 'succeeded'
+            }
+            counts = batch.request_counts
+            total = counts.processing + counts.succeeded + counts.errored + counts.canceled + counts.expired
+
+        results = []
+        for i in range(total):
+            content = contents.get(f"review-{i}")
+            try:
+                results.append(self._review_from_dict(orjson.loads(content)) if content else None)
+            except orjson.JSONDecodeError:
+                results.append(None)
+        return 'completed', results
+
+    async def areview(self, structure: TicketStructure) -> ReviewResult:
+        """
+        Async variant of review() for AsyncOpenAI/AsyncAnthropic clients
+
+        Synchronous clients are run in a worker thread so the event loop
+        is never blocked on the LLM round trip.
+
+        Args:
+            structure: Ticket structure to review
+
+        Returns:
+            ReviewResult with gaps, questions, and suggestions
+        """
+        if not self.llm_client:
+            return self._review_simple(structure)
+        if not self._is_async:
+            return await asyncio.to_thread(self._review_with_llm, structure)
+        return await self._areview_with_llm(structure)
+
+    def _is_async_client(self) -> bool:
+        """Check if the LLM client returns awaitables (AsyncOpenAI/AsyncAnthropic)"""
         if hasattr(self.llm_client, 'chat'):
-            # Determine model to use
-            if config.llm_provider == 'ollama':
-                model = config.ollama_model
-                response = self.llm_client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a senior software architect reviewing requirements. "
-                                     "Find gaps, ambiguities, and missing details. Be thorough and critical."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.5
-                )
-            else:
-                model = config.llm_model
-                response = self.llm_client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a senior software architect reviewing requirements. "
-                                     "Find gaps, ambiguities, and missing details. Be thorough and critical."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=0.5
-                )
-            content = response.choices[0].message.content
-        # Call LLM (Anthropic)
+            create = self.llm_client.chat.completions.create
         else:
-            response = self.llm_client.messages.create(
-                model=config.llm_model,
-                max_tokens=4096,
-                messages=[
+            create = self.llm_client.messages.create
+        # The SDKs wrap create() in an argument-checking decorator that hides
+        # the coroutine function from inspect until it is unwrapped
+        return inspect.iscoroutinefunction(inspect.unwrap(create))
+
+    def _request_args(self, system_prompt: str, prompt: str, temperature: float) -> dict:
+        """Build the provider-specific create() arguments for one LLM call"""
+        # OpenAI or Ollama
+        if self._is_openai:
+            args = {
+                "model": self._model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.5
-            )
+                "temperature": temperature,
+                "stream": True
+            }
+            if not self._is_ollama:
+                args["response_format"] = {"type": "json_object"}
+            return args
+
+        # Anthropic
+        return {
+            "model": self._model,
+            "max_tokens": 4096,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature
+        }
+
+    def _cached(self, args: dict):
+        """
+        Look up a cached response for a request
+
+        Returns:
+            Tuple of (cache key, cached text or None); both None without a cache
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(args)
+        return key, self.cache.get(key)
+
+    def _complete(self, system_prompt: str, prompt: str, temperature: float) -> str:
+        """Call the LLM and return the response text"""
+        args = self._request_args(system_prompt, prompt, temperature)
+        key, content = self._cached(args)
+        if content is not None:
+            return content
+
+        if self._is_openai:
+            # Collect deltas as they arrive instead of waiting for the whole body
+            stream = self.llm_client.chat.completions.create(**args)
+            parts = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+            content = ''.join(parts)
+        else:
+            response = self.llm_client.messages.create(**args)
             content = response.content[0].text
 
-        # Parse review results
+        if self.cache is not None:
+            self.cache.set(key, content)
+        return content
+
+    async def _acomplete(self, system_prompt: str, prompt: str, temperature: float) -> str:
+        """Await an async LLM client and return the response text"""
+        args = self._request_args(system_prompt, prompt, temperature)
+        key, content = self._cached(args)
+        if content is not None:
+            return content
+
+        async with llm_slot():
+            if self._is_openai:
+                stream = await self.llm_client.chat.completions.create(**args)
+                parts = []
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                content = ''.join(parts)
+            else:
+                response = await self.llm_client.messages.create(**args)
+                content = response.content[0].text
+
+        if self.cache is not None:
+            self.cache.set(key, content)
+        return content
+
+    def _review_prompt(self, structure: TicketStructure) -> str:
+        """Render the review prompt for a structure"""
+        from .prompts import REVIEW_PROMPT
+
+        # Convert structure to text for review
+        return REVIEW_PROMPT.format(structure=self._structure_to_text(structure))
+
+    def _batch_review_prompt(self, structures: List[TicketStructure]) -> str:
+        """Render one review prompt covering every structure"""
+        from .prompts import REVIEW_PROMPT, BATCH_REVIEW_SUFFIX
+
+        structures_text = "\n\n".join(
+            f"=== Structure {i} ===\n{self._structure_to_text(structure)}"
+            for i, structure in enumerate(structures, 1)
+        )
+        return (
+            REVIEW_PROMPT.format(structure=structures_text)
+            + BATCH_REVIEW_SUFFIX.format(count=len(structures))
+        )
+
+    def _review_with_llm(self, structure: TicketStructure) -> ReviewResult:
+        """Use LLM to perform comprehensive review"""
+        content = self._complete(REVIEW_SYSTEM_PROMPT, self._review_prompt(structure), 0.5)
+        return self._parse_review(content, structure)
+
+    async def _areview_with_llm(self, structure: TicketStructure) -> ReviewResult:
+        """Use an async LLM client to perform comprehensive review"""
+        content = await self._acomplete(REVIEW_SYSTEM_PROMPT, self._review_prompt(structure), 0.5)
+        return self._parse_review(content, structure)
+
+    def _parse_review(self, content: str, structure: TicketStructure) -> ReviewResult:
+        """Parse LLM review JSON, falling back to the rule-based review"""
         try:
-            review_data = json.loads(content)
-        except json.JSONDecodeError:
+            review_data = orjson.loads(content)
+        except orjson.JSONDecodeError:
             # Fallback if LLM doesn't return valid JSON
             return self._review_simple(structure)
 
+        return self._review_from_dict(review_data)
+
+    def _parse_review_batch(self, content: str, structures: List[TicketStructure]) -> List[ReviewResult]:
+        """Split a batched LLM review back into one ReviewResult per structure"""
+        try:
+            reviews = orjson.loads(content).get('reviews', [])
+        except (orjson.JSONDecodeError, AttributeError):
+            reviews = []
+
+        results = []
+        for i, structure in enumerate(structures):
+            if i < len(reviews) and isinstance(reviews[i], dict):
+                results.append(self._review_from_dict(reviews[i]))
+            else:
+                results.append(self._review_simple(structure))
+        return results
+
+    def _review_from_dict(self, review_data: dict) -> ReviewResult:
+        """Build a ReviewResult from decoded review JSON"""
         return ReviewResult(
             gaps=review_data.get('gaps', []),
             questions=review_data.get('questions', []),
@@ -199,6 +457,9 @@ class ReviewAgent:
 
     def _review_simple(self, structure: TicketStructure) -> ReviewResult:
         """Simple rule-based review without LLM"""
+        if not structure.has_content():
+            return ReviewResult.empty()
+
         gaps = []
         questions = []
         suggestions = []
@@ -213,13 +474,11 @@ class ReviewAgent:
                     gaps.append(f"Task '{task.title}' has only {len(task.acceptance_criteria)} acceptance criteria (recommend ≥3)")
                     questions.append(f"Can you provide more detailed acceptance criteria for '{task.title}'?")
 
-                # Check for vague descriptions
-                vague_words = ['user-friendly', 'fast', 'robust', 'good', 'nice', 'clean']
-                desc_lower = task.description.lower()
-                for word in vague_words:
-                    if word in desc_lower:
-                        gaps.append(f"Task '{task.title}' contains vague term '{word}'")
-                        questions.append(f"Can you be more specific about '{word}' in '{task.title}'?")
+                # Check for vague descriptions (each term reported once per task)
+                found = dict.fromkeys(m.group(1).lower() for m in _VAGUE_RE.finditer(task.description))
+                for word in found:
+                    gaps.append(f"Task '{task.title}' contains vague term '{word}'")
+                    questions.append(f"Can you be more specific about '{word}' in '{task.title}'?")
 
         # Check bugs for reproduction steps
         for bug in structure.bugs:
@@ -272,71 +531,64 @@ class ReviewAgent:
             # Without LLM, return original structure
             return structure
 
-    def _apply_feedback_with_llm(
+    async def aapply_feedback(
         self,
         structure: TicketStructure,
         user_answers: Dict[str, str]
     ) -> TicketStructure:
-        """Use LLM to apply user feedback and refine structure"""
+        """
+        Async variant of apply_feedback() for AsyncOpenAI/AsyncAnthropic clients
+
+        Args:
+            structure: Original ticket structure
+            user_answers: Dict mapping questions to user answers
+
+        Returns:
+            Improved ticket structure
+        """
+        if not self.llm_client:
+            return structure
+        if not self._is_async:
+            return await asyncio.to_thread(self._apply_feedback_with_llm, structure, user_answers)
+        return await self._aapply_feedback_with_llm(structure, user_answers)
+
+    def _refinement_prompt(self, structure: TicketStructure, user_answers: Dict[str, str]) -> str:
+        """Render the refinement prompt for a structure and user answers"""
         from .prompts import REFINEMENT_PROMPT
 
         structure_text = self._structure_to_text(structure)
         answers_text = "\n".join(f"Q: {q}\nA: {a}" for q, a in user_answers.items())
 
-        from config import config
-
-        prompt = REFINEMENT_PROMPT.format(
+        return REFINEMENT_PROMPT.format(
             structure=structure_text,
             feedback=answers_text
         )
 
-        # Call LLM (OpenAI or Ollama)
-        if hasattr(self.llm_client, 'chat'):
-            # Determine model to use
-            if config.llm_provider == 'ollama':
-                model = config.ollama_model
-                response = self.llm_client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a requirements analyst. Refine the ticket structure based on user feedback."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3
-                )
-            else:
-                model = config.llm_model
-                response = self.llm_client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a requirements analyst. Refine the ticket structure based on user feedback."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=0.3
-                )
-            content = response.choices[0].message.content
-        # Call LLM (Anthropic)
-        else:
-            response = self.llm_client.messages.create(
-                model=config.llm_model,
-                max_tokens=4096,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            content = response.content[0].text
+    def _apply_feedback_with_llm(
+        self,
+        structure: TicketStructure,
+        user_answers: Dict[str, str]
+    ) -> TicketStructure:
+        """Use LLM to apply user feedback and refine structure"""
+        prompt = self._refinement_prompt(structure, user_answers)
+        content = self._complete(REFINEMENT_SYSTEM_PROMPT, prompt, 0.3)
+        return self._parse_refinement(content, structure)
 
-        # Parse refined structure
+    async def _aapply_feedback_with_llm(
+        self,
+        structure: TicketStructure,
+        user_answers: Dict[str, str]
+    ) -> TicketStructure:
+        """Use an async LLM client to apply user feedback and refine structure"""
+        prompt = self._refinement_prompt(structure, user_answers)
+        content = await self._acomplete(REFINEMENT_SYSTEM_PROMPT, prompt, 0.3)
+        return self._parse_refinement(content, structure)
+
+    def _parse_refinement(self, content: str, structure: TicketStructure) -> TicketStructure:
+        """Parse refined structure JSON, keeping the original on invalid output"""
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
             # Fallback: return original structure
             return structure
 
@@ -347,72 +599,62 @@ class ReviewAgent:
 
     def _structure_to_text(self, structure: TicketStructure) -> str:
         """Convert ticket structure to readable text for LLM review"""
-        lines = [f"Project: {structure.project_key}"]
-        lines.append(f"Issue Type: {structure.issue_type}\n")
+        return "".join(self._iter_structure_text(structure))
+
+    def _iter_structure_text(self, structure: TicketStructure):
+        """Yield the review text one ticket at a time; each ticket starts on a new line"""
+        yield f"Project: {structure.project_key}\nIssue Type: {structure.issue_type}\n"
 
         # Format epics and tasks
         for epic in structure.epics:
-            lines.append(f"\nEpic: {epic.title}")
-            lines.append(f"Description: {epic.description}")
-            if epic.business_value:
-                lines.append(f"Business Value: {epic.business_value}")
-            lines.append(f"Priority: {epic.priority}")
+            yield (
+                f"\n\nEpic: {epic.title}\nDescription: {epic.description}"
+                + (f"\nBusiness Value: {epic.business_value}" if epic.business_value else "")
+                + f"\nPriority: {epic.priority}"
+            )
 
             for task in epic.tasks:
-                lines.append(f"\n  Task: {task.title}")
-                lines.append(f"  Description: {task.description}")
-                lines.append(f"  Priority: {task.priority}")
-                if task.estimated_effort:
-                    lines.append(f"  Estimated Effort: {task.estimated_effort}")
-
-                if task.acceptance_criteria:
-                    lines.append("  Acceptance Criteria:")
-                    for ac in task.acceptance_criteria:
-                        lines.append(f"    - {ac}")
-
-                if task.technical_notes:
-                    lines.append(f"  Technical Notes: {task.technical_notes}")
+                yield (
+                    f"\n\n  Task: {task.title}\n  Description: {task.description}\n  Priority: {task.priority}"
+                    + (f"\n  Estimated Effort: {task.estimated_effort}" if task.estimated_effort else "")
+                    + (
+                        "\n  Acceptance Criteria:\n" + "\n".join(f"    - {ac}" for ac in task.acceptance_criteria)
+                        if task.acceptance_criteria else ""
+                    )
+                    + (f"\n  Technical Notes: {task.technical_notes}" if task.technical_notes else "")
+                )
 
         # Format bugs
         for bug in structure.bugs:
-            lines.append(f"\nBug: {bug.summary}")
-            lines.append(f"Description: {bug.description}")
-            lines.append(f"Severity: {bug.severity}")
-            lines.append(f"Priority: {bug.priority}")
-
-            if bug.reproduction_steps:
-                lines.append("Reproduction Steps:")
-                for i, step in enumerate(bug.reproduction_steps, 1):
-                    lines.append(f"  {i}. {step}")
-
-            if bug.environment:
-                lines.append("Environment:")
-                if bug.environment.browser:
-                    lines.append(f"  Browser: {bug.environment.browser}")
-                if bug.environment.os:
-                    lines.append(f"  OS: {bug.environment.os}")
-
-            if bug.acceptance_criteria:
-                lines.append("Fix Verification Criteria:")
-                for ac in bug.acceptance_criteria:
-                    lines.append(f"  - {ac}")
+            env = bug.environment
+            yield (
+                f"\n\nBug: {bug.summary}\nDescription: {bug.description}"
+                f"\nSeverity: {bug.severity}\nPriority: {bug.priority}"
+                + (
+                    "\nReproduction Steps:\n"
+                    + "\n".join(f"  {i}. {step}" for i, step in enumerate(bug.reproduction_steps, 1))
+                    if bug.reproduction_steps else ""
+                )
+                + (
+                    "\nEnvironment:"
+                    + (f"\n  Browser: {env.browser}" if env.browser else "")
+                    + (f"\n  OS: {env.os}" if env.os else "")
+                    if env else ""
+                )
+                + (
+                    "\nFix Verification Criteria:\n" + "\n".join(f"  - {ac}" for ac in bug.acceptance_criteria)
+                    if bug.acceptance_criteria else ""
+                )
+            )
 
         # Format user stories
         for story in structure.stories:
-            lines.append(f"\nStory: {story.title}")
-            lines.append(f"As a: {story.as_a}")
-            lines.append(f"I want to: {story.i_want_to}")
-            lines.append(f"So that: {story.so_that}")
-            lines.append(f"Priority: {story.priority}")
-
-            if story.acceptance_criteria:
-                lines.append("Acceptance Criteria:")
-                for ac in story.acceptance_criteria:
-                    lines.append(f"  - {ac}")
-
-            if story.definition_of_done:
-                lines.append("Definition of Done:")
-                for dod in story.definition_of_done:
-                    lines.append(f"  - {dod}")
-
-        return "\n".join(lines)
+            yield (
+                f"\n\nStory: {story.title}\nAs a: {story.as_a}\nI want to: {story.i_want_to}"
+                f"\nSo that: {story.so_that}\nPriority: {story.priority}"
+                + (
+                    "\nAcceptance Criteria:\n" + "\n".join(f"  - {ac}" for ac in story.acceptance_criteria)
+                    if story.acceptance_criteria else ""
+                )
+                + (f"\nTechnical Notes: {story.technical_notes}" if story.technical_notes else "")
+            )
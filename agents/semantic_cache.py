@@ -0,0 +1,184 @@
+"""
+Semantic cache for LLM extraction responses
+
+Stores LLM JSON responses keyed by a sentence embedding of the input, so
+repeated or paraphrased inputs skip the LLM round trip entirely.
+
+Requires the optional packages numpy and sentence-transformers:
+    pip install numpy sentence-transformers
+"""
+
+import threading
+from typing import Any, List, Optional
+
+DEFAULT_MODEL = 'all-MiniLM-L6-v2'
+DEFAULT_THRESHOLD = 0.87
+
+
+class SemanticCache:
+    """
+    Embedding-based response cache with LRU eviction
+
+    Embeddings are kept normalized in one contiguous (N, dim) float32 matrix
+    so a lookup is a single matrix-vector product instead of a Python loop.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = 256,
+        model_name: str = DEFAULT_MODEL
+    ):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses
+            model_name: sentence-transformers model used for embeddings
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy package not installed. Run: pip install numpy")
+
+        self._np = np
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+        self._matrix = None
+        self._responses: List[Any] = []
+        self._last_used = np.empty(0, dtype=np.int64)
+        self._clock = 0
+
+    def _get_model(self):
+        """Lazily load the embedding model on first use"""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers package not installed. "
+                    "Run: pip install sentence-transformers"
+                )
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def embed(self, text: str):
+        """
+        Embed text as a normalized float32 vector
+
+        Args:
+            text: Cache key text
+
+        Returns:
+            1-D numpy array
+        """
+        vector = self._get_model().encode(
+            text,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return vector.astype(self._np.float32, copy=False)
+
+    def encode_batch(self, texts: List[str]):
+        """
+        Embed many texts in one batched forward pass
+
+        Args:
+            texts: Cache key texts
+
+        Returns:
+            (N, dim) numpy array of normalized float32 vectors
+        """
+        vectors = self._get_model().encode(
+            texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return vectors.astype(self._np.float32, copy=False)
+
+    def lookup(self, vector) -> Optional[Any]:
+        """
+        Find the cached response most similar to vector
+
+        Args:
+            vector: Normalized embedding from embed()
+
+        Returns:
+            Cached response, or None on miss
+        """
+        with self._lock:
+            if not self._responses:
+                return None
+
+            # Embeddings are normalized, so the dot product is cosine similarity
+            scores = self._matrix @ vector
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            return self._responses[best]
+
+    def lookup_batch(self, vectors) -> List[Optional[Any]]:
+        """
+        Look up many embeddings with a single (N, K) similarity matrix
+
+        Args:
+            vectors: (N, dim) array from encode_batch()
+
+        Returns:
+            Cached response or None for each row of vectors
+        """
+        np = self._np
+        with self._lock:
+            if not self._responses:
+                return [None] * len(vectors)
+
+            scores = vectors @ self._matrix.T
+            best = scores.argmax(axis=1)
+            hit = scores[np.arange(len(vectors)), best] >= self.threshold
+
+            results = []
+            for row, is_hit in enumerate(hit):
+                if is_hit:
+                    self._clock += 1
+                    self._last_used[best[row]] = self._clock
+                    results.append(self._responses[best[row]])
+                else:
+                    results.append(None)
+            return results
+
+    def add(self, vector, response: Any) -> None:
+        """
+        Store a response, evicting the least recently used entry if full
+
+        Args:
+            vector: Normalized embedding from embed()
+            response: LLM response (JSON text or decoded tool input) to cache
+        """
+        np = self._np
+        with self._lock:
+            self._clock += 1
+            if self._matrix is None:
+                self._matrix = vector[np.newaxis, :].copy()
+                self._responses = [response]
+                self._last_used = np.array([self._clock], dtype=np.int64)
+                return
+
+            if len(self._responses) >= self.max_entries:
+                oldest = int(self._last_used.argmin())
+                self._matrix[oldest] = vector
+                self._responses[oldest] = response
+                self._last_used[oldest] = self._clock
+                return
+
+            self._matrix = np.vstack([self._matrix, vector])
+            self._responses.append(response)
+            self._last_used = np.append(self._last_used, self._clock)
+
+    def __len__(self) -> int:
+        return len(self._responses)
@@ -4,30 +4,243 @@ JIRA Ticket Generator - Flask Backend API
 Serves the React frontend and provides API endpoints for ticket generation
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, abort
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+from pydantic import ValidationError
+from werkzeug.exceptions import HTTPException
+from werkzeug.utils import secure_filename
+import orjson
+from collections import OrderedDict
 from pathlib import Path
+import asyncio
+import contextlib
+import hashlib
+import io
+import logging
 import os
-import tempfile
+import shutil
+import threading
 from datetime import datetime
+from typing import Optional
 
 from config import config
-from models import IssueType
-from agents.extraction_agent import ExtractionAgent
+from models import IssueType, TicketStructure
+from agents.extraction_agent import ExtractionAgent, EXTRACTION_TEMPERATURE
 from agents.review_agent import ReviewAgent
-from markdown_utils import write_markdown, generate_filename, list_markdown_files, read_markdown
+from agents.llm_client import open_async_llm_client
+from agents.llm_cache import LLMCache
+from markdown_utils import write_markdown, generate_filename, list_markdown_files, read_markdown, MARKDOWN_DIR
 from markdown_parser import parse_markdown
-from jira_client import JiraClient
+from jira_client import AsyncJiraClient, JiraAuthError
+
+# LOG_LEVEL=DEBUG turns on per-request upload tracing; the default keeps it silent
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
+logger = logging.getLogger(__name__)
+
+# Async views get their event loops from the policy, so with uvloop
+# installed the Jira and LLM fan-out runs on libuv instead of asyncio's loop
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response straight from orjson's bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+
 
 app = Flask(__name__, static_folder='ui/build', static_url_path='')
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for development
 
-# Configure upload folder
-UPLOAD_FOLDER = Path('uploads')
-UPLOAD_FOLDER.mkdir(exist_ok=True)
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+# Compress JSON/markdown/static responses over 1 KiB (brotli, falling back to gzip)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIMETYPES'] = [
+    'application/json', 'text/markdown', 'text/html', 'text/css',
+    'text/javascript', 'application/javascript'
+]
+Compress(app)
+
+# Uploads are decoded in memory, so only the request size needs limiting
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Identical review requests (re-parsing the same text) are served from memory
+review_cache = LLMCache()
+# Whole /api/parse results (structure + review), so a repeated parse skips both agents
+parse_cache = LLMCache()
+
+# Recently read markdown file contents by filename as (mtime_ns, content), so a
+# GET only needs one stat() to confirm the cached copy is current. Bounded per
+# worker process; larger files are always read from disk.
+FILE_CACHE_SIZE = 32
+FILE_CACHE_MAX_BYTES = 1 << 20
+_file_cache: 'OrderedDict[str, tuple[int, str]]' = OrderedDict()
+_file_lock = threading.Lock()
+
+
+# Markdown directory listing as (directory mtime_ns, JSON bytes, ETag, file names),
+# backing /api/markdown/list and the known-file check on /api/markdown/<filename>.
+# Creating, renaming or deleting a file bumps the directory mtime; in-place edits
+# through PUT /api/markdown/<filename> reset it explicitly.
+_list_cache: Optional[tuple[int, bytes, str, frozenset]] = None
+
+# Structures generated by /api/parse by filename as (file mtime_ns, structure), so
+# uploading a freshly generated file skips reading and re-parsing its markdown
+STRUCTURE_CACHE_SIZE = 32
+_structure_cache: 'OrderedDict[str, tuple[int, TicketStructure]]' = OrderedDict()
+_structure_lock = threading.Lock()
+
+def _parse_cache_key(text: str, project_key: str, issue_type: str, skip_review: bool):
+    """
+    Build the parse_cache key for an /api/parse request
+
+    Args:
+        text: Input text
+        project_key: Jira project key
+        issue_type: Requested issue type
+        skip_review: Whether the review step was skipped
+
+    Returns:
+        Cache key, or None if the request is not cacheable
+    """
+    return LLMCache.key({
+        'provider': config.llm_provider,
+        'model': config.ollama_model if config.llm_provider == 'ollama' else config.llm_model,
+        'issue_type': issue_type,
+        'project_key': project_key,
+        'skip_review': skip_review,
+        'temperature': EXTRACTION_TEMPERATURE,
+        'text': text.strip()
+    })
+
+
+def _remember_structure(filename: str, structure: TicketStructure) -> None:
+    """Cache the structure just written to filename"""
+    mtime = os.stat(MARKDOWN_DIR / filename).st_mtime_ns
+    with _structure_lock:
+        _structure_cache[filename] = (mtime, structure)
+        _structure_cache.move_to_end(filename)
+        if len(_structure_cache) > STRUCTURE_CACHE_SIZE:
+            _structure_cache.popitem(last=False)
+
+
+def _recall_structure(filename: str, mtime: int) -> Optional[TicketStructure]:
+    """Get the cached structure for filename if the file is unchanged since it was written"""
+    with _structure_lock:
+        entry = _structure_cache.get(filename)
+        if entry is None or entry[0] != mtime:
+            return None
+        _structure_cache.move_to_end(filename)
+        return entry[1]
+
+
+def _forget_structure(filename: str) -> None:
+    """Drop any cached structure for filename"""
+    with _structure_lock:
+        _structure_cache.pop(filename, None)
+
+
+def _read_cached_file(filename: str, stat: os.stat_result) -> str:
+    """Get the contents of a markdown file, from the cache if it is unchanged on disk"""
+    with _file_lock:
+        entry = _file_cache.get(filename)
+        if entry is not None and entry[0] == stat.st_mtime_ns:
+            _file_cache.move_to_end(filename)
+            return entry[1]
+
+    content = read_markdown(MARKDOWN_DIR / filename)
+    if stat.st_size <= FILE_CACHE_MAX_BYTES:
+        with _file_lock:
+            _file_cache[filename] = (stat.st_mtime_ns, content)
+            _file_cache.move_to_end(filename)
+            if len(_file_cache) > FILE_CACHE_SIZE:
+                _file_cache.popitem(last=False)
+    return content
+
+
+def _forget_file(filename: str) -> None:
+    """Drop any cached contents and structure for filename"""
+    with _file_lock:
+        _file_cache.pop(filename, None)
+    _forget_structure(filename)
+
+
+def _markdown_listing() -> tuple[int, bytes, str, frozenset]:
+    """Get the cached markdown listing, rescanning if the directory changed"""
+    global _list_cache
+    dir_mtime = os.stat(MARKDOWN_DIR).st_mtime_ns
+    cached = _list_cache
+    if cached is None or cached[0] != dir_mtime:
+        file_list = []
+        for entry in list_markdown_files():
+            stat = entry.stat()
+            file_list.append({
+                'name': entry.name,
+                'path': str(Path(entry.path)),
+                'size': stat.st_size,
+                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+        payload = orjson.dumps({'files': file_list})
+        names = frozenset(item['name'] for item in file_list)
+        cached = (dir_mtime, payload, hashlib.md5(payload).hexdigest(), names)
+        _list_cache = cached
+    return cached
+
+
+def _wants_raw_markdown() -> bool:
+    """Whether the request asks for the markdown file itself rather than JSON"""
+    if 'format' in request.args:
+        return request.args['format'] == 'raw'
+    return request.accept_mimetypes.best_match(['application/json', 'text/markdown']) == 'text/markdown'
+
+
+def _check_filename(filename: str) -> Path:
+    """
+    Resolve a generated markdown file named in the request URL
+
+    Anything but a plain, safe file name is rejected with 400; names that are
+    not listed generated markdown files get 404.
+
+    Args:
+        filename: File name from the request URL
+
+    Returns:
+        Path to the file
+    """
+    if secure_filename(filename) != filename or Path(filename).name != filename:
+        abort(400, description='Invalid filename')
+    if filename not in _markdown_listing()[3]:
+        abort(404, description='File not found')
+    return MARKDOWN_DIR / filename
+
+
+@app.errorhandler(HTTPException)
+def handle_http_error(e):
+    """Report aborted API requests as JSON, like the handlers' own errors"""
+    if request.path.startswith('/api/'):
+        return jsonify({'error': e.description}), e.code
+    return e
+
 
 @app.route('/')
 def serve_frontend():
@@ -41,8 +254,12 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'llm_configured': config.has_llm_configured(),
-        'jira_configured': bool(config.jira_url and config.jira_email and config.jira_api_token)
+        'llm_configured': config.has_llm,
+        'jira_configured': config.has_jira,
+        'cache': {
+            'parse': parse_cache.stats(),
+            'review': review_cache.stats()
+        }
     })
 
 
@@ -55,22 +272,21 @@ def get_config():
         'jira_url': config.jira_url,
         'jira_email': config.jira_email,
         'default_project': config.jira_project or '',
-        'has_llm': config.has_llm_configured()
+        'has_llm': config.has_llm
     })
 
 
 @app.route('/api/validate', methods=['GET'])
 def validate_config():
     """Validate configuration"""
-    errors = config.validate()
     return jsonify({
-        'valid': len(errors) == 0,
-        'errors': errors
+        'valid': not config.errors,
+        'errors': config.errors
     })
 
 
 @app.route('/api/parse', methods=['POST'])
-def parse_tickets():
+async def parse_tickets():
     """
     Parse text and extract tickets
 
@@ -83,95 +299,158 @@ def parse_tickets():
     }
     """
     try:
-        # Get input text
-        text = None
-        if 'file' in request.files:
-            file = request.files['file']
-            if file.filename:
-                # Save uploaded file temporarily
-                temp_path = UPLOAD_FOLDER / file.filename
-                file.save(temp_path)
-                text = temp_path.read_text(encoding='utf-8')
-                temp_path.unlink()  # Delete temp file
-
-        # If no file, get text from form or JSON
-        if not text:
-            if request.is_json:
-                data = request.get_json()
+        async with contextlib.AsyncExitStack() as llm_scope:
+            # Request parameters come from the JSON body or, for uploads, the form
+            data = (request.get_json(silent=True) or {}) if request.is_json else request.form
+
+            # Get input text
+            text = None
+            if 'file' in request.files:
+                file = request.files['file']
+                if file.filename:
+                    # Decode the upload stream directly, without a temp file
+                    text = io.TextIOWrapper(file.stream, encoding='utf-8', errors='replace').read()
+
+            # If no file, get text from form or JSON
+            if not text:
                 text = data.get('text', '')
+
+            if not text or not text.strip():
+                return jsonify({'error': 'No input text provided'}), 400
+
+            project_key = data.get('project_key', config.jira_project or 'PROJ')
+            issue_type = data.get('issue_type', 'task').lower()
+            skip_review = str(data.get('skip_review', 'false')).lower() in ['true', '1', 'yes']
+
+            # Validate issue type
+            if issue_type not in ['task', 'bug', 'story', 'epic-only']:
+                return jsonify({'error': f'Invalid issue type: {issue_type}'}), 400
+
+            # Get LLM client; it is closed with its connections when the request ends
+            llm_client = None
+            if config.has_llm:
+                try:
+                    llm_client = await llm_scope.enter_async_context(open_async_llm_client())
+                except Exception as e:
+                    return jsonify({'error': f'LLM configuration error: {str(e)}'}), 500
+
+            # Repeated inputs are answered from the parse cache without any LLM call
+            cache_key = None
+            cached = None
+            if llm_client:
+                cache_key = _parse_cache_key(text, project_key, issue_type, skip_review)
+                cached = parse_cache.get(cache_key)
+
+            if cached is not None:
+                entry = orjson.loads(cached)
+                try:
+                    structure = TicketStructure.model_validate(entry['structure'])
+                except ValidationError as e:
+                    # Trusted structured output is built without validation, so an
+                    # entry may not satisfy the models; extract again and replace it
+                    logger.warning("Discarding invalid parse cache entry: %s", e)
+                    cached = None
+
+            if cached is None:
+                # Agent 1: Extract structure
+                extraction_agent = ExtractionAgent(llm_client, issue_type=issue_type, fallback=False)
+                try:
+                    structure = await extraction_agent.aextract(text, project_key)
+                except Exception as e:
+                    # Still answer with the simple extraction, but never cache it
+                    # in place of an LLM result
+                    logger.warning("LLM extraction failed: %s. Falling back to simple extraction", e)
+                    structure = ExtractionAgent(issue_type=issue_type).extract(text, project_key)
+                    cache_key = None
+
+            if not structure.has_content():
+                return jsonify({'error': 'No tickets extracted from input'}), 400
+
+            # Generate markdown while Agent 2 reviews (optional)
+            filename = generate_filename(project_key, issue_type)
+            output_path = Path(filename)
+            write_task = asyncio.to_thread(write_markdown, structure, output_path)
+
+            review_result = None
+            if cached is not None:
+                review_result = entry['review']
+                markdown_content = await write_task
+            elif not skip_review and llm_client:
+                review_agent = ReviewAgent(llm_client, cache=review_cache)
+                review, markdown_content = await asyncio.gather(review_agent.areview(structure), write_task)
+
+                if review.has_issues:
+                    review_result = review.to_dict()
             else:
-                # For multipart/form-data
-                text = request.form.get('text', '')
+                markdown_content = await write_task
+
+            _remember_structure(filename, structure)
+
+            if cache_key and cached is None:
+                parse_cache.set(cache_key, orjson.dumps({
+                    'structure': structure.model_dump(mode='json'),
+                    'review': review_result
+                }).decode('utf-8'))
+
+            return jsonify({
+                'success': True,
+                'filename': filename,
+                'markdown': markdown_content,
+                'review': review_result,
+                'stats': structure.counts()
+            })
 
-        if not text or not text.strip():
-            return jsonify({'error': 'No input text provided'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        # Get parameters from form (multipart) or JSON
-        if request.is_json:
-            data = request.get_json()
-        else:
-            # For multipart/form-data, use request.form
-            data = request.form
 
-        project_key = data.get('project_key', config.jira_project or 'PROJ')
-        issue_type = data.get('issue_type', 'task').lower()
-        skip_review = data.get('skip_review', 'false').lower() in ['true', '1', 'yes']
+@app.route('/api/review/batch', methods=['POST'])
+def submit_review_batch():
+    """
+    Submit offline reviews of generated markdown files to the provider Batch API
+
+    Request JSON:
+    {
+        "filenames": ["jira_tickets_PROJ_task_20251123.md", ...]
+    }
+    """
+    try:
+        data = request.get_json()
+        filenames = data.get('filenames', [])
+
+        if not filenames:
+            return jsonify({'error': 'No filenames provided'}), 400
+        if not isinstance(filenames, list) or not all(isinstance(name, str) for name in filenames):
+            return jsonify({'error': 'filenames must be a list of file names'}), 400
+        if not config.has_llm:
+            return jsonify({'error': 'LLM not configured'}), 400
 
-        # Validate issue type
-        if issue_type not in ['task', 'bug', 'story', 'epic-only']:
-            return jsonify({'error': f'Invalid issue type: {issue_type}'}), 400
+        # Only generated markdown files in MARKDOWN_DIR may be reviewed
+        paths = [_check_filename(name) for name in filenames]
+        structures = [parse_markdown(path) for path in paths]
+        batch_id = ReviewAgent(config.get_llm_client()).submit_batch(structures)
 
-        # Get LLM client
-        llm_client = None
-        if config.has_llm_configured():
-            try:
-                llm_client = config.get_llm_client()
-            except Exception as e:
-                return jsonify({'error': f'LLM configuration error: {str(e)}'}), 500
-
-        # Agent 1: Extract structure
-        extraction_agent = ExtractionAgent(llm_client, issue_type=issue_type)
-        structure = extraction_agent.extract(text, project_key)
-
-        if not structure.has_content():
-            return jsonify({'error': 'No tickets extracted from input'}), 400
-
-        # Agent 2: Review (optional)
-        review_result = None
-        if not skip_review and llm_client:
-            review_agent = ReviewAgent(llm_client)
-            review = review_agent.review(structure)
-
-            if review.has_issues:
-                review_result = {
-                    'gaps': review.gaps,
-                    'ambiguities': review.ambiguities,
-                    'missing_tasks': review.missing_tasks,
-                    'questions': review.questions,
-                    'suggestions': review.suggestions,
-                    'production_readiness_concerns': review.production_readiness_concerns
-                }
-
-        # Generate markdown
-        filename = generate_filename(project_key, issue_type)
-        output_path = Path(filename)
-        write_markdown(structure, output_path)
-
-        # Read markdown content
-        markdown_content = output_path.read_text(encoding='utf-8')
+        return jsonify({'success': True, 'batch_id': batch_id, 'filenames': filenames})
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/review/batch/<batch_id>', methods=['GET'])
+def get_review_batch(batch_id):
+    """Poll an offline review batch; reviews are in submission order once done"""
+    try:
+        status, results = ReviewAgent(config.get_llm_client()).fetch_batch(batch_id)
 
         return jsonify({
-            'success': True,
-            'filename': filename,
-            'markdown': markdown_content,
-            'review': review_result,
-            'stats': {
-                'total_items': structure.count_total_items(),
-                'epics': len(structure.epics) if structure.epics else 0,
-                'tasks': sum(len(epic.tasks) for epic in structure.epics) if structure.epics else 0,
-                'bugs': len(structure.bugs) if structure.bugs else 0,
-                'stories': len(structure.stories) if structure.stories else 0
-            }
+            'batch_id': batch_id,
+            'status': status,
+            'done': results is not None,
+            'reviews': None if results is None else [
+                result.to_dict() if result else None for result in results
+            ]
         })
 
     except Exception as e:
@@ -209,19 +488,11 @@ def apply_feedback():
 def list_markdown():
     """List all generated markdown files"""
     try:
-        files = list_markdown_files()
-        file_list = []
-
-        for file in files:
-            stat = file.stat()
-            file_list.append({
-                'name': file.name,
-                'path': str(file),
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-            })
-
-        return jsonify({'files': file_list})
+        _, payload, etag, _ = _markdown_listing()
+        response = app.response_class(payload, mimetype='application/json')
+        response.set_etag(etag, weak=True)
+        # Answers 304 when the client's If-None-Match still matches
+        return response.make_conditional(request)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -229,14 +500,24 @@ def list_markdown():
 
 @app.route('/api/markdown/<filename>', methods=['GET'])
 def get_markdown(filename):
-    """Get markdown file content"""
+    """
+    Get markdown file content
+
+    Returns JSON with content and metadata by default. With ?format=raw, or an
+    Accept header preferring text/markdown, the file itself is streamed from
+    disk (with conditional and range request support).
+    """
+    file_path = _check_filename(filename)
+    if _wants_raw_markdown():
+        return send_from_directory(MARKDOWN_DIR.resolve(), filename, mimetype='text/markdown', conditional=True)
     try:
-        file_path = Path(filename)
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            _forget_file(filename)
             return jsonify({'error': 'File not found'}), 404
 
-        content = file_path.read_text(encoding='utf-8')
-        stat = file_path.stat()
+        content = _read_cached_file(filename, stat)
 
         return jsonify({
             'filename': filename,
@@ -251,16 +532,32 @@ def get_markdown(filename):
 
 @app.route('/api/markdown/<filename>', methods=['PUT'])
 def update_markdown(filename):
-    """Update markdown file content"""
+    """
+    Update markdown file content
+
+    Accepts JSON ({"content": "..."}) or a raw text/markdown body, which is
+    copied to disk without being held in memory.
+    """
+    global _list_cache
+    file_path = _check_filename(filename)
     try:
-        data = request.get_json()
-        content = data.get('content')
+        if request.mimetype == 'text/markdown':
+            if not request.content_length:
+                return jsonify({'error': 'No content provided'}), 400
 
-        if not content:
-            return jsonify({'error': 'No content provided'}), 400
+            _forget_file(filename)
+            with open(file_path, 'wb', buffering=1 << 20) as f:
+                shutil.copyfileobj(request.stream, f, 1 << 20)
+        else:
+            data = request.get_json()
+            content = data.get('content')
 
-        file_path = Path(filename)
-        file_path.write_text(content, encoding='utf-8')
+            if not content:
+                return jsonify({'error': 'No content provided'}), 400
+
+            _forget_file(filename)
+            file_path.write_text(content, encoding='utf-8')
+        _list_cache = None
 
         return jsonify({
             'success': True,
@@ -275,13 +572,14 @@ def update_markdown(filename):
 @app.route('/api/markdown/<filename>', methods=['DELETE'])
 def delete_markdown(filename):
     """Delete markdown file"""
+    file_path = _check_filename(filename)
     try:
-        file_path = Path(filename)
-        if not file_path.exists():
+        _forget_file(filename)
+        try:
+            file_path.unlink()
+        except FileNotFoundError:
             return jsonify({'error': 'File not found'}), 404
 
-        file_path.unlink()
-
         return jsonify({
             'success': True,
             'message': f'File {filename} deleted successfully'
@@ -292,7 +590,7 @@ def delete_markdown(filename):
 
 
 @app.route('/api/upload-to-jira', methods=['POST'])
-def upload_to_jira():
+async def upload_to_jira():
     """
     Upload markdown to Jira
 
@@ -303,54 +601,58 @@ def upload_to_jira():
     """
     try:
         data = request.get_json(force=True, silent=True)
-        print(f"[DEBUG] Upload to Jira - Raw data: {data}")
+        logger.debug("Upload to Jira - raw data: %s", data)
 
         if not data:
-            print("[ERROR] No JSON data received")
+            logger.error("Upload to Jira - no JSON data received")
             return jsonify({'error': 'Invalid JSON data'}), 400
 
         filename = data.get('filename')
-        print(f"[DEBUG] Upload to Jira - Extracted filename: {filename}")
+        logger.debug("Upload to Jira - filename: %s", filename)
 
         if not filename:
-            print("[ERROR] Filename is None or empty")
+            logger.error("Upload to Jira - filename is missing or empty")
             return jsonify({'error': 'No filename provided'}), 400
+        if not isinstance(filename, str):
+            return jsonify({'error': 'filename must be a file name'}), 400
 
         # Validate Jira configuration
-        if not (config.jira_url and config.jira_email and config.jira_api_token):
+        if not config.has_jira:
             return jsonify({'error': 'Jira not configured. Please set JIRA_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env'}), 400
 
-        # Check if file exists
-        file_path = Path(filename)
-        if not file_path.exists():
-            return jsonify({'error': f'File not found: {filename}'}), 404
-
-        # Parse markdown back to TicketStructure
-        print(f"[DEBUG] Parsing markdown file: {filename}")
+        # Only listed generated markdown files may be uploaded
+        file_path = _check_filename(filename)
         try:
-            structure = parse_markdown(file_path)
-            print(f"[DEBUG] Parsed structure: {structure.count_total_items()} items")
-        except Exception as e:
-            print(f"[ERROR] Failed to parse markdown: {e}")
-            return jsonify({'error': f'Failed to parse markdown: {str(e)}'}), 400
-
-        # Initialize Jira client
-        print("[DEBUG] Initializing Jira client")
-        jira_client = JiraClient(
-            jira_url=config.jira_url,
-            email=config.jira_email,
-            api_token=config.jira_api_token
-        )
+            mtime = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            return jsonify({'error': f'File not found: {filename}'}), 404
 
-        # Test connection
-        print("[DEBUG] Testing Jira connection")
-        if not jira_client.test_connection():
-            return jsonify({'error': 'Failed to connect to Jira. Please check your credentials.'}), 400
+        # Reuse the structure from /api/parse if the file is untouched since;
+        # otherwise parse markdown back to TicketStructure
+        structure = _recall_structure(filename, mtime)
+        if structure is None:
+            logger.debug("Parsing markdown file %s", filename)
+            try:
+                structure = await asyncio.to_thread(parse_markdown, file_path)
+                logger.debug("Parsed structure: %d items", structure.count_total_items())
+            except Exception as e:
+                logger.error("Failed to parse markdown %s: %s", filename, e)
+                return jsonify({'error': f'Failed to parse markdown: {str(e)}'}), 400
 
         # Upload to Jira
-        print("[DEBUG] Uploading to Jira")
-        results = jira_client.upload_structure(structure)
-        print(f"[DEBUG] Upload results: {results}")
+        logger.debug("Uploading to Jira")
+        # No separate connection probe: bad credentials fail the first create call
+        try:
+            async with AsyncJiraClient(
+                config.jira_url, config.jira_email, config.jira_api_token,
+                max_concurrency=config.jira_max_concurrency,
+                api_version=config.jira_api_version
+            ) as jira_client:
+                results = await jira_client.upload_structure(structure)
+        except JiraAuthError as e:
+            logger.error("Upload to Jira failed: %s", e)
+            return jsonify({'error': 'Failed to connect to Jira. Please check your credentials.'}), 400
+        logger.debug("Upload results: %s", results)
 
         # Count created tickets
         total_created = (
@@ -366,10 +668,10 @@ def upload_to_jira():
             'results': results
         })
 
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"[ERROR] Upload failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Upload to Jira failed")
         return jsonify({'error': str(e)}), 500
 
 
@@ -400,4 +702,9 @@ if __name__ == '__main__':
 Press Ctrl+C to stop the server
     """)
 
+    if not debug_mode:
+        # The Werkzeug server still runs the app, but is not meant for production load
+        print("For production traffic, run the server under Gunicorn instead:")
+        print("   gunicorn -c gunicorn_conf.py app:app")
+
     app.run(debug=debug_mode, host='0.0.0.0', port=port)
@@ -5,7 +5,10 @@ Loads settings from .env file using python-dotenv
 """
 
 import os
-from typing import Optional, Literal
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Optional, Literal, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -14,102 +17,246 @@ load_dotenv()
 
 LLMProvider = Literal['openai', 'anthropic', 'ollama']
 
+# Sync LLM clients by provider, so their HTTP connection pools are reused
+_llm_clients: dict = {}
+_llm_clients_lock = threading.Lock()
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration"""
+    """
+    Application configuration
+
+    Built once from the environment by _load_config(). Derived values
+    (has_llm, has_jira, errors) are computed at construction, so request
+    handlers only read attributes.
+    """
 
     # Jira Configuration
-    jira_url: str = os.getenv('JIRA_URL', '')
-    jira_email: str = os.getenv('JIRA_EMAIL', '')
-    jira_api_token: str = os.getenv('JIRA_API_TOKEN', '')
-    jira_project: str = os.getenv('DEFAULT_PROJECT_KEY', '')
+    jira_url: str
+    jira_email: str
+    jira_api_token: str
+    jira_project: str
+    # Concurrent issue-creation requests per upload
+    jira_max_concurrency: int
+    # REST API version: 2 (plain-text descriptions) or 3 (ADF descriptions)
+    jira_api_version: int
 
     # LLM Configuration
-    llm_provider: LLMProvider = os.getenv('LLM_PROVIDER', 'openai').lower()  # type: ignore
-    openai_api_key: str = os.getenv('OPENAI_API_KEY', '')
-    anthropic_api_key: str = os.getenv('ANTHROPIC_API_KEY', '')
-    ollama_base_url: str = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
-    ollama_model: str = os.getenv('OLLAMA_MODEL', 'llama3:8b')
-    llm_model: str = os.getenv('LLM_MODEL', 'gpt-4-turbo')
-
-    @classmethod
-    def validate(cls) -> list[str]:
-        """
-        Validate required configuration
+    llm_provider: LLMProvider
+    openai_api_key: str
+    anthropic_api_key: str
+    ollama_base_url: str
+    ollama_model: str
+    llm_model: str
+    # Provider-enforced JSON schema output (OpenAI json_schema / Anthropic tool use).
+    # Needs a model that supports it, e.g. gpt-4o-2024-08-06 or later, or any Claude 3 model.
+    llm_structured_output: bool
+    # Async LLM request limits (per process); 0 requests per minute disables rate limiting
+    llm_max_concurrency: int
+    llm_requests_per_minute: int
 
-        Returns:
-            List of validation errors (empty if valid)
-        """
+    # Derived settings
+    has_llm: bool = field(init=False)
+    has_jira: bool = field(init=False)
+    errors: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'has_llm', self._check_llm())
+        object.__setattr__(self, 'has_jira', bool(self.jira_url and self.jira_email and self.jira_api_token))
+        object.__setattr__(self, 'errors', tuple(self._collect_errors()))
+
+    def _check_llm(self) -> bool:
+        """Check whether the configured provider has its credentials/URL set"""
+        if self.llm_provider == 'openai':
+            return bool(self.openai_api_key)
+        elif self.llm_provider == 'anthropic':
+            return bool(self.anthropic_api_key)
+        elif self.llm_provider == 'ollama':
+            return bool(self.ollama_base_url)
+        return False
+
+    def _collect_errors(self) -> list[str]:
+        """Collect configuration problems (see validate())"""
         errors = []
 
         # Check Jira config
-        if not cls.jira_url:
+        if not self.jira_url:
             errors.append("JIRA_URL not set in .env")
-        if not cls.jira_email:
+        if not self.jira_email:
             errors.append("JIRA_EMAIL not set in .env")
-        if not cls.jira_api_token:
+        if not self.jira_api_token:
             errors.append("JIRA_API_TOKEN not set in .env")
 
         # Check LLM config
-        if cls.llm_provider == 'openai' and not cls.openai_api_key:
+        if self.llm_provider == 'openai' and not self.openai_api_key:
             errors.append("OPENAI_API_KEY not set in .env (LLM_PROVIDER=openai)")
-        elif cls.llm_provider == 'anthropic' and not cls.anthropic_api_key:
+        elif self.llm_provider == 'anthropic' and not self.anthropic_api_key:
             errors.append("ANTHROPIC_API_KEY not set in .env (LLM_PROVIDER=anthropic)")
-        elif cls.llm_provider == 'ollama' and not cls.ollama_base_url:
+        elif self.llm_provider == 'ollama' and not self.ollama_base_url:
             errors.append("OLLAMA_BASE_URL not set in .env (LLM_PROVIDER=ollama)")
 
-        if cls.llm_provider not in ['openai', 'anthropic', 'ollama']:
-            errors.append(f"Invalid LLM_PROVIDER: {cls.llm_provider} (must be 'openai', 'anthropic', or 'ollama')")
+        if self.llm_provider not in ['openai', 'anthropic', 'ollama']:
+            errors.append(f"Invalid LLM_PROVIDER: {self.llm_provider} (must be 'openai', 'anthropic', or 'ollama')")
 
         return errors
 
-    @classmethod
-    def get_llm_client(cls):
+    def validate(self) -> list[str]:
+        """
+        Validate required configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        return list(self.errors)
+
+    def get_llm_client(self):
         """
         Get initialized LLM client based on provider
 
+        The client is built once per provider and reused, so keep-alive
+        connections survive across requests.
+
         Returns:
             OpenAI, Anthropic, or Ollama client instance
         """
-        if cls.llm_provider == 'openai':
+        client = _llm_clients.get(self.llm_provider)
+        if client is None:
+            with _llm_clients_lock:
+                client = _llm_clients.get(self.llm_provider)
+                if client is None:
+                    client = self._build_llm_client()
+                    _llm_clients[self.llm_provider] = client
+        return client
+
+    def _build_llm_client(self):
+        """Construct a new sync LLM client for the configured provider"""
+        if self.llm_provider == 'openai':
             try:
                 from openai import OpenAI
-                return OpenAI(api_key=cls.openai_api_key)
+                return OpenAI(api_key=self.openai_api_key)
             except ImportError:
                 raise ImportError("openai package not installed. Run: pip install openai")
 
-        elif cls.llm_provider == 'anthropic':
+        elif self.llm_provider == 'anthropic':
             try:
                 from anthropic import Anthropic
-                return Anthropic(api_key=cls.anthropic_api_key)
+                return Anthropic(api_key=self.anthropic_api_key)
             except ImportError:
                 raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
-        elif cls.llm_provider == 'ollama':
+        elif self.llm_provider == 'ollama':
             try:
                 from openai import OpenAI
                 # Ollama uses OpenAI-compatible API
                 return OpenAI(
-                    base_url=cls.ollama_base_url + '/v1',
+                    base_url=self.ollama_base_url + '/v1',
                     api_key='ollama'  # Ollama doesn't require a real API key
                 )
             except ImportError:
                 raise ImportError("openai package not installed. Run: pip install openai")
 
         else:
-            raise ValueError(f"Invalid LLM provider: {cls.llm_provider}")
+            raise ValueError(f"Invalid LLM provider: {self.llm_provider}")
+
+    def get_async_llm_client(self, http_client=None):
+        """
+        Get initialized async LLM client based on provider
+
+        Args:
+            http_client: Shared httpx.AsyncClient to send requests through (optional)
+
+        Returns:
+            AsyncOpenAI or AsyncAnthropic client instance
+        """
+        if self.llm_provider == 'openai':
+            try:
+                from openai import AsyncOpenAI
+                return AsyncOpenAI(api_key=self.openai_api_key, http_client=http_client)
+            except ImportError:
+                raise ImportError("openai package not installed. Run: pip install openai")
+
+        elif self.llm_provider == 'anthropic':
+            try:
+                from anthropic import AsyncAnthropic
+                return AsyncAnthropic(api_key=self.anthropic_api_key, http_client=http_client)
+            except ImportError:
+                raise ImportError("anthropic package not installed. Run: pip install anthropic")
+
+        elif self.llm_provider == 'ollama':
+            try:
+                from openai import AsyncOpenAI
+                # Ollama uses OpenAI-compatible API
+                return AsyncOpenAI(
+                    base_url=self.ollama_base_url + '/v1',
+                    api_key='ollama',  # Ollama doesn't require a real API key
+                    http_client=http_client
+                )
+            except ImportError:
+                raise ImportError("openai package not installed. Run: pip install openai")
+
+        else:
+            raise ValueError(f"Invalid LLM provider: {self.llm_provider}")
 
-    @classmethod
-    def has_llm_configured(cls) -> bool:
+    def has_llm_configured(self) -> bool:
         """Check if LLM is properly configured"""
-        if cls.llm_provider == 'openai':
-            return bool(cls.openai_api_key)
-        elif cls.llm_provider == 'anthropic':
-            return bool(cls.anthropic_api_key)
-        elif cls.llm_provider == 'ollama':
-            return bool(cls.ollama_base_url)
-        return False
+        return self.has_llm
+
+    @contextmanager
+    def override(self, **changes):
+        """
+        Temporarily change settings on this instance
+
+        Meant for scripts and self-tests that must steer code reading the
+        shared config singleton (e.g. to force LLM_PROVIDER=ollama). The
+        previous values are restored on exit, even if the block raises.
+        Not thread-safe: request handlers must never call it.
+
+        Args:
+            **changes: Setting names and their temporary values
+
+        Raises:
+            AttributeError: If a name is not a setting or is a derived value
+        """
+        derived = {f.name for f in fields(self) if not f.init}
+        for name in changes:
+            if name in derived or not hasattr(self, name):
+                raise AttributeError(f"Cannot override config setting: {name}")
+
+        previous = {name: getattr(self, name) for name in changes}
+        self._assign(changes)
+        try:
+            yield self
+        finally:
+            self._assign(previous)
+
+    def _assign(self, values: dict) -> None:
+        """Set fields on the frozen instance and recompute derived settings"""
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        self.__post_init__()
+
+
+def _load_config() -> Config:
+    """Read configuration from the environment (and .env) once"""
+    return Config(
+        jira_url=os.getenv('JIRA_URL', ''),
+        jira_email=os.getenv('JIRA_EMAIL', ''),
+        jira_api_token=os.getenv('JIRA_API_TOKEN', ''),
+        jira_project=os.getenv('DEFAULT_PROJECT_KEY', ''),
+        jira_max_concurrency=int(os.getenv('JIRA_MAX_CONCURRENCY', '32')),
+        jira_api_version=int(os.getenv('JIRA_API_VERSION', '2')),
+        llm_provider=os.getenv('LLM_PROVIDER', 'openai').lower(),  # type: ignore
+        openai_api_key=os.getenv('OPENAI_API_KEY', ''),
+        anthropic_api_key=os.getenv('ANTHROPIC_API_KEY', ''),
+        ollama_base_url=os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434'),
+        ollama_model=os.getenv('OLLAMA_MODEL', 'llama3:8b'),
+        llm_model=os.getenv('LLM_MODEL', 'gpt-4-turbo'),
+        llm_structured_output=os.getenv('LLM_STRUCTURED_OUTPUT', 'false').lower() == 'true',
+        llm_max_concurrency=int(os.getenv('LLM_MAX_CONCURRENCY', '10')),
+        llm_requests_per_minute=int(os.getenv('LLM_REQUESTS_PER_MINUTE', '0'))
+    )
 
 
 # Singleton instance
-config = Config()
+config = _load_config()
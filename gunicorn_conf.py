@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for running the web server in production
+
+Usage:
+    gunicorn -c gunicorn_conf.py app:app
+
+The app is a WSGI Flask app whose async views run on a per-request event
+loop, so threaded workers give request-level concurrency: while one
+thread waits on an LLM round trip, the others keep serving.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5010')}"
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# LLM extraction + review can take well over the 30s default
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Keep worker heartbeat files in memory instead of on disk where available
+if Path('/dev/shm').is_dir():
+    worker_tmp_dir = '/dev/shm'
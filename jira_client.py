@@ -4,15 +4,482 @@ Jira API Client
 Handles uploading tickets to Jira via REST API
 """
 
+import asyncio
+import difflib
+import logging
+import os
+import random
+import threading
+import time
+import orjson
 import requests
-from typing import List, Dict, Optional
+from datetime import datetime
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Iterable, List, Dict, Optional, Tuple
 from models import TicketStructure, Epic, Task, Bug, UserStory
 
+logger = logging.getLogger(__name__)
+
+
+class JiraAuthError(Exception):
+    """Jira rejected the configured credentials (HTTP 401/403)"""
+
+
+# Created issue key, or None plus a failure record (see _failure)
+CreateResult = Tuple[Optional[str], Optional[dict]]
+
+
+# Throttled (429) and unavailable (503) mean the issue was not created, so the
+# POST can be retried; 502/504 could arrive after creation and are not retried
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_ATTEMPTS = 5
+_BACKOFF_MAX = 60.0
+# Jira's limit on issues per POST /rest/api/{version}/issue/bulk
+BULK_BATCH_SIZE = 50
+
+METADATA_CACHE_PATH = Path.home() / '.cache' / 'jira_gen' / 'metadata.json'
+METADATA_TTL = 300  # seconds
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt (1-based), with jitter"""
+    return min(2 ** attempt + random.random(), _BACKOFF_MAX)
+
+
+def _rate_limit_delay(headers) -> Optional[float]:
+    """
+    Seconds Jira asks clients to wait, from Retry-After or an exhausted X-RateLimit window
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Delay in seconds, or None if Jira gave no rate limit hint
+    """
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+    reset = headers.get('X-RateLimit-Reset')
+    if reset and headers.get('X-RateLimit-Remaining') == '0':
+        # Python < 3.11 fromisoformat() rejects the UTC designator "Z"
+        if reset.endswith('Z'):
+            reset = reset[:-1] + '+00:00'
+        try:
+            return max(datetime.fromisoformat(reset).timestamp() - time.time(), 0.0)
+        except ValueError:
+            pass
+    return None
+
+
+def _failure(payload: dict, status: Optional[int], error: Any) -> dict:
+    """
+    Record an issue Jira did not create, with everything needed to retry it
+
+    Args:
+        payload: Issue creation payload
+        status: HTTP status, or None if no response was received
+        error: Jira's error details or an error message
+
+    Returns:
+        JSON-serializable {'payload', 'error', 'status'} dict
+    """
+    return {'payload': payload, 'error': error, 'status': status}
+
+
+def _bulk_results(body: dict, payloads: List[dict], status: int) -> List[CreateResult]:
+    """
+    Map a bulk create response back onto the positions of its payloads
+
+    Jira lists created issues in request order, skipping failed elements,
+    which are reported by index in errors[*].failedElementNumber.
+
+    Args:
+        body: Decoded bulk create response
+        payloads: Payloads sent in the request
+        status: HTTP status of the response
+
+    Returns:
+        Create result for each payload
+    """
+    errors = {error.get('failedElementNumber'): error.get('elementErrors') for error in body.get('errors', [])}
+    created = iter(body.get('issues', []))
+
+    results = []
+    for i, payload in enumerate(payloads):
+        if i in errors:
+            logger.warning("Failed to create issue '%s': %s", payload['fields']['summary'], errors[i])
+            results.append((None, _failure(payload, status, errors[i])))
+        else:
+            results.append((next(created, {}).get('key'), None))
+    return results
+
+
+def _orphaned_tasks(structure: TicketStructure, epic_results: List[CreateResult]) -> List[CreateResult]:
+    """
+    Failure records for the tasks of epics that were not created
+
+    Each record refers to its epic's failure record under 'parent_failure',
+    which _link_parents() turns into a 'parent_index' once the failed list
+    is built.
+    """
+    project_key = structure.project_key
+    return [
+        (None, {
+            **_failure(_task_payload(task, project_key), None, 'Parent epic was not created'),
+            'parent_failure': epic_failure
+        })
+        for epic, (epic_key, epic_failure) in zip(structure.epics, epic_results) if not epic_key
+        for task in epic.tasks
+    ]
+
+
+def _link_parents(failed: List[dict]) -> List[dict]:
+    """
+    Replace each record's in-memory 'parent_failure' with 'parent_index'
+
+    'parent_index' is the position of the parent epic's record in failed, so
+    the link survives the JSON round trip through the --retry file and
+    retry_failed() can parent the task to the re-created epic.
+
+    Args:
+        failed: Failure records, modified in place
+
+    Returns:
+        failed
+    """
+    positions = {id(failure): i for i, failure in enumerate(failed)}
+    for failure in failed:
+        parent = failure.pop('parent_failure', None)
+        if parent is not None and id(parent) in positions:
+            failure['parent_index'] = positions[id(parent)]
+    return failed
+
+
+def _task_payloads(structure: TicketStructure, epic_keys: List[Optional[str]]) -> List[dict]:
+    """
+    Build task payloads parented to their created epics
+
+    Args:
+        structure: TicketStructure being uploaded
+        epic_keys: Created key (or None) for each epic in structure.epics
+
+    Returns:
+        Payloads for the tasks of every created epic, in input order
+    """
+    project_key = structure.project_key
+    return [
+        _task_payload(task, project_key, epic_key)
+        for epic, epic_key in zip(structure.epics, epic_keys) if epic_key
+        for task in epic.tasks
+    ]
+
+
+def _upload_payloads(structure: TicketStructure, epic_keys: List[Optional[str]]) -> List[tuple]:
+    """
+    Build (result name, payload) pairs for everything created after the epics
+
+    Args:
+        structure: TicketStructure being uploaded
+        epic_keys: Created key (or None) for each epic in structure.epics
+
+    Returns:
+        Tasks of created epics, then bugs, then stories, in input order
+    """
+    project_key = structure.project_key
+    items = [('tasks', payload) for payload in _task_payloads(structure, epic_keys)]
+    items.extend(('bugs', _bug_payload(bug, project_key)) for bug in structure.bugs)
+    items.extend(('stories', _story_payload(story, project_key)) for story in structure.stories)
+    return items
+
+
+def _group_results(named_results: Iterable[Tuple[str, CreateResult]]) -> Dict[str, list]:
+    """
+    Group created keys by issue kind and collect failures for a later retry
+
+    Args:
+        named_results: (result name, create result) pairs in input order
+
+    Returns:
+        Upload results dict (see JiraClient.upload_structure)
+    """
+    results = {
+        'epics': [],
+        'tasks': [],
+        'bugs': [],
+        'stories': [],
+        'failed': []
+    }
+    for name, (key, failure) in named_results:
+        if key:
+            results[name].append(key)
+        elif failure:
+            results['failed'].append(failure)
+    _link_parents(results['failed'])
+    return results
+
+
+def _suggestion(value: str, choices: List[str]) -> str:
+    """' (did you mean ...?)' for the closest of choices, or '' if none is close"""
+    matches = difflib.get_close_matches(value, choices, n=1) or \
+        difflib.get_close_matches(value.lower(), [choice.lower() for choice in choices], n=1)
+    if not matches:
+        return ''
+    match = next(choice for choice in choices if choice.lower() == matches[0].lower())
+    return f" (did you mean '{match}'?)"
+
+
+class MetadataCache:
+    """
+    On-disk TTL cache for slow-changing Jira metadata
+
+    Entries are grouped per account (Jira URL and email) in one JSON file,
+    so repeated CLI runs skip the lookups while the entries are fresh.
+    """
+
+    def __init__(self, path: Path = METADATA_CACHE_PATH, ttl: float = METADATA_TTL):
+        """
+        Args:
+            path: JSON file to store entries in (created on first write)
+            ttl: Seconds an entry stays valid
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def _load(self) -> dict:
+        try:
+            return orjson.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, account: str, name: str, max_age: Optional[float] = None):
+        """
+        Get a cached value, or None if missing or older than max_age (default: ttl)
+
+        Args:
+            account: Account key (see JiraClient)
+            name: Entry name, e.g. 'myself' or 'createmeta:PROJ'
+            max_age: Maximum entry age in seconds
+        """
+        entry = self._load().get(account, {}).get(name)
+        if entry is None:
+            return None
+        if time.time() - entry['timestamp'] >= (self.ttl if max_age is None else max_age):
+            return None
+        return entry['value']
+
+    def set(self, account: str, name: str, value) -> None:
+        """Store a JSON-serializable value, ignoring an unwritable cache directory"""
+        data = self._load()
+        data.setdefault(account, {})[name] = {'timestamp': time.time(), 'value': value}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(data))
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def delete(self, account: str, name: str) -> None:
+        """Drop an entry if present"""
+        data = self._load()
+        if data.get(account, {}).pop(name, None) is not None:
+            try:
+                self.path.write_bytes(orjson.dumps(data))
+            except OSError:
+                pass
+
+
+class RateLimiter:
+    """
+    Shared gate that holds back every request until Jira's rate limit resets
+
+    A 429 on one request defers all of them, instead of each coroutine
+    discovering the limit with its own failed request.
+    """
+
+    def __init__(self):
+        self._next_allowed = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until requests are allowed again"""
+        delay = self._next_allowed - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def defer(self, seconds: float) -> None:
+        """Hold back requests for at least seconds from now"""
+        self._next_allowed = max(self._next_allowed, time.monotonic() + seconds)
+
+
+def _adf(text: str) -> dict:
+    """
+    Wrap plain text in a single-paragraph Atlassian Document Format document
+
+    Args:
+        text: Description text
+
+    Returns:
+        ADF dict for an issue's description field
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+    }
+
+
+def _prepare_payload(payload: dict, api_version: int) -> dict:
+    """
+    Adapt a payload built by the _*_payload helpers to the REST API version
+
+    v2 takes the plain-text description as is; v3 requires it as an ADF
+    document.
+
+    Args:
+        payload: Issue creation payload with a plain-text description
+        api_version: Jira REST API version (2 or 3)
+
+    Returns:
+        Payload to send
+    """
+    if api_version == 2:
+        return payload
+    fields = payload['fields']
+    return {**payload, 'fields': {**fields, 'description': _adf(fields['description'])}}
+
+
+def _bullets(items: List[str]) -> str:
+    """Format items as a markdown bullet list"""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _epic_payload(epic: Epic, project_key: str) -> dict:
+    """Build the issue creation payload for an epic"""
+    if epic.business_value:
+        description = f"{epic.description}\n\n**Business Value**: {epic.business_value}"
+    else:
+        description = epic.description
+
+    payload = {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": epic.title,
+            "description": description,
+            "issuetype": {"name": "Epic"},
+            "priority": {"name": epic.priority}
+        }
+    }
+
+    return payload
+
+
+def _task_payload(task: Task, project_key: str, epic_key: Optional[str] = None) -> dict:
+    """Build the issue creation payload for a task"""
+    # Build description with acceptance criteria
+    sections = [task.description]
+    if task.acceptance_criteria:
+        sections.append(f"\n\n**Acceptance Criteria**:\n{_bullets(task.acceptance_criteria)}")
+    if task.technical_notes:
+        sections.append(f"\n\n**Technical Notes**: {task.technical_notes}")
+
+    payload = {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": task.title,
+            "description": "\n".join(sections),
+            "issuetype": {"name": "Task"},
+            "priority": {"name": task.priority}
+        }
+    }
+
+    # Link to epic if provided
+    if epic_key:
+        payload["fields"]["parent"] = {"key": epic_key}
+
+    return payload
+
+
+def _bug_payload(bug: Bug, project_key: str) -> dict:
+    """Build the issue creation payload for a bug"""
+    # Build comprehensive description
+    sections = [bug.description]
+    if bug.reproduction_steps:
+        steps = "\n".join(f"{i}. {step}" for i, step in enumerate(bug.reproduction_steps, 1))
+        sections.append(f"\n\n**Reproduction Steps**:\n{steps}")
+
+    if bug.environment:
+        env = bug.environment
+        sections.append("\n\n**Environment**:")
+        sections.extend(
+            f"- {label}: {value}"
+            for label, value in (("Browser", env.browser), ("OS", env.os), ("Device", env.device))
+            if value
+        )
+
+    if bug.technical_details and bug.technical_details.error_message:
+        sections.append(f"\n\n**Error**: {bug.technical_details.error_message}")
+    if bug.acceptance_criteria:
+        sections.append(f"\n\n**Fix Verification**:\n{_bullets(bug.acceptance_criteria)}")
+
+    payload = {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": bug.summary,
+            "description": "\n".join(sections),
+            "issuetype": {"name": "Bug"},
+            "priority": {"name": bug.priority}
+        }
+    }
+
+    return payload
+
+
+def _story_payload(story: UserStory, project_key: str) -> dict:
+    """Build the issue creation payload for a user story"""
+    # Build description in user story format
+    sections = [
+        f"**As a**: {story.as_a}",
+        f"**I want to**: {story.i_want_to}",
+        f"**So that**: {story.so_that}"
+    ]
+    if story.acceptance_criteria:
+        sections.append(f"\n**Acceptance Criteria**:\n{_bullets(story.acceptance_criteria)}")
+    if story.technical_notes:
+        sections.append(f"\n**Technical Notes**: {story.technical_notes}")
+    if story.estimated_effort:
+        sections.append(f"\n**Estimated Effort**: {story.estimated_effort}")
+
+    payload = {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": story.title,
+            "description": "\n".join(sections),
+            "issuetype": {"name": "Story"},
+            "priority": {"name": story.priority}
+        }
+    }
+
+    return payload
+
 
 class JiraClient:
     """Client for interacting with Jira REST API"""
 
-    def __init__(self, jira_url: str, email: str, api_token: str):
+    def __init__(
+        self,
+        jira_url: str,
+        email: str,
+        api_token: str,
+        cache: Optional[MetadataCache] = None,
+        api_version: int = 2
+    ):
         """
         Initialize Jira client
 
@@ -20,8 +487,13 @@ class JiraClient:
             jira_url: Jira instance URL (e.g., https://your-domain.atlassian.net)
             email: User email for authentication
             api_token: Jira API token
+            cache: Metadata cache (defaults to METADATA_CACHE_PATH)
+            api_version: REST API version; 2 sends descriptions as plain
+                strings, 3 as ADF documents
         """
         self.jira_url = jira_url.rstrip('/')
+        self.api_version = api_version
+        self.api_url = f"{self.jira_url}/rest/api/{api_version}"
         self.email = email
         self.api_token = api_token
         self.auth = (email, api_token)
@@ -29,73 +501,213 @@ class JiraClient:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
+        self.cache = cache if cache is not None else MetadataCache()
+        self._cache_account = f"{self.jira_url}|{email}"
+        # Per-client memo, so unavailable metadata is not refetched for every issue
+        self._createmeta: Dict[str, Optional[dict]] = {}
+
+        # One keep-alive connection pool for every request. Connection errors
+        # are retried for all methods; status retries only apply to
+        # idempotent methods, so a POST is never sent twice.
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-    def test_connection(self) -> bool:
+    def __enter__(self) -> 'JiraClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+    def test_connection(self, max_age: Optional[float] = None) -> bool:
         """
         Test Jira API connection
 
+        A successful /myself response is cached on disk, so runs within the
+        cache TTL skip the round trip.
+
+        Args:
+            max_age: Reuse a successful result from the last max_age seconds
+                (default: the cache TTL; 0 always probes)
+
         Returns:
             True if connection successful, False otherwise
         """
+        if self.cache.get(self._cache_account, 'myself', max_age) is not None:
+            return True
+
         try:
-            response = requests.get(
-                f"{self.jira_url}/rest/api/3/myself",
-                auth=self.auth,
-                headers=self.headers,
+            response = self.session.get(f"{self.api_url}/myself", timeout=10)
+        except Exception:
+            return False
+
+        if response.status_code != 200:
+            self.cache.delete(self._cache_account, 'myself')
+            return False
+        self.cache.set(self._cache_account, 'myself', orjson.loads(response.content).get('accountId', ''))
+        return True
+
+    def get_createmeta(self, project_key: str) -> Optional[Dict[str, List[str]]]:
+        """
+        Get the issue type and priority names available in a project (cached)
+
+        Args:
+            project_key: Jira project key
+
+        Returns:
+            {'issue_types': [...], 'priorities': [...]}, or None if the
+            metadata could not be fetched
+        """
+        if project_key not in self._createmeta:
+            self._createmeta[project_key] = self._fetch_createmeta(project_key)
+        return self._createmeta[project_key]
+
+    def _fetch_createmeta(self, project_key: str) -> Optional[Dict[str, List[str]]]:
+        """Read createmeta from the disk cache, or fetch and cache it"""
+        name = f"createmeta:{project_key}"
+        meta = self.cache.get(self._cache_account, name)
+        if meta is not None:
+            return meta
+
+        try:
+            types_response = self.session.get(
+                f"{self.api_url}/issue/createmeta/{project_key}/issuetypes",
                 timeout=10
             )
-            return response.status_code == 200
+            priorities_response = self.session.get(f"{self.api_url}/priority", timeout=10)
         except Exception:
-            return False
+            return None
+        if types_response.status_code != 200 or priorities_response.status_code != 200:
+            return None
+
+        try:
+            types_body = orjson.loads(types_response.content)
+            issue_types = types_body.get('issueTypes', types_body.get('values', []))
+            meta = {
+                'issue_types': [issue_type['name'] for issue_type in issue_types],
+                'priorities': [priority['name'] for priority in orjson.loads(priorities_response.content)]
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        if not meta['issue_types']:
+            # An unexpected response shape must not reject every issue
+            return None
+        self.cache.set(self._cache_account, name, meta)
+        return meta
+
+    def _validate_fields(self, payload: dict) -> None:
+        """
+        Check a payload's issue type and priority against the project metadata
+
+        Skipped when the metadata is unavailable, so Jira has the final say.
+
+        Args:
+            payload: Issue creation payload
+
+        Raises:
+            ValueError: If Jira would reject the issue type or priority,
+                naming the closest valid value
+        """
+        fields = payload['fields']
+        project_key = fields['project']['key']
+        meta = self.get_createmeta(project_key)
+        if meta is None:
+            return
+
+        issue_type = fields['issuetype']['name']
+        if issue_type not in meta['issue_types']:
+            raise ValueError(
+                f"Issue type '{issue_type}' is not available in project {project_key}"
+                + _suggestion(issue_type, meta['issue_types'])
+            )
+        priority = fields.get('priority', {}).get('name')
+        if priority and priority not in meta['priorities']:
+            raise ValueError(
+                f"Priority '{priority}' is not defined in Jira"
+                + _suggestion(priority, meta['priorities'])
+            )
 
     def upload_structure(self, structure: TicketStructure) -> Dict[str, List[str]]:
         """
         Upload entire ticket structure to Jira
 
+        Issues are created with the bulk endpoint in two phases: all epics,
+        then all tasks (parented to the new epic keys), bugs and stories.
+        Keys are returned in input order.
+
         Args:
             structure: TicketStructure to upload
 
         Returns:
-            Dict with created ticket keys:
+            Dict with created ticket keys, and failure records that
+            retry_failed() accepts:
             {
                 'epics': ['PROJ-1', 'PROJ-2'],
                 'tasks': ['PROJ-3', 'PROJ-4'],
                 'bugs': ['PROJ-5'],
-                'stories': ['PROJ-6']
+                'stories': ['PROJ-6'],
+                'failed': [{'payload': {...}, 'error': ..., 'status': 400}]
             }
         """
-        results = {
-            'epics': [],
-            'tasks': [],
-            'bugs': [],
-            'stories': []
-        }
+        project_key = structure.project_key
+        epic_results = self._bulk_create_issues([_epic_payload(epic, project_key) for epic in structure.epics])
+        epic_keys = [key for key, _ in epic_results]
 
-        # Upload epics and tasks
-        for epic in structure.epics:
-            epic_key = self.create_epic(epic, structure.project_key)
-            if epic_key:
-                results['epics'].append(epic_key)
-
-                # Upload tasks under epic
-                for task in epic.tasks:
-                    task_key = self.create_task(task, structure.project_key, epic_key)
-                    if task_key:
-                        results['tasks'].append(task_key)
-
-        # Upload bugs
-        for bug in structure.bugs:
-            bug_key = self.create_bug(bug, structure.project_key)
-            if bug_key:
-                results['bugs'].append(bug_key)
-
-        # Upload stories
-        for story in structure.stories:
-            story_key = self.create_story(story, structure.project_key)
-            if story_key:
-                results['stories'].append(story_key)
+        items = _upload_payloads(structure, epic_keys)
+        item_results = self._bulk_create_issues([payload for _, payload in items])
 
-        return results
+        return _group_results([
+            *(('epics', result) for result in epic_results),
+            *((name, result) for (name, _), result in zip(items, item_results)),
+            *(('tasks', result) for result in _orphaned_tasks(structure, epic_results))
+        ])
+
+    def retry_failed(self, failed: List[dict]) -> Dict[str, list]:
+        """
+        Retry issues from the 'failed' list of an earlier upload in bulk
+
+        Records without a 'parent_index' (epics among them) are created
+        first; then the tasks of epics that had failed are created under
+        their epic's new key. Tasks whose epic fails again stay linked to
+        it in the returned failure records.
+
+        Args:
+            failed: Failure records from upload_structure()
+
+        Returns:
+            {'created': [keys], 'failed': [failure records still failing]}
+        """
+        first = [i for i, failure in enumerate(failed) if 'parent_index' not in failure]
+        results = dict(zip(first, self._bulk_create_issues([failed[i]['payload'] for i in first])))
+
+        ready = []
+        for i, failure in enumerate(failed):
+            if i in results:
+                continue
+            parent_key, parent_failure = results.get(failure['parent_index'], (None, None))
+            record = {name: value for name, value in failure.items() if name != 'parent_index'}
+            if parent_key:
+                payload = record['payload']
+                ready.append((i, {**payload, 'fields': {**payload['fields'], 'parent': {'key': parent_key}}}))
+            else:
+                results[i] = (None, {**record, 'parent_failure': parent_failure})
+
+        ready_results = self._bulk_create_issues([payload for _, payload in ready])
+        results.update((i, result) for (i, _), result in zip(ready, ready_results))
+
+        ordered = [results[i] for i in range(len(failed))]
+        return {
+            'created': [key for key, _ in ordered if key],
+            'failed': _link_parents([failure for _, failure in ordered if failure])
+        }
 
     def create_epic(self, epic: Epic, project_key: str) -> Optional[str]:
         """
@@ -108,32 +720,7 @@ class JiraClient:
         Returns:
             Created epic key (e.g., 'PROJ-123') or None if failed
         """
-        description = epic.description
-        if epic.business_value:
-            description += f"\n\n**Business Value**: {epic.business_value}"
-
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": epic.title,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": description}
-                            ]
-                        }
-                    ]
-                },
-                "issuetype": {"name": "Epic"},
-                "priority": {"name": epic.priority}
-            }
-        }
-
-        return self._create_issue(payload)
+        return self._create_issue(_epic_payload(epic, project_key))[0]
 
     def create_task(self, task: Task, project_key: str, epic_key: Optional[str] = None) -> Optional[str]:
         """
@@ -147,45 +734,7 @@ class JiraClient:
         Returns:
             Created task key or None if failed
         """
-        # Build description with acceptance criteria
-        description_parts = [task.description]
-
-        if task.acceptance_criteria:
-            description_parts.append("\n\n**Acceptance Criteria**:")
-            for ac in task.acceptance_criteria:
-                description_parts.append(f"- {ac}")
-
-        if task.technical_notes:
-            description_parts.append(f"\n\n**Technical Notes**: {task.technical_notes}")
-
-        description = "\n".join(description_parts)
-
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": task.title,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": description}
-                            ]
-                        }
-                    ]
-                },
-                "issuetype": {"name": "Task"},
-                "priority": {"name": task.priority}
-            }
-        }
-
-        # Link to epic if provided
-        if epic_key:
-            payload["fields"]["parent"] = {"key": epic_key}
-
-        return self._create_issue(payload)
+        return self._create_issue(_task_payload(task, project_key, epic_key))[0]
 
     def create_bug(self, bug: Bug, project_key: str) -> Optional[str]:
         """
@@ -198,56 +747,7 @@ class JiraClient:
         Returns:
             Created bug key or None if failed
         """
-        # Build comprehensive description
-        description_parts = [bug.description]
-
-        if bug.reproduction_steps:
-            description_parts.append("\n\n**Reproduction Steps**:")
-            for i, step in enumerate(bug.reproduction_steps, 1):
-                description_parts.append(f"{i}. {step}")
-
-        if bug.environment:
-            env = bug.environment
-            description_parts.append("\n\n**Environment**:")
-            if env.browser:
-                description_parts.append(f"- Browser: {env.browser}")
-            if env.os:
-                description_parts.append(f"- OS: {env.os}")
-            if env.device:
-                description_parts.append(f"- Device: {env.device}")
-
-        if bug.technical_details and bug.technical_details.error_message:
-            description_parts.append(f"\n\n**Error**: {bug.technical_details.error_message}")
-
-        if bug.acceptance_criteria:
-            description_parts.append("\n\n**Fix Verification**:")
-            for ac in bug.acceptance_criteria:
-                description_parts.append(f"- {ac}")
-
-        description = "\n".join(description_parts)
-
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": bug.summary,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": description}
-                            ]
-                        }
-                    ]
-                },
-                "issuetype": {"name": "Bug"},
-                "priority": {"name": bug.priority}
-            }
-        }
-
-        return self._create_issue(payload)
+        return self._create_issue(_bug_payload(bug, project_key))[0]
 
     def create_story(self, story: UserStory, project_key: str) -> Optional[str]:
         """
@@ -260,53 +760,9 @@ class JiraClient:
         Returns:
             Created story key or None if failed
         """
-        # Build description in user story format
-        description_parts = [
-            f"**As a**: {story.as_a}",
-            f"**I want to**: {story.i_want_to}",
-            f"**So that**: {story.so_that}"
-        ]
-
-        if story.acceptance_criteria:
-            description_parts.append("\n**Acceptance Criteria**:")
-            for ac in story.acceptance_criteria:
-                description_parts.append(f"- {ac}")
-
-        if story.definition_of_done:
-            description_parts.append("\n**Definition of Done**:")
-            for dod in story.definition_of_done:
-                description_parts.append(f"- {dod}")
-
-        description = "\n".join(description_parts)
-
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": story.title,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": description}
-                            ]
-                        }
-                    ]
-                },
-                "issuetype": {"name": "Story"},
-                "priority": {"name": story.priority}
-            }
-        }
-
-        # Add story points if provided
-        if story.story_points:
-            payload["fields"]["customfield_10016"] = story.story_points  # Story points field
+        return self._create_issue(_story_payload(story, project_key))[0]
 
-        return self._create_issue(payload)
-
-    def _create_issue(self, payload: dict) -> Optional[str]:
+    def _create_issue(self, payload: dict) -> CreateResult:
         """
         Create issue in Jira via REST API
 
@@ -314,24 +770,296 @@ class JiraClient:
             payload: Issue creation payload
 
         Returns:
-            Created issue key or None if failed
+            (created issue key, None), or (None, failure record) if failed
+
+        Raises:
+            JiraAuthError: If Jira rejects the credentials
         """
         try:
-            response = requests.post(
-                f"{self.jira_url}/rest/api/3/issue",
-                json=payload,
-                auth=self.auth,
-                headers=self.headers,
+            self._validate_fields(payload)
+        except ValueError as e:
+            logger.warning("Skipping issue '%s': %s", payload['fields']['summary'], e)
+            return None, _failure(payload, None, str(e))
+
+        try:
+            response = self.session.post(
+                f"{self.api_url}/issue",
+                data=orjson.dumps(_prepare_payload(payload, self.api_version)),
                 timeout=30
             )
+        except Exception as e:
+            logger.error("Error creating issue: %s", e)
+            return None, _failure(payload, None, str(e))
+
+        if response.status_code == 201:
+            return orjson.loads(response.content)['key'], None
+        if response.status_code in (401, 403):
+            # Every other request would fail the same way, so stop the upload
+            raise JiraAuthError(f"Jira rejected the credentials (HTTP {response.status_code})")
+
+        logger.error("Failed to create issue: HTTP %s: %s", response.status_code, response.text)
+        return None, _failure(payload, response.status_code, response.text)
+
+    def _bulk_create_issues(self, payloads: List[dict]) -> List[CreateResult]:
+        """
+        Create issues in batches of BULK_BATCH_SIZE via the bulk endpoint
+
+        Args:
+            payloads: Issue creation payloads
+
+        Returns:
+            Create result for each payload
 
-            if response.status_code == 201:
-                return response.json()['key']
+        Raises:
+            JiraAuthError: If Jira rejects the credentials
+        """
+        results: List[CreateResult] = [(None, None)] * len(payloads)
+        valid = []
+        for i, payload in enumerate(payloads):
+            try:
+                self._validate_fields(payload)
+            except ValueError as e:
+                logger.warning("Skipping issue '%s': %s", payload['fields']['summary'], e)
+                results[i] = (None, _failure(payload, None, str(e)))
             else:
-                print(f"Failed to create issue: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
+                valid.append(i)
+
+        for start in range(0, len(valid), BULK_BATCH_SIZE):
+            batch = valid[start:start + BULK_BATCH_SIZE]
+            for i, result in zip(batch, self._bulk_create_batch([payloads[i] for i in batch])):
+                results[i] = result
+        return results
 
+    def _bulk_create_batch(self, payloads: List[dict]) -> List[CreateResult]:
+        """Create up to BULK_BATCH_SIZE issues in one request"""
+        try:
+            response = self.session.post(
+                f"{self.api_url}/issue/bulk",
+                data=orjson.dumps({
+                    "issueUpdates": [_prepare_payload(payload, self.api_version) for payload in payloads]
+                }),
+                timeout=30
+            )
         except Exception as e:
-            print(f"Error creating issue: {e}")
-            return None
+            logger.error("Error creating issues: %s", e)
+            return [(None, _failure(payload, None, str(e))) for payload in payloads]
+
+        if response.status_code in (401, 403):
+            raise JiraAuthError(f"Jira rejected the credentials (HTTP {response.status_code})")
+        # A 400 still carries per-element errors when every issue failed
+        if response.status_code in (201, 400):
+            try:
+                return _bulk_results(orjson.loads(response.content), payloads, response.status_code)
+            except ValueError:
+                pass
+
+        logger.error("Failed to create issues: HTTP %s: %s", response.status_code, response.text)
+        return [(None, _failure(payload, response.status_code, response.text)) for payload in payloads]
+
+
+class AsyncJiraClient:
+    """
+    asyncio client for creating Jira issues concurrently
+
+    Uses one aiohttp session, so use it as an async context manager (or call
+    close()) from the event loop that runs the requests:
+
+        async with AsyncJiraClient(url, email, token) as client:
+            results = await client.upload_structure(structure)
+    """
+
+    def __init__(
+        self,
+        jira_url: str,
+        email: str,
+        api_token: str,
+        max_concurrency: int = 32,
+        api_version: int = 2
+    ):
+        """
+        Initialize async Jira client
+
+        Args:
+            jira_url: Jira instance URL (e.g., https://your-domain.atlassian.net)
+            email: User email for authentication
+            api_token: Jira API token
+            max_concurrency: Maximum number of requests in flight at once
+            api_version: REST API version (see JiraClient)
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aiohttp package not installed. Run: pip install aiohttp")
+
+        self.jira_url = jira_url.rstrip('/')
+        self.api_version = api_version
+        self.api_url = f"{self.jira_url}/rest/api/{api_version}"
+        # Any number of issues can be queued; only max_concurrency hit the wire
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._limiter = RateLimiter()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=max_concurrency),
+            auth=aiohttp.BasicAuth(email, api_token),
+            headers={
+                'Accept': 'application/json',
+                'Content-Type': 'application/json'
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
+    async def __aenter__(self) -> 'AsyncJiraClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        await self.session.close()
+
+    async def upload_structure(self, structure: TicketStructure) -> Dict[str, List[str]]:
+        """
+        Upload entire ticket structure to Jira in two concurrent stages
+
+        Stage 1 bulk-creates epics, bugs and stories at once; stage 2
+        bulk-creates the tasks, parented to the epic keys from stage 1.
+        Keys are returned in the same order as JiraClient.upload_structure().
+
+        Args:
+            structure: TicketStructure to upload
+
+        Returns:
+            Dict with created ticket keys and failures (see JiraClient.upload_structure)
+        """
+        project_key = structure.project_key
+        epic_results, bug_results, story_results = await asyncio.gather(
+            self._bulk_create_issues([_epic_payload(epic, project_key) for epic in structure.epics]),
+            self._bulk_create_issues([_bug_payload(bug, project_key) for bug in structure.bugs]),
+            self._bulk_create_issues([_story_payload(story, project_key) for story in structure.stories])
+        )
+        epic_keys = [key for key, _ in epic_results]
+        task_results = await self._bulk_create_issues(_task_payloads(structure, epic_keys))
+
+        return _group_results([
+            *(('epics', result) for result in epic_results),
+            *(('tasks', result) for result in task_results),
+            *(('tasks', result) for result in _orphaned_tasks(structure, epic_results)),
+            *(('bugs', result) for result in bug_results),
+            *(('stories', result) for result in story_results)
+        ])
+
+    async def create_epic(self, epic: Epic, project_key: str) -> Optional[str]:
+        """Create epic in Jira (see JiraClient.create_epic)"""
+        key, _ = await self._create_issue(_epic_payload(epic, project_key))
+        return key
+
+    async def create_task(self, task: Task, project_key: str, epic_key: Optional[str] = None) -> Optional[str]:
+        """Create task in Jira (see JiraClient.create_task)"""
+        key, _ = await self._create_issue(_task_payload(task, project_key, epic_key))
+        return key
+
+    async def create_bug(self, bug: Bug, project_key: str) -> Optional[str]:
+        """Create bug in Jira (see JiraClient.create_bug)"""
+        key, _ = await self._create_issue(_bug_payload(bug, project_key))
+        return key
+
+    async def create_story(self, story: UserStory, project_key: str) -> Optional[str]:
+        """Create user story in Jira (see JiraClient.create_story)"""
+        key, _ = await self._create_issue(_story_payload(story, project_key))
+        return key
+
+    async def _create_issue(self, payload: dict) -> CreateResult:
+        """
+        Create issue in Jira via REST API
+
+        Args:
+            payload: Issue creation payload
+
+        Returns:
+            (created issue key, None), or (None, failure record) if failed
+
+        Raises:
+            JiraAuthError: If Jira rejects the credentials
+        """
+        status, body = await self._post('/issue', _prepare_payload(payload, self.api_version))
+        if status == 201:
+            return body['key'], None
+
+        logger.error("Failed to create issue: HTTP %s: %s", status, body)
+        return None, _failure(payload, status, body)
+
+    async def _bulk_create_issues(self, payloads: List[dict]) -> List[CreateResult]:
+        """
+        Create issues in concurrent batches of BULK_BATCH_SIZE via the bulk endpoint
+
+        Args:
+            payloads: Issue creation payloads
+
+        Returns:
+            Create result for each payload
+
+        Raises:
+            JiraAuthError: If Jira rejects the credentials
+        """
+        batches = await asyncio.gather(*(
+            self._bulk_create_batch(payloads[start:start + BULK_BATCH_SIZE])
+            for start in range(0, len(payloads), BULK_BATCH_SIZE)
+        ))
+        return [result for batch in batches for result in batch]
+
+    async def _bulk_create_batch(self, payloads: List[dict]) -> List[CreateResult]:
+        """Create up to BULK_BATCH_SIZE issues in one request"""
+        status, body = await self._post('/issue/bulk', {
+            "issueUpdates": [_prepare_payload(payload, self.api_version) for payload in payloads]
+        })
+        # A 400 still carries per-element errors when every issue failed
+        if status in (201, 400) and isinstance(body, dict):
+            return _bulk_results(body, payloads, status)
+
+        logger.error("Failed to create issues: HTTP %s: %s", status, body)
+        return [(None, _failure(payload, status, body)) for payload in payloads]
+
+    async def _post(self, path: str, payload: dict) -> Tuple[Optional[int], Any]:
+        """
+        POST to Jira, waiting out rate limits and retrying 429/503
+
+        Args:
+            path: Path under the REST API base, e.g. '/issue'
+            payload: JSON request body
+
+        Returns:
+            (status, decoded JSON body or raw text), or (None, error message)
+            if no response was received
+
+        Raises:
+            JiraAuthError: If Jira rejects the credentials
+        """
+        url = f"{self.api_url}{path}"
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            await self._limiter.acquire()
+            try:
+                async with self._sem, self.session.post(url, data=orjson.dumps(payload)) as response:
+                    hint = _rate_limit_delay(response.headers)
+                    if hint:
+                        self._limiter.defer(hint)
+
+                    if response.status in (401, 403):
+                        # Every other request would fail the same way, so stop the upload
+                        raise JiraAuthError(f"Jira rejected the credentials (HTTP {response.status})")
+                    if response.status in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS:
+                        if not hint:
+                            self._limiter.defer(_backoff_delay(attempt))
+                        continue
+
+                    content = await response.read()
+                    try:
+                        return response.status, orjson.loads(content)
+                    except ValueError:
+                        return response.status, content.decode('utf-8', 'replace')
+
+            except JiraAuthError:
+                raise
+            except Exception as e:
+                logger.error("Error creating issue: %s", e)
+                return None, str(e)
+        return None, 'Retries exhausted'
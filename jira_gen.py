@@ -5,15 +5,85 @@ JIRA Ticket Generator - Main CLI
 Transform unstructured text into production-ready Jira tickets
 """
 
+import io
+import json
 import sys
 import click
+from datetime import datetime
 from pathlib import Path
 from config import config
 from models import IssueType
-from agents.extraction_agent import ExtractionAgent
-from agents.review_agent import ReviewAgent
 from markdown_utils import write_markdown, generate_filename, list_markdown_files
-from jira_client import JiraClient
+from markdown_parser import parse_markdown
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _read_input(path: Path) -> str:
+    """Read an input file as UTF-8, dropping a BOM and replacing undecodable bytes"""
+    return path.read_text(encoding='utf-8-sig', errors='replace')
+
+
+def _format_structure(structure) -> str:
+    """
+    Render the extracted tickets for terminal display
+
+    Built in one buffer so the whole summary goes out in a single write.
+
+    Args:
+        structure: TicketStructure to display
+
+    Returns:
+        Display text, one line per row
+    """
+    buf = io.StringIO()
+
+    def line(text: str = "") -> None:
+        buf.write(f"{text}\n")
+
+    rule = '=' * 60
+
+    for i, epic in enumerate(structure.epics, 1):
+        line(f"\n{rule}")
+        line(f"Epic {i}: {epic.title}")
+        line(rule)
+        line(f"Priority: {epic.priority}")
+        if epic.business_value:
+            line(f"Business Value: {epic.business_value}")
+        line(f"\nDescription:\n{epic.description}")
+
+        if epic.tasks:
+            line(f"\nTasks ({len(epic.tasks)}):")
+            for j, task in enumerate(epic.tasks, 1):
+                line(f"\n  Task {j}: {task.title}")
+                line(f"  Priority: {task.priority}")
+                if task.acceptance_criteria:
+                    line(f"  Acceptance Criteria ({len(task.acceptance_criteria)}):")
+                    for ac in task.acceptance_criteria:
+                        line(f"    - {ac}")
+
+    for i, bug in enumerate(structure.bugs, 1):
+        line(f"\n{rule}")
+        line(f"Bug {i}: {bug.summary}")
+        line(rule)
+        line(f"Severity: {bug.severity} | Priority: {bug.priority}")
+        line(f"\nDescription:\n{bug.description}")
+        line("\nReproduction Steps:")
+        for j, step in enumerate(bug.reproduction_steps, 1):
+            line(f"  {j}. {step}")
+
+    for i, story in enumerate(structure.stories, 1):
+        line(f"\n{rule}")
+        line(f"Story {i}: {story.title}")
+        line(rule)
+        line(f"As a: {story.as_a}")
+        line(f"I want to: {story.i_want_to}")
+        line(f"So that: {story.so_that}")
+        line("\nAcceptance Criteria:")
+        for ac in story.acceptance_criteria:
+            line(f"  - {ac}")
+
+    return buf.getvalue()
 
 
 @click.group()
@@ -31,7 +101,8 @@ def cli():
               help='Jira issue type: task (default), bug, story, epic-only')
 @click.option('--clipboard', is_flag=True, help='Read from clipboard instead of file')
 @click.option('--skip-review', is_flag=True, help='Skip review agent (faster but lower quality)')
-def parse(input_file, project, issue_type, clipboard, skip_review):
+@click.option('--quiet', '-q', is_flag=True, help='Do not print the extracted tickets')
+def parse(input_file, project, issue_type, clipboard, skip_review, quiet):
     """
     Parse text with two-agent system
 
@@ -40,6 +111,24 @@ def parse(input_file, project, issue_type, clipboard, skip_review):
         jira_gen.py parse bug.txt --issue-type bug
         jira_gen.py parse --clipboard --issue-type story
     """
+    # Read input text (cheap checks first, so bad input fails before config errors)
+    if clipboard:
+        try:
+            import pyperclip
+        except ImportError:
+            click.echo("Error: pyperclip not installed. Run: pip install pyperclip", err=True)
+            sys.exit(1)
+        text = pyperclip.paste()
+    elif input_file:
+        text = _read_input(Path(input_file))
+    else:
+        click.echo("Error: Provide input file or use --clipboard", err=True)
+        sys.exit(1)
+
+    if not text or not text.strip():
+        click.echo("Error: Input text is empty", err=True)
+        sys.exit(1)
+
     # Validate configuration
     errors = config.validate()
     if errors:
@@ -55,24 +144,6 @@ def parse(input_file, project, issue_type, clipboard, skip_review):
         click.echo("Error: Project key required (use --project or set DEFAULT_PROJECT_KEY in .env)", err=True)
         sys.exit(1)
 
-    # Read input text
-    if clipboard:
-        try:
-            import pyperclip
-            text = pyperclip.paste()
-        except ImportError:
-            click.echo("Error: pyperclip not installed. Run: pip install pyperclip", err=True)
-            sys.exit(1)
-    elif input_file:
-        text = Path(input_file).read_text()
-    else:
-        click.echo("Error: Provide input file or use --clipboard", err=True)
-        sys.exit(1)
-
-    if not text.strip():
-        click.echo("Error: Input text is empty", err=True)
-        sys.exit(1)
-
     # Normalize issue type
     issue_type = issue_type.lower()  # type: ignore
 
@@ -94,6 +165,8 @@ def parse(input_file, project, issue_type, clipboard, skip_review):
         click.echo("   LLM: Not configured (using fallback mode)")
 
     # Agent 1: Extract structure
+    from agents.extraction_agent import ExtractionAgent
+
     click.echo("\n📝 Agent 1: Extracting structure...")
     extraction_agent = ExtractionAgent(llm_client, issue_type=issue_type)  # type: ignore
     structure = extraction_agent.extract(text, project_key)
@@ -119,6 +192,8 @@ def parse(input_file, project, issue_type, clipboard, skip_review):
 
     # Agent 2: Review (if not skipped)
     if not skip_review and llm_client:
+        from agents.review_agent import ReviewAgent
+
         click.echo("\n🔍 Agent 2: Reviewing for completeness...")
         review_agent = ReviewAgent(llm_client)
         review = review_agent.review(structure)
@@ -160,51 +235,9 @@ def parse(input_file, project, issue_type, clipboard, skip_review):
     click.echo(f"   2. Edit if needed")
     click.echo(f"   3. Upload to Jira: python3 jira_gen.py upload {filename}")
 
-    # Show summary
-
     # Display extracted content
-    if structure.epics:
-        for i, epic in enumerate(structure.epics, 1):
-            click.echo(f"\n{'='*60}")
-            click.echo(f"Epic {i}: {epic.title}")
-            click.echo(f"{'='*60}")
-            click.echo(f"Priority: {epic.priority}")
-            if epic.business_value:
-                click.echo(f"Business Value: {epic.business_value}")
-            click.echo(f"\nDescription:\n{epic.description}")
-
-            if epic.tasks:
-                click.echo(f"\nTasks ({len(epic.tasks)}):")
-                for j, task in enumerate(epic.tasks, 1):
-                    click.echo(f"\n  Task {j}: {task.title}")
-                    click.echo(f"  Priority: {task.priority}")
-                    if task.acceptance_criteria:
-                        click.echo(f"  Acceptance Criteria ({len(task.acceptance_criteria)}):")
-                        for ac in task.acceptance_criteria:
-                            click.echo(f"    - {ac}")
-
-    if structure.bugs:
-        for i, bug in enumerate(structure.bugs, 1):
-            click.echo(f"\n{'='*60}")
-            click.echo(f"Bug {i}: {bug.summary}")
-            click.echo(f"{'='*60}")
-            click.echo(f"Severity: {bug.severity} | Priority: {bug.priority}")
-            click.echo(f"\nDescription:\n{bug.description}")
-            click.echo(f"\nReproduction Steps:")
-            for j, step in enumerate(bug.reproduction_steps, 1):
-                click.echo(f"  {j}. {step}")
-
-    if structure.stories:
-        for i, story in enumerate(structure.stories, 1):
-            click.echo(f"\n{'='*60}")
-            click.echo(f"Story {i}: {story.title}")
-            click.echo(f"{'='*60}")
-            click.echo(f"As a: {story.as_a}")
-            click.echo(f"I want to: {story.i_want_to}")
-            click.echo(f"So that: {story.so_that}")
-            click.echo(f"\nAcceptance Criteria:")
-            for ac in story.acceptance_criteria:
-                click.echo(f"  - {ac}")
+    if not quiet:
+        click.echo(_format_structure(structure), nl=False)
 
 
 @cli.command()
@@ -230,63 +263,142 @@ def validate():
 @cli.command()
 @click.argument('markdown_file', type=click.Path(exists=True), required=False)
 @click.option('--list', 'list_files', is_flag=True, help='List available markdown files')
+@click.option('--limit', type=click.IntRange(min=1), help='With --list, show only the newest N files')
 @click.option('--dry-run', is_flag=True, help='Test without actually uploading to Jira')
-def upload(markdown_file, list_files, dry_run):
+@click.option('--retry', 'retry_file', type=click.Path(exists=True),
+              help='Retry the tickets saved in a .failed.json file by an earlier upload')
+def upload(markdown_file, list_files, limit, dry_run, retry_file):
     """
     Upload markdown tickets to Jira
 
+    Tickets Jira rejects are saved next to the markdown file as
+    <name>.failed.json, which --retry uploads again.
+
     Examples:
         jira_gen.py upload jira_tickets_PROJ_task_20250123_143022.md
         jira_gen.py upload --list
+        jira_gen.py upload --list --limit 5
         jira_gen.py upload --dry-run jira_tickets_PROJ_task_20250123_143022.md
+        jira_gen.py upload --retry jira_tickets_PROJ_task_20250123_143022.failed.json
     """
     # List mode
     if list_files:
-        md_files = list_markdown_files()
+        md_files = list_markdown_files(limit=limit)
         if md_files:
             click.echo("📂 Available markdown files (newest first):\n")
-            for i, file in enumerate(md_files, 1):
-                # Get file size and modification time
-                size = file.stat().st_size
-                mtime = file.stat().st_mtime
-                from datetime import datetime
-                time_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-                click.echo(f"  {i}. {file.name}")
-                click.echo(f"     Size: {size:,} bytes | Modified: {time_str}")
+            for i, entry in enumerate(md_files, 1):
+                # One stat per file, cached on the DirEntry
+                stat = entry.stat()
+                time_str = datetime.fromtimestamp(stat.st_mtime).strftime(TIME_FORMAT)
+                click.echo(f"  {i}. {entry.name}")
+                click.echo(f"     Size: {stat.st_size:,} bytes | Modified: {time_str}")
         else:
             click.echo("No markdown files found in current directory")
         return
 
+    # Retry mode
+    if retry_file:
+        _retry_upload(Path(retry_file), dry_run)
+        return
+
     # Upload mode
     if not markdown_file:
         click.echo("Error: Provide markdown file to upload or use --list", err=True)
         sys.exit(1)
 
-    # Validate Jira configuration
-    errors = config.validate()
-    if errors:
-        click.echo("❌ Configuration validation failed:", err=True)
-        for error in errors:
-            click.echo(f"  - {error}", err=True)
+    structure = parse_markdown(Path(markdown_file))
+    counts = structure.counts()
+    if not counts['total_items']:
+        click.echo("Error: No tickets found in markdown file", err=True)
         sys.exit(1)
 
-    # Note: This is a simplified implementation
-    # Full implementation would parse markdown back to TicketStructure
-    # For now, we'll show a message
     click.echo(f"\n🚀 JIRA Upload")
     click.echo(f"   File: {markdown_file}")
+    click.echo(f"   Project: {structure.project_key}")
+    click.echo(
+        f"   Tickets: {counts['epics']} epics, {counts['tasks']} tasks, "
+        f"{counts['bugs']} bugs, {counts['stories']} stories"
+    )
+
+    if dry_run:
+        click.echo(f"\n⚠️  DRY RUN MODE - {counts['total_items']} tickets would be created")
+        return
+
+    from jira_client import JiraAuthError
+
+    client = _jira_client()
+    try:
+        with client:
+            results = client.upload_structure(structure)
+    except JiraAuthError as e:
+        click.echo(f"❌ {e}. Please check your credentials.", err=True)
+        sys.exit(1)
+
+    failed = results.pop('failed')
+    created = sum(len(keys) for keys in results.values())
+    click.echo(f"\n✅ Created {created} of {counts['total_items']} tickets")
+    for name, keys in results.items():
+        if keys:
+            click.echo(f"   {name.capitalize()}: {', '.join(keys)}")
+    _save_failed(Path(markdown_file).with_suffix('.failed.json'), failed)
+
+
+def _jira_client():
+    """Build a JiraClient from the configuration, exiting if Jira is not configured"""
+    if not config.has_jira:
+        click.echo("❌ Jira configuration incomplete:", err=True)
+        for error in config.errors:
+            if error.startswith('JIRA_'):
+                click.echo(f"  - {error}", err=True)
+        sys.exit(1)
+
+    from jira_client import JiraClient
+
     click.echo(f"   Jira URL: {config.jira_url}")
-    click.echo(f"   Project: {config.jira_project}")
+    return JiraClient(
+        config.jira_url, config.jira_email, config.jira_api_token,
+        api_version=config.jira_api_version
+    )
+
+
+def _retry_upload(failed_path: Path, dry_run: bool) -> None:
+    """Upload the failure records saved in failed_path again, in bulk"""
+    failed = json.loads(failed_path.read_text(encoding='utf-8'))
+
+    click.echo(f"\n🔁 JIRA Upload Retry")
+    click.echo(f"   File: {failed_path}")
+    click.echo(f"   Tickets: {len(failed)}")
 
     if dry_run:
-        click.echo("\n⚠️  DRY RUN MODE - No tickets will be created")
-
-    click.echo("\n⚠️  Upload functionality is simplified in Phase 2 core")
-    click.echo("   Full markdown → Jira upload will be available in Phase 2 UI")
-    click.echo("\n💡 For now:")
-    click.echo("   1. Review the generated markdown file")
-    click.echo("   2. Manually copy content to Jira")
-    click.echo("   3. Or wait for Phase 2 UI with full upload support")
+        click.echo(f"\n⚠️  DRY RUN MODE - {len(failed)} tickets would be retried")
+        return
+
+    from jira_client import JiraAuthError
+
+    client = _jira_client()
+    try:
+        with client:
+            results = client.retry_failed(failed)
+    except JiraAuthError as e:
+        click.echo(f"❌ {e}. Please check your credentials.", err=True)
+        sys.exit(1)
+
+    click.echo(f"\n✅ Created {len(results['created'])} of {len(failed)} tickets")
+    if results['created']:
+        click.echo(f"   Keys: {', '.join(results['created'])}")
+    _save_failed(failed_path, results['failed'])
+
+
+def _save_failed(failed_path: Path, failed: list) -> None:
+    """Save failure records for --retry (removing the file once none remain), exiting 1 if any"""
+    if not failed:
+        failed_path.unlink(missing_ok=True)
+        return
+
+    failed_path.write_text(json.dumps(failed, indent=2, ensure_ascii=False), encoding='utf-8')
+    click.echo(f"\n❌ {len(failed)} tickets failed; saved to {failed_path}", err=True)
+    click.echo(f"   Retry with: python3 jira_gen.py upload --retry {failed_path}", err=True)
+    sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -5,13 +5,59 @@ Parses generated markdown files back into TicketStructure for JIRA upload
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from models import (
     TicketStructure, Epic, Task, Bug, UserStory,
     Environment, TechnicalDetails
 )
+from markdown_utils import read_markdown
 import re
 
+# Section headings are found by line prefix; the number patterns then only
+# run on candidate lines
+_EPIC_PREFIX = '## Epic '
+_TASK_PREFIX = '#### Task '
+_BUG_PREFIX = '## Bug '
+_STORY_PREFIX = '## Story '
+_SECTION_NUMBER_RE = re.compile(r'\d+:')
+_TASK_NUMBER_RE = re.compile(r'\d+\.\d+:')
+_STEP_RE = re.compile(r'^\d+\.\s*')
+
+# "**Technical Details**" bullet labels -> TechnicalDetails fields
+_TECH_KEY_MAP = {
+    'error': 'error_message',
+    'console': 'console_logs',
+    'code': 'affected_code',
+    'api': 'api_calls',
+    'stack trace': 'stack_trace'
+}
+
+# Single-line "**Label**: value" fields -> keyword argument, per section type.
+# Lines are split once at the first ':' and the label looked up here;
+# multi-line list fields are handled by the parsers themselves.
+_EPIC_FIELDS = {
+    '**Description**': 'description',
+    '**Business Value**': 'business_value',
+    '**Priority**': 'priority'
+}
+_TASK_FIELDS = {
+    '**Description**': 'description',
+    '**Priority**': 'priority',
+    '**Technical Notes**': 'technical_notes'
+}
+_BUG_FIELDS = {
+    '**Description**': 'description',
+    '**Severity**': 'severity',
+    '**Suggested Fix**': 'suggested_fix'
+}
+_STORY_FIELDS = {
+    '- **As a**': 'as_a',
+    '- **I want to**': 'i_want_to',
+    '- **So that**': 'so_that',
+    '**Priority**': 'priority',
+    '**Technical Notes**': 'technical_notes'
+}
+
 
 def parse_markdown(markdown_path: Path) -> TicketStructure:
     """
@@ -23,7 +69,7 @@ def parse_markdown(markdown_path: Path) -> TicketStructure:
     Returns:
         TicketStructure object
     """
-    content = markdown_path.read_text(encoding='utf-8')
+    content = read_markdown(markdown_path)
     lines = content.split('\n')
 
     # Extract project key and issue type from header
@@ -32,30 +78,30 @@ def parse_markdown(markdown_path: Path) -> TicketStructure:
 
     for line in lines[:10]:
         if line.startswith('# JIRA Tickets - '):
-            project_key = line.replace('# JIRA Tickets - ', '').strip()
+            project_key = line.removeprefix('# JIRA Tickets - ').strip()
         elif line.startswith('**Issue Type**:'):
-            issue_type = line.replace('**Issue Type**:', '').strip().lower()
+            issue_type = line.removeprefix('**Issue Type**:').strip().lower()
 
     if not project_key:
         raise ValueError("Could not extract project key from markdown")
 
-    # Parse based on issue type
+    # Parse based on issue type; parsers read line ranges of the shared list
     if issue_type in ['task', 'epic-only']:
-        epics = _parse_epics_from_markdown(content)
+        epics = _parse_epics_from_markdown(lines, _section_ranges(lines, _EPIC_PREFIX, _SECTION_NUMBER_RE))
         return TicketStructure(
             project_key=project_key,
             issue_type=issue_type,
             epics=epics
         )
     elif issue_type == 'bug':
-        bugs = _parse_bugs_from_markdown(content)
+        bugs = _parse_bugs_from_markdown(lines, _section_ranges(lines, _BUG_PREFIX, _SECTION_NUMBER_RE))
         return TicketStructure(
             project_key=project_key,
             issue_type=issue_type,
             bugs=bugs
         )
     elif issue_type == 'story':
-        stories = _parse_stories_from_markdown(content)
+        stories = _parse_stories_from_markdown(lines, _section_ranges(lines, _STORY_PREFIX, _SECTION_NUMBER_RE))
         return TicketStructure(
             project_key=project_key,
             issue_type=issue_type,
@@ -65,262 +111,261 @@ def parse_markdown(markdown_path: Path) -> TicketStructure:
         raise ValueError(f"Unsupported issue type: {issue_type}")
 
 
-def _parse_epics_from_markdown(content: str) -> List[Epic]:
-    """Parse epics and tasks from markdown"""
-    epics = []
-    epic_sections = re.split(r'\n## Epic \d+:', content)[1:]  # Skip header
+def _section_ranges(
+    lines: List[str],
+    prefix: str,
+    number_re: re.Pattern,
+    start: int = 1,
+    end: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Find the sections that start with a numbered heading line
+
+    Args:
+        lines: Markdown lines
+        prefix: Heading prefix, e.g. '## Epic '
+        number_re: Pattern the heading number must match right after prefix
+        start: First line to scan (the document title line is never a heading)
+        end: Line to stop scanning at (default: end of lines)
+
+    Returns:
+        (heading line, end line) index pairs; a section ends where the next
+        one starts
+    """
+    end = len(lines) if end is None else end
+    headings = [
+        i for i in range(start, end)
+        if lines[i].startswith(prefix) and number_re.match(lines[i], len(prefix))
+    ]
+    return list(zip(headings, headings[1:] + [end]))
+
+
+def _heading_title(line: str) -> str:
+    """Text after 'N:' in a section heading line"""
+    return line.split(':', 1)[1].strip()
+
+
+def _split_pipe(value: str, label: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a combined field value such as "High | **Effort**: Medium"
+
+    Args:
+        value: Field value after the first label
+        label: Label of the trailing field, e.g. '**Effort**:'
+
+    Returns:
+        (first value, trailing value or None if absent)
+    """
+    if '|' not in value:
+        return value, None
+    parts = value.split('|')
+    second = parts[1].strip()
+    if not second.startswith(label):
+        return parts[0].strip(), None
+    return parts[0].strip(), second.removeprefix(label).strip()
 
-    for section in epic_sections:
-        lines = section.strip().split('\n')
-        if not lines:
-            continue
 
-        # Extract epic title (first line)
-        epic_title = lines[0].strip()
+def _bullet_block(lines: List[str], i: int, end: int) -> Tuple[List[str], int]:
+    """
+    Collect the "- item" lines that follow a list field label
+
+    Args:
+        lines: Markdown lines
+        i: First line after the label
+        end: End of the enclosing section
+
+    Returns:
+        (item texts, index of the first line after the list)
+    """
+    items = []
+    while i < end:
+        # Strip once: hand-edited files may indent bullets or leave trailing spaces
+        line = lines[i].strip()
+        if not line.startswith('-'):
+            break
+        items.append(line[2:])
+        i += 1
+    return items, i
+
+
+def _parse_epics_from_markdown(lines: List[str], ranges: List[Tuple[int, int]]) -> List[Epic]:
+    """Parse epics and tasks from the given line ranges"""
+    epics = []
+
+    for start, end in ranges:
+        # Extract epic title (heading line)
+        epic_title = _heading_title(lines[start])
+        task_ranges = _section_ranges(lines, _TASK_PREFIX, _TASK_NUMBER_RE, start + 1, end)
+        fields_end = task_ranges[0][0] if task_ranges else end
 
         # Extract epic fields
-        description = ''
-        business_value = None
-        priority = 'Medium'
-
-        for line in lines[1:]:
-            if line.startswith('**Description**:'):
-                description = line.replace('**Description**:', '').strip()
-            elif line.startswith('**Business Value**:'):
-                business_value = line.replace('**Business Value**:', '').strip()
-            elif line.startswith('**Priority**:'):
-                # Extract only the priority value, ignore anything after |
-                priority_line = line.replace('**Priority**:', '').strip()
-                if '|' in priority_line:
-                    priority = priority_line.split('|')[0].strip()
-                else:
-                    priority = priority_line
+        fields = {'description': '', 'business_value': None, 'priority': 'Medium'}
 
-        # Parse tasks
-        tasks = []
-        task_sections = re.split(r'\n#### Task \d+\.\d+:', section)
+        # Epic fields come before the first task
+        for line in lines[start + 1:fields_end]:
+            if line.startswith('**'):
+                label, _, rest = line.partition(':')
+                field = _EPIC_FIELDS.get(label)
+                if field:
+                    fields[field] = rest.strip()
 
-        for task_section in task_sections[1:]:  # Skip first (epic header)
-            task_lines = task_section.strip().split('\n')
-            if not task_lines:
-                continue
+        # Extract only the priority value, ignore anything after |
+        fields['priority'] = _split_pipe(fields['priority'], '**Effort**:')[0]
 
-            task_title = task_lines[0].strip()
-            task_description = ''
-            task_priority = 'Medium'
-            task_effort = None
+        # Parse tasks
+        tasks = []
+        for task_start, task_end in task_ranges:
+            task_title = _heading_title(lines[task_start])
+            task_fields = {'description': '', 'priority': 'Medium', 'technical_notes': None}
             acceptance_criteria = []
-            technical_notes = None
-
-            i = 1
-            while i < len(task_lines):
-                line = task_lines[i]
-
-                if line.startswith('**Description**:'):
-                    task_description = line.replace('**Description**:', '').strip()
-                elif line.startswith('**Priority**:'):
-                    # Handle "Priority: High | Effort: Medium" format
-                    priority_line = line.replace('**Priority**:', '').strip()
-                    if '|' in priority_line:
-                        parts = priority_line.split('|')
-                        task_priority = parts[0].strip()
-                        if len(parts) > 1 and '**Effort**:' in parts[1]:
-                            task_effort = parts[1].replace('**Effort**:', '').strip()
-                    else:
-                        task_priority = priority_line
-                elif line.startswith('**Acceptance Criteria**:'):
-                    # Collect all bullet points
-                    i += 1
-                    while i < len(task_lines) and task_lines[i].strip().startswith('-'):
-                        acceptance_criteria.append(task_lines[i].strip()[2:])
-                        i += 1
-                    i -= 1  # Back up one
-                elif line.startswith('**Technical Notes**:'):
-                    technical_notes = line.replace('**Technical Notes**:', '').strip()
 
+            # Forward-only scan: list fields advance i past their items
+            i = task_start + 1
+            while i < task_end:
+                line = lines[i]
                 i += 1
 
-            if task_title and task_description:
+                if line.startswith('**'):
+                    label, _, rest = line.partition(':')
+                    field = _TASK_FIELDS.get(label)
+                    if field:
+                        task_fields[field] = rest.strip()
+                    elif label == '**Acceptance Criteria**':
+                        items, i = _bullet_block(lines, i, task_end)
+                        acceptance_criteria.extend(items)
+
+            # Handle "Priority: High | Effort: Medium" format
+            task_priority, task_effort = _split_pipe(task_fields['priority'], '**Effort**:')
+
+            if task_title and task_fields['description']:
                 tasks.append(Task(
                     title=task_title,
-                    description=task_description,
+                    description=task_fields['description'],
                     acceptance_criteria=acceptance_criteria,
-                    technical_notes=technical_notes,
+                    technical_notes=task_fields['technical_notes'],
                     priority=task_priority,
                     estimated_effort=task_effort
                 ))
 
-        if epic_title and description:
-            epics.append(Epic(
-                title=epic_title,
-                description=description,
-                business_value=business_value,
-                priority=priority,
-                tasks=tasks
-            ))
+        if epic_title and fields['description']:
+            epics.append(Epic(title=epic_title, tasks=tasks, **fields))
 
     return epics
 
 
-def _parse_bugs_from_markdown(content: str) -> List[Bug]:
-    """Parse bug reports from markdown"""
+def _parse_bugs_from_markdown(lines: List[str], ranges: List[Tuple[int, int]]) -> List[Bug]:
+    """Parse bug reports from the given line ranges"""
     bugs = []
-    bug_sections = re.split(r'\n## Bug \d+:', content)[1:]
-
-    for section in bug_sections:
-        lines = section.strip().split('\n')
-        if not lines:
-            continue
 
-        summary = lines[0].strip()
-        description = ''
-        severity = 'Medium'
-        priority = 'Medium'
+    for start, end in ranges:
+        summary = _heading_title(lines[start])
+        fields = {'description': '', 'severity': 'Medium', 'suggested_fix': None}
         reproduction_steps = []
         environment = Environment()
         technical_details = None
         acceptance_criteria = []
-        suggested_fix = None
 
-        i = 1
-        while i < len(lines):
+        # Forward-only scan: list fields advance i past their items
+        i = start + 1
+        while i < end:
             line = lines[i]
-
-            if line.startswith('**Description**:'):
-                description = line.replace('**Description**:', '').strip()
-            elif line.startswith('**Severity**:'):
-                # Handle "Severity: High | Priority: Critical" format
-                sev_line = line.replace('**Severity**:', '').strip()
-                if '|' in sev_line:
-                    parts = sev_line.split('|')
-                    severity = parts[0].strip()
-                    if len(parts) > 1 and '**Priority**:' in parts[1]:
-                        priority = parts[1].replace('**Priority**:', '').strip()
-                else:
-                    severity = sev_line
-            elif line.startswith('**Reproduction Steps**:'):
-                i += 1
-                while i < len(lines) and re.match(r'^\d+\.', lines[i].strip()):
-                    step = re.sub(r'^\d+\.\s*', '', lines[i].strip())
-                    reproduction_steps.append(step)
-                    i += 1
-                i -= 1
-            elif line.startswith('**Environment**:'):
-                i += 1
-                env_dict = {}
-                while i < len(lines) and lines[i].strip().startswith('-'):
-                    env_line = lines[i].strip()[2:]
-                    if ':' in env_line:
-                        key, value = env_line.split(':', 1)
-                        env_dict[key.strip().lower().replace(' ', '_')] = value.strip()
-                    i += 1
-                i -= 1
-                environment = Environment(**env_dict)
-            elif line.startswith('**Technical Details**:'):
-                i += 1
-                tech_dict = {}
-                while i < len(lines) and lines[i].strip().startswith('-'):
-                    tech_line = lines[i].strip()[2:]
-                    if ':' in tech_line:
-                        key, value = tech_line.split(':', 1)
-                        key_map = {
-                            'error': 'error_message',
-                            'console': 'console_logs',
-                            'code': 'affected_code',
-                            'api': 'api_calls',
-                            'stack trace': 'stack_trace'
-                        }
-                        mapped_key = key_map.get(key.strip().lower(), key.strip().lower().replace(' ', '_'))
-                        tech_dict[mapped_key] = value.strip()
-                    i += 1
-                i -= 1
-                technical_details = TechnicalDetails(**tech_dict)
-            elif line.startswith('**Fix Verification Criteria**:'):
-                i += 1
-                while i < len(lines) and lines[i].strip().startswith('-'):
-                    acceptance_criteria.append(lines[i].strip()[2:])
-                    i += 1
-                i -= 1
-            elif line.startswith('**Suggested Fix**:'):
-                suggested_fix = line.replace('**Suggested Fix**:', '').strip()
-
             i += 1
 
-        if summary and description and len(reproduction_steps) >= 3:
+            if line.startswith('**'):
+                label, _, rest = line.partition(':')
+                field = _BUG_FIELDS.get(label)
+                if field:
+                    fields[field] = rest.strip()
+                elif label == '**Reproduction Steps**':
+                    while i < end:
+                        step_line = lines[i].strip()
+                        match = _STEP_RE.match(step_line)
+                        if not match:
+                            break
+                        reproduction_steps.append(step_line[match.end():])
+                        i += 1
+                elif label == '**Environment**':
+                    items, i = _bullet_block(lines, i, end)
+                    env_dict = {}
+                    for env_line in items:
+                        if ':' in env_line:
+                            key, value = env_line.split(':', 1)
+                            env_dict[key.strip().lower().replace(' ', '_')] = value.strip()
+                    # Environment/TechnicalDetails fields are all optional strings,
+                    # so there is nothing to validate; unknown keys are dropped
+                    environment = Environment.model_construct(**env_dict)
+                elif label == '**Technical Details**':
+                    items, i = _bullet_block(lines, i, end)
+                    tech_dict = {}
+                    for tech_line in items:
+                        if ':' in tech_line:
+                            key, value = tech_line.split(':', 1)
+                            mapped_key = _TECH_KEY_MAP.get(key.strip().lower(), key.strip().lower().replace(' ', '_'))
+                            tech_dict[mapped_key] = value.strip()
+                    technical_details = TechnicalDetails.model_construct(**tech_dict)
+                elif label == '**Fix Verification Criteria**':
+                    items, i = _bullet_block(lines, i, end)
+                    acceptance_criteria.extend(items)
+
+        # Handle "Severity: High | Priority: Critical" format
+        severity, priority = _split_pipe(fields['severity'], '**Priority**:')
+
+        if summary and fields['description'] and len(reproduction_steps) >= 3:
             bugs.append(Bug(
                 summary=summary,
-                description=description,
+                description=fields['description'],
                 severity=severity,
-                priority=priority,
+                priority=priority or 'Medium',
                 reproduction_steps=reproduction_steps,
                 environment=environment,
                 technical_details=technical_details,
                 acceptance_criteria=acceptance_criteria,
-                suggested_fix=suggested_fix
+                suggested_fix=fields['suggested_fix']
             ))
 
     return bugs
 
 
-def _parse_stories_from_markdown(content: str) -> List[UserStory]:
-    """Parse user stories from markdown"""
+def _parse_stories_from_markdown(lines: List[str], ranges: List[Tuple[int, int]]) -> List[UserStory]:
+    """Parse user stories from the given line ranges"""
     stories = []
-    story_sections = re.split(r'\n## Story \d+:', content)[1:]
-
-    for section in story_sections:
-        lines = section.strip().split('\n')
-        if not lines:
-            continue
-
-        title = lines[0].strip()
-        as_a = ''
-        i_want_to = ''
-        so_that = ''
-        priority = 'Medium'
-        estimated_effort = None
+
+    for start, end in ranges:
+        title = _heading_title(lines[start])
+        fields = {
+            'as_a': '', 'i_want_to': '', 'so_that': '',
+            'priority': 'Medium', 'technical_notes': None
+        }
         acceptance_criteria = []
-        technical_notes = None
 
-        i = 1
-        while i < len(lines):
+        # Forward-only scan: list fields advance i past their items
+        i = start + 1
+        while i < end:
             line = lines[i]
+            i += 1
 
-            if '**As a**:' in line:
-                as_a = line.split('**As a**:')[1].strip()
-            elif '**I want to**:' in line:
-                i_want_to = line.split('**I want to**:')[1].strip()
-            elif '**So that**:' in line:
-                so_that = line.split('**So that**:')[1].strip()
-            elif line.startswith('**Priority**:'):
-                priority_line = line.replace('**Priority**:', '').strip()
-                if '|' in priority_line:
-                    parts = priority_line.split('|')
-                    priority = parts[0].strip()
-                    if len(parts) > 1 and '**Effort**:' in parts[1]:
-                        estimated_effort = parts[1].replace('**Effort**:', '').strip()
-                else:
-                    priority = priority_line
-            elif line.startswith('**Acceptance Criteria**:'):
-                i += 1
-                while i < len(lines) and lines[i].strip().startswith('-'):
-                    acceptance_criteria.append(lines[i].strip()[2:])
-                    i += 1
-                i -= 1
-            elif line.startswith('**Technical Notes**:'):
-                technical_notes = line.replace('**Technical Notes**:', '').strip()
+            # The "As a / I want to / So that" fields are bullets under **User Story**
+            if line.startswith(('**', '- **')):
+                label, _, rest = line.partition(':')
+                field = _STORY_FIELDS.get(label)
+                if field:
+                    fields[field] = rest.strip()
+                elif label == '**Acceptance Criteria**':
+                    items, i = _bullet_block(lines, i, end)
+                    acceptance_criteria.extend(items)
 
-            i += 1
+        priority, estimated_effort = _split_pipe(fields['priority'], '**Effort**:')
 
-        if title and as_a and i_want_to and so_that and len(acceptance_criteria) >= 3:
+        if title and fields['as_a'] and fields['i_want_to'] and fields['so_that'] and len(acceptance_criteria) >= 3:
             stories.append(UserStory(
                 title=title,
-                as_a=as_a,
-                i_want_to=i_want_to,
-                so_that=so_that,
+                as_a=fields['as_a'],
+                i_want_to=fields['i_want_to'],
+                so_that=fields['so_that'],
                 acceptance_criteria=acceptance_criteria,
                 priority=priority,
                 estimated_effort=estimated_effort,
-                technical_notes=technical_notes
+                technical_notes=fields['technical_notes']
             ))
 
     return stories
@@ -4,211 +4,262 @@ Markdown generation and parsing utilities
 Handles conversion between TicketStructure and markdown files
 """
 
+import heapq
+import io
+import mmap
+import os
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 from models import TicketStructure, Epic, Task, Bug, UserStory
 
-
-def write_markdown(structure: TicketStructure, output_path: Path) -> None:
+# Where generated ticket files live (the working directory)
+MARKDOWN_DIR = Path('.')
+
+# (attribute, label) pairs written as "- Label: value" bullets, in order
+_ENV_FIELDS = (
+    ('browser', 'Browser'),
+    ('os', 'OS'),
+    ('device', 'Device'),
+    ('user_role', 'User Role'),
+    ('data_conditions', 'Data Conditions')
+)
+_TECH_FIELDS = (
+    ('error_message', 'Error'),
+    ('console_logs', 'Console'),
+    ('affected_code', 'Code'),
+    ('api_calls', 'API'),
+    ('stack_trace', 'Stack Trace')
+)
+
+# Files larger than this are read through mmap
+MMAP_THRESHOLD = 1 << 20
+
+
+def write_markdown(structure: TicketStructure, output_path: Path) -> str:
     """
     Write ticket structure to markdown file
 
     Args:
         structure: Ticket structure to convert
         output_path: Path to output markdown file
+
+    Returns:
+        The markdown content that was written
+    """
+    content = render_markdown(structure)
+    output_path.write_text(content, encoding='utf-8')
+    return content
+
+
+def render_markdown(structure: TicketStructure) -> str:
+    """
+    Render ticket structure as markdown, without touching the filesystem
+
+    Args:
+        structure: Ticket structure to convert
+
+    Returns:
+        Markdown content
     """
-    lines = []
+    buf = io.StringIO()
 
     # Header
-    lines.append(f"# JIRA Tickets - {structure.project_key}")
-    lines.append(f"\n**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Issue Type**: {structure.issue_type}")
-    lines.append(f"\n---\n")
+    buf.write(
+        f"# JIRA Tickets - {structure.project_key}\n\n"
+        f"**Generated**: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"**Issue Type**: {structure.issue_type}\n\n"
+        "---\n\n"
+    )
 
     # Format based on issue type
     if structure.issue_type in ['task', 'epic-only']:
-        lines.extend(_format_epics(structure.epics))
+        _write_epics(buf, structure.epics)
     elif structure.issue_type == 'bug':
-        lines.extend(_format_bugs(structure.bugs))
+        _write_bugs(buf, structure.bugs)
     elif structure.issue_type == 'story':
-        lines.extend(_format_stories(structure.stories))
+        _write_stories(buf, structure.stories)
+
+    return buf.getvalue()
+
 
-    # Write to file
-    output_path.write_text('\n'.join(lines), encoding='utf-8')
+def _write_bullets(buf: io.StringIO, label: str, items: List[str]) -> None:
+    """Write a "**Label**:" line followed by one "- item" line per item"""
+    buf.write(f"**{label}**:\n")
+    for item in items:
+        buf.write(f"- {item}\n")
+    buf.write("\n")
 
 
-def _format_epics(epics: List[Epic]) -> List[str]:
-    """Format epics and tasks as markdown"""
-    lines = []
+def _write_attrs(buf: io.StringIO, obj: object, fields: Tuple[Tuple[str, str], ...]) -> None:
+    """Write a "- Label: value" line for each (attribute, label) pair that is set"""
+    for attr, label in fields:
+        value = getattr(obj, attr)
+        if value:
+            buf.write(f"- {label}: {value}\n")
 
+
+def _write_epics(buf: io.StringIO, epics: List[Epic]) -> None:
+    """Write epics and tasks as markdown"""
     for i, epic in enumerate(epics, 1):
-        lines.append(f"## Epic {i}: {epic.title}\n")
-        lines.append(f"**Description**: {epic.description}\n")
+        buf.write(
+            f"## Epic {i}: {epic.title}\n\n"
+            f"**Description**: {epic.description}\n\n"
+        )
 
         if epic.business_value:
-            lines.append(f"**Business Value**: {epic.business_value}\n")
+            buf.write(f"**Business Value**: {epic.business_value}\n\n")
 
-        lines.append(f"**Priority**: {epic.priority}\n")
+        buf.write(f"**Priority**: {epic.priority}\n\n")
 
         # Tasks
         if epic.tasks:
-            lines.append(f"\n### Tasks ({len(epic.tasks)})\n")
+            buf.write(f"\n### Tasks ({len(epic.tasks)})\n\n")
 
             for j, task in enumerate(epic.tasks, 1):
-                lines.append(f"#### Task {i}.{j}: {task.title}\n")
-                lines.append(f"**Description**: {task.description}\n")
-                lines.append(f"**Priority**: {task.priority}")
-
+                buf.write(
+                    f"#### Task {i}.{j}: {task.title}\n\n"
+                    f"**Description**: {task.description}\n\n"
+                    f"**Priority**: {task.priority}"
+                )
                 if task.estimated_effort:
-                    lines.append(f" | **Effort**: {task.estimated_effort}")
-                lines.append("\n")
+                    buf.write(f" | **Effort**: {task.estimated_effort}")
+                buf.write("\n\n\n")
 
                 # Acceptance Criteria
                 if task.acceptance_criteria:
-                    lines.append("**Acceptance Criteria**:")
-                    for ac in task.acceptance_criteria:
-                        lines.append(f"- {ac}")
-                    lines.append("")
+                    _write_bullets(buf, 'Acceptance Criteria', task.acceptance_criteria)
 
                 # Technical Notes
                 if task.technical_notes:
-                    lines.append(f"**Technical Notes**: {task.technical_notes}\n")
-
-                lines.append("---\n")
-
-        lines.append("\n")
+                    buf.write(f"**Technical Notes**: {task.technical_notes}\n\n")
 
-    return lines
+                buf.write("---\n\n")
 
+        buf.write("\n\n")
 
-def _format_bugs(bugs: List[Bug]) -> List[str]:
-    """Format bug reports as markdown"""
-    lines = []
 
+def _write_bugs(buf: io.StringIO, bugs: List[Bug]) -> None:
+    """Write bug reports as markdown"""
     for i, bug in enumerate(bugs, 1):
-        lines.append(f"## Bug {i}: {bug.summary}\n")
-        lines.append(f"**Description**: {bug.description}\n")
-        lines.append(f"**Severity**: {bug.severity} | **Priority**: {bug.priority}\n")
+        buf.write(
+            f"## Bug {i}: {bug.summary}\n\n"
+            f"**Description**: {bug.description}\n\n"
+            f"**Severity**: {bug.severity} | **Priority**: {bug.priority}\n\n"
+        )
 
         # Reproduction Steps
         if bug.reproduction_steps:
-            lines.append("\n**Reproduction Steps**:")
+            buf.write("\n**Reproduction Steps**:\n")
             for j, step in enumerate(bug.reproduction_steps, 1):
-                lines.append(f"{j}. {step}")
-            lines.append("")
+                buf.write(f"{j}. {step}\n")
+            buf.write("\n")
 
         # Environment
         if bug.environment:
-            lines.append("**Environment**:")
-            env = bug.environment
-            if env.browser:
-                lines.append(f"- Browser: {env.browser}")
-            if env.os:
-                lines.append(f"- OS: {env.os}")
-            if env.device:
-                lines.append(f"- Device: {env.device}")
-            if env.user_role:
-                lines.append(f"- User Role: {env.user_role}")
-            if env.data_conditions:
-                lines.append(f"- Data Conditions: {env.data_conditions}")
-            lines.append("")
+            buf.write("**Environment**:\n")
+            _write_attrs(buf, bug.environment, _ENV_FIELDS)
+            buf.write("\n")
 
         # Technical Details
         if bug.technical_details:
-            lines.append("**Technical Details**:")
-            tech = bug.technical_details
-            if tech.error_message:
-                lines.append(f"- Error: {tech.error_message}")
-            if tech.console_logs:
-                lines.append(f"- Console: {tech.console_logs}")
-            if tech.affected_code:
-                lines.append(f"- Code: {tech.affected_code}")
-            if tech.api_calls:
-                lines.append(f"- API: {tech.api_calls}")
-            if tech.stack_trace:
-                lines.append(f"- Stack Trace: {tech.stack_trace}")
-            lines.append("")
+            buf.write("**Technical Details**:\n")
+            _write_attrs(buf, bug.technical_details, _TECH_FIELDS)
+            buf.write("\n")
 
         # Fix Verification Criteria
         if bug.acceptance_criteria:
-            lines.append("**Fix Verification Criteria**:")
-            for ac in bug.acceptance_criteria:
-                lines.append(f"- {ac}")
-            lines.append("")
+            _write_bullets(buf, 'Fix Verification Criteria', bug.acceptance_criteria)
 
         # Suggested Fix
         if bug.suggested_fix:
-            lines.append(f"**Suggested Fix**: {bug.suggested_fix}\n")
+            buf.write(f"**Suggested Fix**: {bug.suggested_fix}\n\n")
 
-        lines.append("---\n")
+        buf.write("---\n\n")
 
-    return lines
-
-
-def _format_stories(stories: List[UserStory]) -> List[str]:
-    """Format user stories as markdown"""
-    lines = []
 
+def _write_stories(buf: io.StringIO, stories: List[UserStory]) -> None:
+    """Write user stories as markdown"""
     for i, story in enumerate(stories, 1):
-        lines.append(f"## Story {i}: {story.title}\n")
-
-        # User Story Format
-        lines.append("**User Story**:")
-        lines.append(f"- **As a**: {story.as_a}")
-        lines.append(f"- **I want to**: {story.i_want_to}")
-        lines.append(f"- **So that**: {story.so_that}\n")
-
-        lines.append(f"**Priority**: {story.priority}")
+        # Heading, User Story Format and priority
+        buf.write(
+            f"## Story {i}: {story.title}\n\n"
+            "**User Story**:\n"
+            f"- **As a**: {story.as_a}\n"
+            f"- **I want to**: {story.i_want_to}\n"
+            f"- **So that**: {story.so_that}\n\n"
+            f"**Priority**: {story.priority}"
+        )
         if story.estimated_effort:
-            lines.append(f" | **Effort**: {story.estimated_effort}")
-        lines.append("\n")
+            buf.write(f" | **Effort**: {story.estimated_effort}")
+        buf.write("\n\n\n")
 
         # Acceptance Criteria
         if story.acceptance_criteria:
-            lines.append("**Acceptance Criteria**:")
-            for ac in story.acceptance_criteria:
-                lines.append(f"- {ac}")
-            lines.append("")
+            _write_bullets(buf, 'Acceptance Criteria', story.acceptance_criteria)
 
         # Technical Notes
         if story.technical_notes:
-            lines.append(f"**Technical Notes**: {story.technical_notes}\n")
-
-        lines.append("---\n")
+            buf.write(f"**Technical Notes**: {story.technical_notes}\n\n")
 
-    return lines
+        buf.write("---\n\n")
 
 
 def read_markdown(markdown_path: Path) -> str:
     """
     Read markdown file and return content
 
+    Files over MMAP_THRESHOLD bytes are decoded straight from a memory map,
+    so the raw bytes are never copied into a separate buffer first.
+
     Args:
         markdown_path: Path to markdown file
 
     Returns:
-        Markdown content as string
+        Markdown content as string, with newlines normalized to '\\n'
     """
-    return markdown_path.read_text(encoding='utf-8')
+    if markdown_path.stat().st_size <= MMAP_THRESHOLD:
+        return markdown_path.read_text(encoding='utf-8')
 
+    with open(markdown_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, 'utf-8')
+    # Match read_text()'s universal newline handling
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
 
-def list_markdown_files(directory: Path = Path('.')) -> List[Path]:
+
+def list_markdown_files(directory: Path = MARKDOWN_DIR, limit: Optional[int] = None) -> List[os.DirEntry]:
     """
     List all markdown files in directory
 
     Args:
         directory: Directory to search (default: current directory)
+        limit: Only return the newest limit files (default: all)
 
     Returns:
-        List of markdown file paths, sorted by modification time (newest first)
+        List of os.DirEntry objects (use .name, .path, .stat()), sorted by
+        modification time (newest first). DirEntry caches its stat result,
+        so callers reading size/mtime do not pay another syscall.
     """
-    md_files = list(directory.glob('jira_tickets_*.md'))
+    with os.scandir(directory) as entries:
+        md_files = [
+            entry for entry in entries
+            if entry.name.startswith('jira_tickets_') and entry.name.endswith('.md') and entry.is_file()
+        ]
+    if limit is not None:
+        # Partial selection instead of sorting every file
+        return heapq.nlargest(limit, md_files, key=_mtime)
     # Sort by modification time, newest first
-    md_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    md_files.sort(key=_mtime, reverse=True)
     return md_files
 
 
+def _mtime(entry: os.DirEntry) -> float:
+    """Modification time from the DirEntry's cached stat"""
+    return entry.stat().st_mtime
+
+
 def generate_filename(project_key: str, issue_type: str = 'task') -> str:
     """
     Generate timestamped filename for markdown output
@@ -220,5 +271,5 @@ def generate_filename(project_key: str, issue_type: str = 'task') -> str:
     Returns:
         Filename string
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     return f"jira_tickets_{project_key}_{issue_type}_{timestamp}.md"
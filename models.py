@@ -8,7 +8,7 @@ Supports multiple issue types:
 - epic-only: High-level Epics without sub-tasks
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal
 
 # Type definitions
@@ -24,6 +24,9 @@ EffortSize = Literal['Small', 'Medium', 'Large']
 
 class Task(BaseModel):
     """Individual task (sub-task of Epic)"""
+    # Tickets are never modified once built (TicketStructure swaps whole lists)
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., min_length=5, max_length=200)
     description: str
     acceptance_criteria: List[str] = Field(default_factory=list)
@@ -34,6 +37,8 @@ class Task(BaseModel):
 
 class Epic(BaseModel):
     """Epic (high-level feature/initiative)"""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., min_length=5, max_length=200)
     description: str
     business_value: Optional[str] = None
@@ -47,6 +52,8 @@ class Epic(BaseModel):
 
 class Environment(BaseModel):
     """Environment where bug occurs"""
+    model_config = ConfigDict(frozen=True)
+
     browser: Optional[str] = None
     os: Optional[str] = None
     device: Optional[str] = None
@@ -57,6 +64,8 @@ class Environment(BaseModel):
 
 class TechnicalDetails(BaseModel):
     """Technical details about the bug"""
+    model_config = ConfigDict(frozen=True)
+
     error_message: Optional[str] = None
     stack_trace: Optional[str] = None
     console_logs: Optional[str] = None
@@ -67,6 +76,8 @@ class TechnicalDetails(BaseModel):
 
 class Bug(BaseModel):
     """Bug/Problem report"""
+    model_config = ConfigDict(frozen=True)
+
     summary: str = Field(..., min_length=10, max_length=200)
     description: str = Field(..., min_length=20)
     severity: Severity = 'Medium'
@@ -84,6 +95,8 @@ class Bug(BaseModel):
 
 class UserStory(BaseModel):
     """Agile user story"""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., min_length=10, max_length=200)
     as_a: str = Field(..., min_length=5)  # Role/persona
     i_want_to: str = Field(..., min_length=10)  # Action/feature
@@ -94,6 +107,25 @@ class UserStory(BaseModel):
     technical_notes: Optional[str] = None
 
 
+# ═══════════════════════════════════════════════════════
+# LLM RESPONSE PAYLOADS (validated straight from JSON)
+# ═══════════════════════════════════════════════════════
+
+class EpicsResponse(BaseModel):
+    """Extraction payload for task/epic-only issue types"""
+    epics: List[Epic] = Field(default_factory=list)
+
+
+class BugsResponse(BaseModel):
+    """Extraction payload for bug issue type"""
+    bugs: List[Bug] = Field(default_factory=list)
+
+
+class StoriesResponse(BaseModel):
+    """Extraction payload for story issue type"""
+    stories: List[UserStory] = Field(default_factory=list)
+
+
 # ═══════════════════════════════════════════════════════
 # UNIFIED CONTAINER
 # ═══════════════════════════════════════════════════════
@@ -114,3 +146,17 @@ class TicketStructure(BaseModel):
         """Count total number of tickets"""
         epic_tasks = sum(len(epic.tasks) for epic in self.epics)
         return len(self.epics) + epic_tasks + len(self.bugs) + len(self.stories)
+
+    def counts(self) -> dict:
+        """Count tickets by kind, plus the total, in a single pass over epics"""
+        epics = len(self.epics)
+        tasks = sum(len(epic.tasks) for epic in self.epics)
+        bugs = len(self.bugs)
+        stories = len(self.stories)
+        return {
+            'total_items': epics + tasks + bugs + stories,
+            'epics': epics,
+            'tasks': tasks,
+            'bugs': bugs,
+            'stories': stories
+        }
@@ -38,7 +38,7 @@ fi
 
 # Install Python dependencies if needed
 echo -e "${BLUE}→${NC} Checking Python dependencies..."
-if ! python -c "import flask, dotenv" 2>/dev/null; then
+if ! python -c "import flask, dotenv, gunicorn, flask_compress" 2>/dev/null; then
     echo -e "${YELLOW}!${NC} Installing Python dependencies..."
     # Check if uv is available (faster package manager)
     if command -v uv &> /dev/null; then
@@ -103,10 +103,15 @@ echo -e "${GREEN}║   Starting Servers...                     ║${NC}"
 echo -e "${GREEN}╚════════════════════════════════════════════╝${NC}"
 echo ""
 
-# Start Flask backend in background
+# Start Flask backend in background: Gunicorn with auto-reload by default,
+# or Flask's debug server with USE_FLASK_DEV_SERVER=1
 echo -e "${BLUE}→${NC} Starting Flask backend on http://localhost:5010"
-export FLASK_ENV=development
-python app.py > flask.log 2>&1 &
+if [ "${USE_FLASK_DEV_SERVER:-0}" = "1" ]; then
+    export FLASK_ENV=development
+    python app.py > flask.log 2>&1 &
+else
+    WEB_CONCURRENCY=${WEB_CONCURRENCY:-2} gunicorn -c gunicorn_conf.py --reload app:app > flask.log 2>&1 &
+fi
 FLASK_PID=$!
 echo $FLASK_PID > flask.pid
 sleep 2
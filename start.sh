@@ -47,9 +47,10 @@ if [ -f "requirements.txt" ]; then
     MISSING_DEPS=0
 
     while IFS= read -r package; do
-        # Extract package name (before >=)
-        pkg_name=$(echo "$package" | cut -d'>' -f1 | cut -d'=' -f1)
-        if ! grep -q "^${pkg_name}==" /tmp/installed_packages.txt; then
+        # Extract package name (before >= and any [extras])
+        pkg_name=$(echo "$package" | cut -d'>' -f1 | cut -d'=' -f1 | cut -d'[' -f1)
+        # pip freeze keeps the project's own capitalization (e.g. Flask)
+        if ! grep -qi "^${pkg_name}==" /tmp/installed_packages.txt; then
             MISSING_DEPS=1
             break
         fi
@@ -124,6 +125,9 @@ echo ""
 echo -e "  ${YELLOW}5. Validate configuration:${NC}"
 echo "     python3 jira_gen.py validate"
 echo ""
+echo -e "  ${YELLOW}6. Serve the web UI + API (production):${NC}"
+echo "     gunicorn -c gunicorn_conf.py app:app"
+echo ""
 echo -e "${BLUE}Tip:${NC} Use ${YELLOW}./status.sh${NC} to check system health anytime"
 echo ""
 echo -e "${GREEN}Happy ticket generating! 🎉${NC}"
@@ -83,7 +83,7 @@ try:
     print(f"   URL: {client.jira_url}")
 
     print(f"\nCalling test_connection()...")
-    if client.test_connection():
+    if client.test_connection(max_age=0):
         print("✅ ✅ ✅ CONNECTION SUCCESSFUL! ✅ ✅ ✅")
         print("\nYour Jira credentials are working correctly.")
         print("If upload is still failing, check:")
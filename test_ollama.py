@@ -2,134 +2,418 @@
 """
 Quick test script for Ollama integration
 Tests if Ollama is accessible and can generate responses
+
+One /api/tags request both proves the server is up and lists its models.
+The chat and extraction checks run concurrently and share one cold model
+load. Every request goes through one httpx keep-alive pool.
+
+By default the OpenAI-compatible chat check is skipped when a live
+extraction already went through the same endpoint; pass --full to run
+both inference checks.
 """
 
+import argparse
+import asyncio
+import importlib
+import importlib.util
 import os
+import re
 import sys
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Load environment
 load_dotenv()
 
-print("=" * 60)
-print("OLLAMA INTEGRATION TEST")
-print("=" * 60)
-
 # Check configuration
 ollama_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
 ollama_model = os.getenv('OLLAMA_MODEL', 'llama3:8b')
 
-print(f"\nConfiguration:")
-print(f"  OLLAMA_BASE_URL: {ollama_url}")
-print(f"  OLLAMA_MODEL: {ollama_model}")
-
-# Test Ollama server
-print(f"\n1. Testing Ollama server...")
-try:
-    import requests
-    response = requests.get(f"{ollama_url}/api/version", timeout=5)
-    if response.status_code == 200:
-        print(f"✅ Ollama server is running")
-        print(f"   Version: {response.json().get('version', 'unknown')}")
-    else:
-        print(f"❌ Ollama server returned status {response.status_code}")
-        sys.exit(1)
-except Exception as e:
-    print(f"❌ Cannot connect to Ollama server: {e}")
-    print(f"\n   Make sure Ollama is installed and running:")
-    print(f"   - Install: curl -fsSL https://ollama.com/install.sh | sh")
-    print(f"   - Start: ollama serve")
-    sys.exit(1)
+TEST_PROMPT = "Say 'Hello from Ollama!' in exactly those words."
+TEST_TEXT = "Create a login page with email and password fields"
 
-# Check if model is available
-print(f"\n2. Checking if model '{ollama_model}' is available...")
-try:
-    response = requests.get(f"{ollama_url}/api/tags", timeout=5)
-    models = [model['name'] for model in response.json().get('models', [])]
+# Per-check time budgets in seconds; inference budgets include a cold model load.
+# 'connect' bounds the TCP connect of native API calls, so a host that drops
+# packets fails as fast as a refused connection instead of using up 'api'.
+TIMEOUTS = {'connect': 0.5, 'api': 5, 'load': 120, 'chat': 60, 'extract': 120}
 
-    if ollama_model in models or f"{ollama_model}:latest" in models:
-        print(f"✅ Model '{ollama_model}' is available")
-    else:
-        print(f"❌ Model '{ollama_model}' not found")
-        print(f"\n   Available models: {', '.join(models) if models else 'None'}")
-        print(f"\n   Download the model:")
-        print(f"   ollama pull {ollama_model}")
-        sys.exit(1)
-except Exception as e:
-    print(f"❌ Error checking models: {e}")
+# Inference checks in flight at once (Ollama loads models one at a time)
+MAX_PARALLEL = int(os.getenv('OLLAMA_MAX_PARALLEL', '2'))
+
+# Imported only once the server checks pass; see _import_inference_modules
+INFERENCE_MODULES = ('openai', 'config', 'agents.extraction_agent', 'agents.llm_cache')
+
+# Extraction check results, reused across runs (see check_extraction)
+EXTRACTION_CACHE_DIR = Path.home() / '.cache' / 'jira_gen' / 'ollama_test'
+
+# Names that satisfy OLLAMA_MODEL: Ollama lists an untagged pull as "<name>:latest"
+model_aliases = frozenset({ollama_model, f"{ollama_model}:latest"})
+
+# Any tag of the same base model (llama3:8b, llama3:70b-q4_K_M, ...); only
+# suggested when OLLAMA_MODEL itself is missing, since Ollama resolves an
+# untagged name to ":latest" and not to whichever tag happens to be pulled
+model_variant_re = re.compile(rf"{re.escape(ollama_model.partition(':')[0])}:[\w.-]+")
+
+# /api/tags model names by base URL
+_models_by_url: dict = {}
+
+
+def _fail(message: str, error: BaseException = None) -> None:
+    """Print a failed check (with its traceback, if any) and exit"""
+    print(f"❌ {message}")
+    if error is not None:
+        traceback.print_exception(error)
     sys.exit(1)
 
-# Test with OpenAI-compatible API
-print(f"\n3. Testing OpenAI-compatible API...")
-try:
-    from openai import OpenAI
 
-    client = OpenAI(
-        base_url=ollama_url + '/v1',
-        api_key='ollama'
+async def _get_json(http: httpx.AsyncClient, path: str) -> dict:
+    """GET an Ollama API endpoint and decode the JSON body"""
+    response = await http.get(path)
+    if response.status_code != 200:
+        raise RuntimeError(f"Ollama server returned status {response.status_code}")
+    return orjson.loads(response.content)
+
+
+async def list_models(http: httpx.AsyncClient) -> frozenset:
+    """
+    Names of the models the Ollama server has pulled
+
+    A successful /api/tags response also proves the server is up, so no
+    separate liveness probe is made. The result is memoized per base URL.
+
+    Args:
+        http: Shared HTTP client
+
+    Returns:
+        Frozen set of model names, e.g. {'llama3:8b'}
+    """
+    models = _models_by_url.get(ollama_url)
+    if models is None:
+        tags = await _get_json(http, '/api/tags')
+        models = frozenset(model['name'] for model in tags.get('models', []))
+        _models_by_url[ollama_url] = models
+    return models
+
+
+async def _bounded(limit: asyncio.BoundedSemaphore, check, timeout: float):
+    """Run a check coroutine under the concurrency limit and a time budget"""
+    async with limit:
+        try:
+            return await asyncio.wait_for(check, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No result within {timeout:g}s") from None
+
+
+def _import_inference_modules() -> None:
+    """Import the OpenAI SDK and the extraction agent (about a second cold)"""
+    for name in INFERENCE_MODULES:
+        importlib.import_module(name)
+
+
+async def load_model(http: httpx.AsyncClient) -> None:
+    """
+    Ask Ollama to load the model and keep it resident
+
+    A generate request without a prompt only loads the model, so the first
+    real inference does not pay the cold-start load.
+
+    Args:
+        http: Shared HTTP client
+    """
+    response = await http.post(
+        '/api/generate',
+        content=orjson.dumps({'model': ollama_model, 'keep_alive': '10m'}),
+        headers={'Content-Type': 'application/json'},
+        timeout=TIMEOUTS['load']
     )
+    response.raise_for_status()
+
+
+async def check_chat(http: httpx.AsyncClient) -> str:
+    """
+    Send a test prompt through the OpenAI-compatible API
+
+    The reply is streamed and the stream closed at the first token: that
+    proves the endpoint works, and frees the model for the extraction
+    check instead of decoding the rest of the reply.
+
+    Args:
+        http: Shared HTTP client (closed by main(), not by the OpenAI client)
 
-    print(f"   Sending test prompt...")
-    response = client.chat.completions.create(
+    Returns:
+        The first streamed text of the reply
+    """
+    from openai import AsyncOpenAI
+
+    # The SDK would otherwise adopt the shared client's short API timeout
+    client = AsyncOpenAI(
+        base_url=ollama_url + '/v1', api_key='ollama', http_client=http, timeout=TIMEOUTS['chat']
+    )
+    stream = await client.chat.completions.create(
         model=ollama_model,
         messages=[
             {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "Say 'Hello from Ollama!' in exactly those words."}
+            {"role": "user", "content": TEST_PROMPT}
         ],
-        temperature=0.3,
-        max_tokens=50
+        # Greedy and capped: the reply to TEST_PROMPT ends at its "!"
+        temperature=0,
+        max_tokens=16,
+        stop=["!"],
+        stream=True
     )
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                return chunk.choices[0].delta.content.strip()
+    finally:
+        await stream.close()
+    raise RuntimeError("Stream ended without any content")
 
-    answer = response.choices[0].message.content.strip()
-    print(f"✅ Got response from Ollama!")
-    print(f"   Response: {answer}")
 
-except Exception as e:
-    print(f"❌ Error testing API: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+async def check_extraction(http: httpx.AsyncClient) -> tuple:
+    """
+    Extract tickets from a test input with the extraction agent
 
-# Test with actual JIRA ticket extraction
-print(f"\n4. Testing JIRA ticket extraction with Ollama...")
-try:
+    The input never changes, so the result is kept in an on-disk cache
+    keyed by model and input; set OLLAMA_TEST_CACHE=0 to force a fresh
+    extraction. Only results of a successful LLM call are stored, so a
+    fallback extraction can never be replayed as a pass. Live inference
+    is still covered by the chat check.
+
+    Args:
+        http: Shared HTTP client (closed by main(), not by the LLM client)
+
+    Returns:
+        (TicketStructure, whether it came from the cache)
+    """
     from config import config
-    from agents.extraction_agent import ExtractionAgent
+    from models import TicketStructure
+    from agents.extraction_agent import ExtractionAgent, EXTRACTION_TEMPERATURE
+    from agents.llm_cache import LLMCache, FileBackend
 
-    # Temporarily set provider to ollama
-    original_provider = config.llm_provider
-    config.llm_provider = 'ollama'
+    cache = LLMCache(FileBackend(EXTRACTION_CACHE_DIR))
+    key = LLMCache.key({
+        'base_url': ollama_url,
+        'model': ollama_model,
+        'issue_type': 'task',
+        'temperature': EXTRACTION_TEMPERATURE,
+        'text': TEST_TEXT
+    })
+    if os.getenv('OLLAMA_TEST_CACHE', '1') != '0':
+        cached = cache.get(key)
+        if cached is not None:
+            return TicketStructure.model_validate_json(cached), True
 
-    llm_client = config.get_llm_client()
-    agent = ExtractionAgent(llm_client, issue_type='task')
+    # The agent reads the provider from the shared config; the override is
+    # undone even if extraction fails or times out.
+    # An async client keeps the call on the event loop, so a timeout in
+    # _bounded() cancels the request instead of abandoning a worker thread
+    with config.override(llm_provider='ollama'):
+        # No fallback: a failed LLM call must fail the check, not pass it
+        # with the rule-based extraction
+        # The SDK would otherwise adopt the shared client's short API timeout,
+        # too short for a cold model load
+        llm_client = config.get_async_llm_client(http_client=http).with_options(timeout=TIMEOUTS['extract'])
+        agent = ExtractionAgent(llm_client, issue_type='task', fallback=False)
+        result = await agent.aextract(TEST_TEXT, "TEST")
+        # Reached only when the LLM answered: with fallback disabled, a
+        # failed call or parse raises above and nothing is cached
+        cache.set(key, result.model_dump_json())
+    return result, False
 
-    test_text = "Create a login page with email and password fields"
-    print(f"   Test input: '{test_text}'")
 
-    result = agent.extract(test_text, "TEST")
+def _report_chat(answer: str) -> None:
+    print(f"✅ Got response from Ollama!")
+    print(f"   First tokens: {answer}")
 
-    print(f"✅ Successfully extracted tickets!")
+
+def _report_extraction(extraction: tuple) -> None:
+    result, cached = extraction
+    print(f"✅ Successfully extracted tickets!{' (cached; OLLAMA_TEST_CACHE=0 to rerun)' if cached else ''}")
     print(f"   Epics: {len(result.epics)}")
     print(f"   Tasks: {sum(len(epic.tasks) for epic in result.epics)}")
     print(f"   Bugs: {len(result.bugs)}")
     print(f"   Stories: {len(result.stories)}")
 
-    # Restore original provider
-    config.llm_provider = original_provider
 
-except Exception as e:
-    print(f"❌ Error testing extraction: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+@dataclass(frozen=True)
+class Stage:
+    """An inference check: how to run it and how to report its result"""
+    number: int
+    title: str
+    check: Callable[[httpx.AsyncClient], Awaitable]
+    timeout: float
+    report: Callable[[object], None]
+    error: str
+    detail: str = ''
+
+
+CHAT_STAGE = Stage(
+    3, "Testing OpenAI-compatible API", check_chat, TIMEOUTS['chat'],
+    _report_chat, "Error testing API"
+)
+EXTRACT_STAGE = Stage(
+    4, "Testing JIRA ticket extraction with Ollama", check_extraction, TIMEOUTS['extract'],
+    _report_extraction, "Error testing extraction", detail=f"Test input: '{TEST_TEXT}'"
+)
+STAGES = (CHAT_STAGE, EXTRACT_STAGE)
+
+
+async def run_stage(stage: Stage, http: httpx.AsyncClient, limit: asyncio.BoundedSemaphore) -> tuple:
+    """
+    Run one stage under the concurrency limit and its time budget
+
+    Args:
+        stage: Stage to run
+        http: Shared HTTP client
+        limit: Semaphore shared by all inference stages
+
+    Returns:
+        (result or the exception raised, elapsed seconds)
+    """
+    start = time.perf_counter()
+    try:
+        result = await _bounded(limit, stage.check(http), stage.timeout)
+    except Exception as e:
+        result = e
+    return result, time.perf_counter() - start
+
+
+def report_stage(stage: Stage, outcome: Optional[tuple]) -> None:
+    """Print a stage's result (None if it was skipped), exiting if it failed"""
+    print(f"\n{stage.number}. {stage.title}...")
+    if stage.detail:
+        print(f"   {stage.detail}")
+    if outcome is None:
+        print(f"⏭️  Skipped: covered by the extraction check (--full to run it)")
+        return
+    result, elapsed = outcome
+    if isinstance(result, Exception):
+        _fail(f"{stage.error}: {result}", result)
+    stage.report(result)
+    print(f"   Time: {elapsed:.2f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line"""
+    parser = argparse.ArgumentParser(description="Check that Ollama works with the JIRA ticket generator")
+    parser.add_argument(
+        '--full', action='store_true',
+        help="also run the OpenAI-compatible chat check when extraction already covered it"
+    )
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+
+    # One keep-alive pool for the native API calls and both OpenAI-compatible
+    # clients. Ollama serves plain HTTP/1.1 (no h2c), so concurrent requests
+    # each take a pooled connection rather than sharing one.
+    async with httpx.AsyncClient(
+        base_url=ollama_url,
+        timeout=httpx.Timeout(TIMEOUTS['api'], connect=TIMEOUTS['connect']),
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+    ) as http:
+        await run_checks(http, full=args.full)
+
+
+async def run_checks(http: httpx.AsyncClient, full: bool = False) -> None:
+    """
+    Run the checks, exiting on the first failure
+
+    Args:
+        http: Shared HTTP client
+        full: Run the chat check even when a live extraction covered it
+    """
+    print("=" * 60)
+    print("OLLAMA INTEGRATION TEST")
+    print("=" * 60)
+
+    print(f"\nConfiguration:")
+    print(f"  OLLAMA_BASE_URL: {ollama_url}")
+    print(f"  OLLAMA_MODEL: {ollama_model}")
+
+    # Server and model checks: one /api/tags request covers both
+    print(f"\n1. Testing Ollama server...")
+    try:
+        models = await list_models(http)
+    except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+        print(f"❌ Cannot connect to Ollama server: {e}")
+        print(f"\n   Make sure Ollama is installed and running:")
+        print(f"   - Install: curl -fsSL https://ollama.com/install.sh | sh")
+        print(f"   - Start: ollama serve")
+        sys.exit(1)
+    except Exception as e:
+        _fail(f"Error checking models: {e}")
+    print(f"✅ Ollama server is running")
+    print(f"   Models pulled: {len(models)}")
+
+    print(f"\n2. Checking if model '{ollama_model}' is available...")
+    if models & model_aliases:
+        print(f"✅ Model '{ollama_model}' is available")
+    else:
+        print(f"❌ Model '{ollama_model}' not found")
+        print(f"\n   Available models: {', '.join(sorted(models)) if models else 'None'}")
+        variants = sorted(filter(model_variant_re.fullmatch, models))
+        if variants:
+            print(f"\n   Other tags of this model are pulled: {', '.join(variants)}")
+            print(f"   Set OLLAMA_MODEL to one of them, or download the model:")
+        else:
+            print(f"\n   Download the model:")
+        print(f"   ollama pull {ollama_model}")
+        sys.exit(1)
+
+    # Fail fast, without importing it, if the SDK both checks need is missing
+    if importlib.util.find_spec('openai') is None:
+        _fail("openai package not installed. Run: pip install openai")
+
+    # Start loading the model into memory now; importing the inference
+    # modules in a worker thread meanwhile keeps the event loop free to send
+    # the request
+    warm_up = asyncio.create_task(load_model(http))
+    await asyncio.to_thread(_import_inference_modules)
+
+    # Inference checks. Extraction goes through the same /v1 endpoint as the
+    # chat check and runs without the rule-based fallback, so a fresh
+    # extraction proves a live LLM call and makes the chat call redundant;
+    # a cached extraction (no live inference at all) still needs it, and a
+    # failed one runs it to show whether the endpoint itself works.
+    limit = asyncio.BoundedSemaphore(MAX_PARALLEL)
+    if full:
+        print(f"\nRunning inference checks 3 and 4 concurrently...")
+        outcomes = dict(zip(STAGES, await asyncio.gather(
+            *(run_stage(stage, http, limit) for stage in STAGES)
+        )))
+    else:
+        outcomes = {EXTRACT_STAGE: await run_stage(EXTRACT_STAGE, http, limit)}
+        extraction = outcomes[EXTRACT_STAGE][0]
+        if not isinstance(extraction, tuple) or extraction[1]:
+            outcomes[CHAT_STAGE] = await run_stage(CHAT_STAGE, http, limit)
+
+    # A failed warm-up only costs time; the checks report the real error
+    await asyncio.gather(warm_up, return_exceptions=True)
+
+    for stage in STAGES:
+        report_stage(stage, outcomes.get(stage))
+
+    print(f"\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED!")
+    print("=" * 60)
+    print(f"\nOllama is working correctly! You can now use it by setting:")
+    print(f"  LLM_PROVIDER=ollama")
+    print(f"  OLLAMA_MODEL={ollama_model}")
+    print(f"\nTo switch providers, just change LLM_PROVIDER in .env to:")
+    print(f"  - 'openai' for OpenAI GPT-4")
+    print(f"  - 'anthropic' for Claude")
+    print(f"  - 'ollama' for local Llama 3")
+
 
-print(f"\n" + "=" * 60)
-print("✅ ALL TESTS PASSED!")
-print("=" * 60)
-print(f"\nOllama is working correctly! You can now use it by setting:")
-print(f"  LLM_PROVIDER=ollama")
-print(f"  OLLAMA_MODEL={ollama_model}")
-print(f"\nTo switch providers, just change LLM_PROVIDER in .env to:")
-print(f"  - 'openai' for OpenAI GPT-4")
-print(f"  - 'anthropic' for Claude")
-print(f"  - 'ollama' for local Llama 3")
+if __name__ == '__main__':
+    asyncio.run(main())